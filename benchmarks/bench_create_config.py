@@ -0,0 +1,36 @@
+"""
+Measure repeated create_config calls with injected values, which reuse
+the parts of each option's text prepared by the first call.
+
+Run with: python benchmarks/bench_create_config.py
+"""
+import time
+
+from synthetic import make_schema, make_values
+
+OPTIONS = 5_000
+CALLS = 50
+
+
+def main():
+    config = make_schema(OPTIONS, type_hint=True)
+    values = make_values(OPTIONS)
+
+    # Adding a type changes the schema, so the next render starts from scratch
+    config.add_type(type="Unused", validate=bool, cast=str, error="")
+    start = time.perf_counter()
+    first = config.create_config(values)
+    first_call = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(CALLS):
+        assert config.create_config(values) == first
+    repeated_calls = (time.perf_counter() - start) / CALLS
+
+    print(f"{OPTIONS} options")
+    print(f"  first call:    {first_call * 1000:8.2f} ms")
+    print(f"  repeated call: {repeated_calls * 1000:8.2f} ms ({first_call / repeated_calls:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Measure the startup of a short-lived process that loads a big config
+file, without the disk cache, with an empty one (cold) and with the
+entry written by a previous run (warm).
+
+Each run is a new process: the time of parse_and_validate_file is
+measured inside it, and the time of the whole process outside.
+
+Run with: python benchmarks/bench_disk_cache.py
+"""
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+from synthetic import make_file, make_schema
+
+OPTIONS = 10_000
+REPEAT = 5
+
+CHILD = """
+import sys, time
+from synthetic import make_schema
+config = make_schema({options})
+start = time.perf_counter()
+validated, errors = config.parse_and_validate_file(sys.argv[1], disk_cache=sys.argv[2] if len(sys.argv) > 2 else False)
+elapsed = time.perf_counter() - start
+assert len(validated) == {options} and not errors
+print(elapsed)
+"""
+
+
+def run(*arguments: str) -> tuple:
+    """
+    Run a process loading the file, and return the time it took to
+    load it and the time of the whole process.
+    """
+    code = CHILD.format(options=OPTIONS)
+    environment = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    start = time.perf_counter()
+    output = subprocess.run(
+        [sys.executable, "-c", code, *arguments],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=environment,
+        cwd=os.path.dirname(os.path.abspath(__file__)),
+    ).stdout
+    return float(output), time.perf_counter() - start
+
+
+def main():
+    directory = tempfile.mkdtemp()
+    try:
+        path = os.path.join(directory, "config.txt")
+        with open(path, "w") as file:
+            file.write(make_file(make_schema(OPTIONS), OPTIONS))
+        cache = os.path.join(directory, "cache")
+
+        results = {"no cache": [], "cold": [], "warm": []}
+        for _ in range(REPEAT):
+            results["no cache"].append(run(path))
+            shutil.rmtree(cache, ignore_errors=True)
+            results["cold"].append(run(path, cache))
+            results["warm"].append(run(path, cache))
+
+        print(f"{OPTIONS} options, {os.path.getsize(path) / 1024:.0f} KiB file, best of {REPEAT} processes")
+        print(f"{'':10} {'loading':>10} {'process':>10}")
+        for name, times in results.items():
+            loading = min(time for time, _ in times)
+            process = min(time for _, time in times)
+            print(f"{name:10} {loading * 1000:8.1f}ms {process * 1000:8.1f}ms")
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""
+Compare parsing a badly corrupted file with parse_config (every broken
+line is kept) and with parse_config_records, keeping all the records
+or at most MAX_ERRORS of them, and stopping at MAX_ERRORS: time and
+peak memory (tracemalloc).
+
+Run with: python benchmarks/bench_error_records.py
+"""
+import time
+import tracemalloc
+
+from synthetic import make_file, make_schema
+
+OPTIONS = 100_000
+CORRUPTION_RATE = 0.9
+MAX_ERRORS = 100
+
+
+def measure(function) -> tuple:
+    """
+    Return the time of a call of function, and its peak memory
+    (measured in another call, since tracemalloc slows it down).
+    """
+    start = time.perf_counter()
+    function()
+    elapsed = time.perf_counter() - start
+    tracemalloc.start()
+    function()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak
+
+
+def main():
+    config = make_schema(OPTIONS)
+    file_content = make_file(config, OPTIONS, corruption_rate=CORRUPTION_RATE)
+    lines = file_content.splitlines(keepends=True)
+    _, _, error_count = config.parse_config_records(lines)
+
+    runs = {
+        "parse_config": lambda: config.parse_config(lines),
+        "records": lambda: config.parse_config_records(lines),
+        f"records, max {MAX_ERRORS}": lambda: config.parse_config_records(lines, max_errors=MAX_ERRORS),
+        f"records, stop at {MAX_ERRORS}": lambda: config.parse_config_records(
+            lines, max_errors=MAX_ERRORS, stop_on_max_errors=True
+        ),
+    }
+    print(f"{OPTIONS} options, {error_count} broken lines, lines given as a list")
+    print(f"{'':24} {'time':>10} {'peak memory':>12}")
+    for name, function in runs.items():
+        elapsed, peak = measure(function)
+        print(f"{name:24} {elapsed * 1000:8.1f}ms {peak / 1024:9.0f} KiB")
+
+
+if __name__ == "__main__":
+    main()
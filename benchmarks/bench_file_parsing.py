@@ -0,0 +1,74 @@
+"""
+Compare parse_config_file, which memory-maps the file, with
+parse_config(open(path).read()) on a big generated config file.
+Each method runs in its own process, to measure its peak memory (RSS).
+
+Run with: python benchmarks/bench_file_parsing.py
+"""
+import json
+import os
+import subprocess
+import sys
+import tempfile
+
+OPTIONS = 200_000
+
+MEASURE = """
+import json, resource, sys, time
+from type_config import TypeConfig
+
+path, method = sys.argv[1], sys.argv[2]
+config = TypeConfig()
+start = time.perf_counter()
+if method == "parse_config_file":
+    result = config.parse_config_file(path)
+elif method == "parse_config":
+    result = config.parse_config(open(path, encoding="utf-8").read())
+else:
+    result = ({}, {})
+elapsed = time.perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+    "options": len(result[0]),
+}))
+"""
+
+
+def write_config(path: str):
+    with open(path, "w", encoding="utf-8") as file:
+        for index in range(OPTIONS):
+            file.write(f"[Integer] option {index} = {index} # inline comment\n")
+            file.write("# !!! An important help line, which is never decoded\n")
+            file.write("# A help line, which is never decoded either\n\n")
+
+
+def measure(path: str, method: str) -> dict:
+    output = subprocess.run(
+        [sys.executable, "-c", MEASURE, path, method],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "config.ini")
+        write_config(path)
+        size = os.path.getsize(path) / 1024 / 1024
+        print(f"{OPTIONS} options, {size:.1f} MiB file")
+
+        baseline = measure(path, "nothing")["peak_rss_kb"]
+        for method in ("parse_config", "parse_config_file"):
+            result = measure(path, method)
+            assert result["options"] == OPTIONS
+            print(
+                f"  {method:18}: {result['seconds'] * 1000:8.1f} ms, "
+                f"peak RSS +{(result['peak_rss_kb'] - baseline) / 1024:6.1f} MiB"
+            )
+
+
+if __name__ == "__main__":
+    main()
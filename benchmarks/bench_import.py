@@ -0,0 +1,76 @@
+"""
+Measure how long `from type_config import TypeConfig` takes in a new
+process, with `python -X importtime`, and which modules it imports.
+
+Each import runs in a new process, with the bytecode of the modules
+already compiled (in a temporary cache), like an installed package.
+
+Run with: python benchmarks/bench_import.py
+Exits with 1 if the import takes more than BUDGET_MS, or if one of the
+SLOW_MODULES is imported.
+"""
+import os
+import re
+import subprocess
+import sys
+import tempfile
+
+REPEAT = 20
+BUDGET_MS = 40
+# Only imported when the features needing them are used
+SLOW_MODULES = ("asyncio", "concurrent.futures", "inspect", "difflib", "hashlib", "pickle", "ctypes")
+
+_LINE = re.compile(r"import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)")
+
+
+def import_times(code: str, environment: dict) -> dict:
+    """
+    Return {module: (self microseconds, cumulative microseconds)} of
+    the modules imported by code, at the top level.
+    """
+    output = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=environment,
+    ).stderr
+    times = {}
+    for line in output.splitlines():
+        match = _LINE.match(line)
+        if match:
+            times[match.group(4)] = (int(match.group(1)), int(match.group(2)))
+    return times
+
+
+def main():
+    code = "from type_config import TypeConfig; import sys; print(sorted(sys.modules))"
+    with tempfile.TemporaryDirectory() as cache:
+        environment = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path), "PYTHONPYCACHEPREFIX": cache}
+        environment.pop("PYTHONDONTWRITEBYTECODE", None)
+        # Compile the modules once
+        modules = eval(
+            subprocess.run(
+                [sys.executable, "-c", code], capture_output=True, check=True, text=True, env=environment
+            ).stdout
+        )
+        runs = [import_times(code, environment) for _ in range(REPEAT)]
+
+    best = min(runs, key=lambda times: times["type_config"][1])
+    total = best["type_config"][1] / 1000
+    own = sum(self for module, (self, _) in best.items() if module.startswith("type_config")) / 1000
+    print(f"from type_config import TypeConfig, best of {REPEAT}:")
+    print(f"  {total:.1f}ms (type_config's own modules: {own:.1f}ms, budget: {BUDGET_MS}ms)")
+    print("  slowest modules imported:")
+    slowest = sorted(best.items(), key=lambda item: item[1][0], reverse=True)[:8]
+    for module, (self, _) in slowest:
+        print(f"    {module:30} {self / 1000:6.1f}ms")
+
+    imported = [module for module in SLOW_MODULES if module in modules]
+    if imported:
+        print(f"  imported slow modules: {', '.join(imported)}")
+    sys.exit(1 if total > BUDGET_MS or imported else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Compare loading a big config and reading a few of its options with
+parse_and_validate (everything is validated) and with load_lazy (only
+what is read is validated).
+
+Run with: python benchmarks/bench_lazy.py
+"""
+import time
+
+from synthetic import make_file, make_schema
+
+OPTIONS = 2_000
+READ = (10, 50, 500, OPTIONS)
+REPEAT = 20
+
+
+def best_time(function) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    config = make_schema(OPTIONS)
+    file_content = make_file(config, OPTIONS)
+    options = list(config.get_options())
+
+    def eager(read):
+        validated, _ = config.parse_and_validate(file_content)
+        return [validated[option] for option in options[:read]]
+
+    def lazy(read):
+        loaded = config.load_lazy(file_content)
+        return [loaded[option] for option in options[:read]]
+
+    print(f"{OPTIONS} options, best of {REPEAT}")
+    print(f"{'read':>6} {'eager':>10} {'lazy':>10}")
+    for read in READ:
+        assert eager(read) == lazy(read)
+        eager_time = best_time(lambda: eager(read))
+        lazy_time = best_time(lambda: lazy(read))
+        print(f"{read:6} {eager_time * 1000:8.3f}ms {lazy_time * 1000:8.3f}ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+Measure how the time to parse and validate each line changes with the
+number of options, with exact names and with normalized names and
+aliases (normalize_keys=True), to check that finding an option doesn't
+depend on how many there are.
+
+Run with: python benchmarks/bench_lookup.py
+"""
+import time
+
+from type_config import TypeConfig
+
+SIZES = (100, 1_000, 10_000, 50_000)
+LINES = 1_000
+REPEAT = 20
+
+
+def make_config(options: int, normalize_keys: bool) -> TypeConfig:
+    config = TypeConfig(normalize_keys=normalize_keys)
+    config.add_type(type="Word", parse=str)
+    for index in range(options):
+        aliases = (f"alias_{index}", f"other-alias-{index}") if normalize_keys else ()
+        config.add_option(type="Word", option=f"option {index}", help="", aliases=aliases)
+    return config
+
+
+def best_time(function) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    print(f"time per line, {LINES} lines, best of {REPEAT}")
+    print(f"{'options':>8} {'exact':>10} {'normalized':>12}")
+    for options in SIZES:
+        step = options // LINES or 1
+        names = [f"option {index}" for index in range(0, options, step)][:LINES]
+        exact = "\n".join(f"{name} = value" for name in names)
+        # Every line needs to be normalized or is an alias
+        loose = "\n".join(
+            f"{name.upper().replace(' ', '_')} = value" if index % 2 else f"ALIAS_{name.split()[1]} = value"
+            for index, name in enumerate(names)
+        )
+
+        times = []
+        for normalize_keys, content in ((False, exact), (True, loose)):
+            config = make_config(options, normalize_keys)
+            validated, errors = config.parse_and_validate(content)
+            assert len(validated) == len(names) and not errors
+            times.append(best_time(lambda: config.parse_and_validate(content)) / len(names))
+        print(f"{options:8} {times[0] * 1e6:8.2f}us {times[1] * 1e6:10.2f}us")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,68 @@
+"""
+Compare merging 5 layers of configs (defaults, system file, user file,
+environment variables and command line) with merge_configs and with
+4 chained calls of merge_config.
+
+Run with: python benchmarks/bench_merge.py
+"""
+import random
+import time
+
+from synthetic import make_schema, make_values
+
+OPTIONS = 10_000
+LAYERS = 5
+REPEAT = 10
+
+
+def make_layers(options: int, layers: int, seed: int = 0):
+    """
+    The first layer has every option, the others a shrinking share
+    of them, with some None values (like unset command line arguments).
+    """
+    generator = random.Random(seed)
+    values = make_values(options)
+    result = [dict(values)]
+    for index in range(1, layers):
+        share = 1 / (index + 1)
+        result.append({
+            option: None if generator.random() < 0.2 else value
+            for option, value in values.items()
+            if generator.random() < share
+        })
+    return result
+
+
+def chained(config, layers):
+    merged = layers[0]
+    for layer in layers[1:]:
+        merged = config.merge_config(layer, merged)
+    return merged
+
+
+def best_time(function) -> float:
+    best = float("inf")
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    config = make_schema(OPTIONS)
+    layers = make_layers(OPTIONS, LAYERS)
+    merged, errors = config.merge_configs(*layers)
+    assert merged == chained(config, layers) and not errors
+
+    print(f"{LAYERS} layers, {OPTIONS} options, {sum(map(len, layers))} values, best of {REPEAT}")
+    chained_time = best_time(lambda: chained(config, layers))
+    merged_time = best_time(lambda: config.merge_configs(*layers))
+    provenance_time = best_time(lambda: config.merge_configs(*layers, provenance=True))
+    print(f"  chained merge_config:       {chained_time * 1000:8.2f} ms")
+    print(f"  merge_configs:              {merged_time * 1000:8.2f} ms ({chained_time / merged_time:.1f}x)")
+    print(f"  merge_configs (provenance): {provenance_time * 1000:8.2f} ms")
+
+
+if __name__ == "__main__":
+    main()
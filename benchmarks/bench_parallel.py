@@ -0,0 +1,57 @@
+"""
+Measure how validate_config scales with the number of workers when
+the types' functions are slow (here, they sleep to simulate I/O).
+
+Run with: python benchmarks/bench_parallel.py
+"""
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from type_config import TypeConfig
+
+OPTIONS = 64
+DELAY = 0.005
+WORKERS = (1, 2, 4, 8, 16, 32)
+
+
+def slow_validate(value) -> bool:
+    time.sleep(DELAY)
+    return True
+
+
+def make_config() -> TypeConfig:
+    config = TypeConfig()
+    config.add_type(
+        type="SlowPath",
+        validate=slow_validate,
+        cast=str,
+        error="The path doesn't exist",
+        workload="io",
+    )
+    for index in range(OPTIONS):
+        config.add_option(type="SlowPath", option=f"option {index}", help="A benchmark option")
+    return config
+
+
+def main():
+    config = make_config()
+    values = {f"option {index}": f"/some/path/{index}" for index in range(OPTIONS)}
+    expected = config.validate_config(values)
+
+    start = time.perf_counter()
+    config.validate_config(values)
+    serial = time.perf_counter() - start
+    print(f"{OPTIONS} options, {DELAY * 1000:.0f} ms per validation")
+    print(f"  serial:     {serial * 1000:8.1f} ms")
+
+    for workers in WORKERS:
+        with ThreadPoolExecutor(workers) as executor:
+            start = time.perf_counter()
+            result = config.validate_config(values, executor=executor)
+            elapsed = time.perf_counter() - start
+        assert result == expected
+        print(f"  {workers:2} workers: {elapsed * 1000:8.1f} ms ({serial / elapsed:5.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""
+Check that profiling costs nothing when it's not used: time the public
+methods, which check whether profiling is on, against the same work
+done without the check, and show the cost when profiling is on.
+
+Run with: python benchmarks/bench_profiling.py
+Exits with 1 if a method is more than THRESHOLD slower when profiling is off.
+"""
+import sys
+import time
+
+from synthetic import make_file, make_schema
+
+OPTIONS = 1_000
+REPEAT = 100
+THRESHOLD = 1.05
+
+
+def best_times(functions, repeat):
+    """
+    Best time of each function, timed in turns (in alternating order)
+    so that they are affected the same way by the machine's noise.
+    """
+    best = [float("inf")] * len(functions)
+    order = list(enumerate(functions))
+    for _ in range(repeat):
+        order.reverse()
+        for index, function in order:
+            start = time.perf_counter()
+            function()
+            best[index] = min(best[index], time.perf_counter() - start)
+    return best
+
+
+def main():
+    config = make_schema(OPTIONS)
+    file_content = make_file(config, OPTIONS, comment_density=0.5, inline_comments=0.2)
+    parsed, _ = config.parse_config(file_content)
+
+    methods = {
+        "parse_config": (
+            lambda: config.parse_config(file_content),
+            lambda: config._collect_events(config.parse_config_iter(file_content)),
+        ),
+        "validate_config": (
+            lambda: config.validate_config(parsed),
+            lambda: config._validate_config(parsed, None),
+        ),
+        "heal_config": (
+            lambda: config.heal_config(file_content),
+            lambda: config._format(config._healed_values(file_content)),
+        ),
+    }
+
+    slower = 0
+    print(f"{OPTIONS} options, best of {REPEAT}")
+    print(f"{'method':16} {'unhooked':>10} {'off':>10} {'on':>10} {'off cost':>9}")
+    for method, (public, unhooked) in methods.items():
+        unhooked_time, off_time = best_times([unhooked, public], REPEAT)
+        with config.profile():
+            (on_time,) = best_times([public], REPEAT)
+        ratio = off_time / unhooked_time
+        slower += ratio > THRESHOLD
+        print(
+            f"{method:16} {unhooked_time * 1000:8.3f}ms {off_time * 1000:8.3f}ms "
+            f"{on_time * 1000:8.3f}ms {ratio:8.3f}x"
+        )
+
+    sys.exit(1 if slower else 0)
+
+
+if __name__ == "__main__":
+    main()
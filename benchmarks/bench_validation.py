@@ -0,0 +1,105 @@
+"""
+Compare validate_config, which runs through the compiled validators,
+with validating each value by looking up its option and type.
+
+Run with: python benchmarks/bench_validation.py
+"""
+import timeit
+
+from type_config import TypeConfig
+from type_config.errors import ValidationError
+
+OPTIONS = 1_000
+REPEAT = 40
+NUMBER = 20
+
+
+def make_config() -> TypeConfig:
+    config = TypeConfig()
+    config.add_type(
+        type="Integer",
+        validate=lambda value: value is None or value.isdigit(),
+        cast=lambda value: int(value) if value else None,
+        error="The value must be a positive integer",
+    )
+    for index in range(OPTIONS):
+        config.add_option(
+            type="Integer",
+            option=f"option {index}",
+            help="A benchmark option",
+            default="0" if index % 3 else "",
+            can_be_empty=index % 5 == 0,
+        )
+    return config
+
+
+def validate_option(config: TypeConfig, option: str, value: str) -> object:
+    """
+    Validate a value looking up its option's settings and its type
+    each time, like TypeConfig did before compiling the validators.
+    """
+    option_info = config._options.get(option, None)
+    if not option_info:
+        raise ValidationError(f"[{option}]: is not part of the expected options.")
+    if not value:
+        value = option_info.default if option_info.default else None
+    if not value and not option_info.can_be_empty:
+        raise ValidationError(f"[{option}]: can't be left empty.")
+    type_info = config._options_types.get(option_info.type, None)
+    if not type_info:
+        raise ValidationError(f"[{option_info.type}]: is not part of the expected types.")
+    if type_info.validate(value):
+        return type_info.cast(value)
+    raise ValidationError(f"[{option}]: {type_info.error} (value: {value})")
+
+
+def validate_with_lookups(config: TypeConfig, values: dict) -> tuple:
+    validated = {}
+    errors = {}
+    for option, value in values.items():
+        try:
+            validated[option] = validate_option(config, option, value)
+        except ValidationError as err:
+            errors[option] = str(err)
+    return validated, errors
+
+
+def best_times(first, second) -> tuple:
+    """
+    Time the two functions alternately, so that noise from the machine
+    affects both in the same way, and return their best times.
+    """
+    first_times = []
+    second_times = []
+    for _ in range(REPEAT):
+        first_times.append(timeit.timeit(first, number=NUMBER))
+        second_times.append(timeit.timeit(second, number=NUMBER))
+    return min(first_times), min(second_times)
+
+
+def compare(name: str, config: TypeConfig, values: dict):
+    assert config.validate_config(values) == validate_with_lookups(config, values)
+
+    lookups, compiled = best_times(
+        lambda: validate_with_lookups(config, values),
+        lambda: config.validate_config(values),
+    )
+
+    print(f"{name}: {OPTIONS} options, best of {REPEAT} x {NUMBER} runs")
+    print(f"  lookup per value: {lookups / NUMBER * 1000:8.3f} ms")
+    print(f"  compiled:         {compiled / NUMBER * 1000:8.3f} ms")
+    print(f"  speedup:          {lookups / compiled:8.2f}x")
+
+
+def main():
+    config = make_config()
+    compare("valid values", config, {f"option {index}": str(index) for index in range(OPTIONS)})
+    compare(
+        "half empty values",
+        config,
+        {f"option {index}": str(index) if index % 2 else "" for index in range(OPTIONS)},
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Measure how long a worker process takes to get the schema, by running
+the setup code again (make_schema) or by loading a snapshot of it,
+and how long a pool of spawned workers takes to be ready.
+
+Run with: python benchmarks/bench_worker_startup.py
+"""
+import multiprocessing
+import pickle
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from synthetic import make_schema, make_values
+from type_config import TypeConfig
+
+OPTIONS = 10_000
+WORKERS = 4
+REPEAT = 5
+
+# Set in each worker by its initializer
+_config = None
+
+
+def registry_of(config: TypeConfig) -> dict:
+    """
+    Name the functions of make_schema's types, which are lambdas.
+    """
+    registry = {}
+    for type, type_info in config.get_types().items():
+        registry[f"{type}.validate"] = type_info.validate
+        registry[f"{type}.cast"] = type_info.cast
+    return registry
+
+
+def setup_from_code(options: int) -> float:
+    global _config
+    start = time.perf_counter()
+    _config = make_schema(options)
+    _config.compile()
+    return time.perf_counter() - start
+
+
+def setup_from_snapshot(snapshot: bytes) -> float:
+    global _config
+    start = time.perf_counter()
+    # The registry comes from the worker's own code; only the
+    # functions are built there, not the options
+    _config = TypeConfig.from_snapshot(snapshot, registry_of(make_schema(0)))
+    _config.compile()
+    return time.perf_counter() - start
+
+
+def validate(values: dict) -> int:
+    validated, errors = _config.validate_config(values)
+    return len(validated)
+
+
+def pool_startup(initializer, argument) -> float:
+    """
+    Time from creating a pool of spawned workers to every worker
+    having validated a config.
+    """
+    context = multiprocessing.get_context("spawn")
+    values = make_values(OPTIONS)
+    start = time.perf_counter()
+    with ProcessPoolExecutor(WORKERS, mp_context=context, initializer=initializer, initargs=(argument,)) as pool:
+        results = list(pool.map(validate, [values] * WORKERS))
+    elapsed = time.perf_counter() - start
+    assert results == [OPTIONS] * WORKERS
+    return elapsed
+
+
+def main():
+    config = make_schema(OPTIONS)
+    snapshot = config.snapshot(registry_of(config))
+    loaded = TypeConfig.from_snapshot(snapshot, registry_of(config))
+    values = make_values(OPTIONS)
+    assert loaded.validate_config(values) == config.validate_config(values)
+
+    print(f"{OPTIONS} options, snapshot: {len(snapshot) / 1024:.0f} KiB")
+    print(f"  (pickled setup arguments: {len(pickle.dumps(OPTIONS))} bytes)")
+    from_code = min(setup_from_code(OPTIONS) for _ in range(REPEAT))
+    from_snapshot = min(setup_from_snapshot(snapshot) for _ in range(REPEAT))
+    print(f"  setup code per worker:    {from_code * 1000:8.1f} ms")
+    print(f"  snapshot per worker:      {from_snapshot * 1000:8.1f} ms ({from_code / from_snapshot:.1f}x)")
+
+    from_code = pool_startup(setup_from_code, OPTIONS)
+    from_snapshot = pool_startup(setup_from_snapshot, snapshot)
+    print(f"  pool of {WORKERS}, setup code:   {from_code * 1000:8.1f} ms")
+    print(f"  pool of {WORKERS}, snapshot:     {from_snapshot * 1000:8.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
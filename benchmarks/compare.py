@@ -0,0 +1,40 @@
+"""
+Compare two results files written by benchmarks/run.py.
+
+Run with: python benchmarks/compare.py before.json after.json [--threshold 1.1]
+Exits with 1 if a measure got slower than the threshold (after / before).
+"""
+import argparse
+import json
+import sys
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("before")
+    parser.add_argument("after")
+    parser.add_argument("--threshold", type=float, default=1.1, help="slowdown ratio considered a regression")
+    arguments = parser.parse_args()
+
+    with open(arguments.before) as file:
+        before = json.load(file)["results"]
+    with open(arguments.after) as file:
+        after = json.load(file)["results"]
+
+    regressions = 0
+    print(f"{'benchmark':40} {'time':>8} {'peak memory':>12}")
+    for key in before:
+        if key not in after or "error" in before[key] or "error" in after[key]:
+            print(f"{key:40} {after.get(key, {}).get('error', 'not comparable')}")
+            continue
+        time_ratio = after[key]["seconds_min"] / before[key]["seconds_min"]
+        memory_ratio = (after[key]["peak_bytes"] + 1) / (before[key]["peak_bytes"] + 1)
+        regression = time_ratio > arguments.threshold
+        regressions += regression
+        print(f"{key:40} {time_ratio:7.2f}x {memory_ratio:11.2f}x{'  <- slower' if regression else ''}")
+
+    sys.exit(1 if regressions else 0)
+
+
+if __name__ == "__main__":
+    main()
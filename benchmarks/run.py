@@ -0,0 +1,141 @@
+"""
+Time the public methods of TypeConfig on synthetic schemas and files,
+and record their memory allocations, writing the results as JSON.
+
+Run with: python benchmarks/run.py [--sizes 10 1000 100000] [--output results.json]
+Compare two runs with: python benchmarks/compare.py before.json after.json
+"""
+import argparse
+import json
+import os
+import platform
+import resource
+import statistics
+import subprocess
+import sys
+import time
+import tracemalloc
+from typing import Any, Callable, Dict
+
+from synthetic import make_file, make_schema
+
+SIZES = (10, 1_000, 100_000)
+
+# {name: (type_hint, make_file's arguments)}
+VARIANTS = {
+    "clean": (False, {}),
+    "type_hints": (True, {}),
+    "noisy": (False, {"comment_density": 1.5, "inline_comments": 0.5}),
+    "corrupted": (False, {"corruption_rate": 0.1, "inline_comments": 0.2}),
+}
+
+
+def measure(function: Callable[[], Any], repeat: int) -> Dict[str, float]:
+    """
+    Time function repeat times, then run it once more while tracing
+    its memory allocations.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    result = function()
+    after, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+
+    return {
+        "seconds_min": min(times),
+        "seconds_median": statistics.median(times),
+        "peak_bytes": peak - before,
+        "retained_bytes": after - before,
+    }
+
+
+def benchmark(options: int, variant: str, repeat: int) -> Dict[str, Dict[str, float]]:
+    type_hint, file_arguments = VARIANTS[variant]
+    config = make_schema(options, type_hint)
+    file_content = make_file(config, options, **file_arguments)
+    parsed, _ = config.parse_config(file_content)
+    overwritable = {option: None if index % 2 else value for index, (option, value) in enumerate(parsed.items())}
+
+    methods = {
+        "parse_config": lambda: config.parse_config(file_content),
+        "validate_config": lambda: config.validate_config(parsed),
+        "merge_config": lambda: config.merge_config(parsed, overwritable),
+        "create_config": lambda: config.create_config(),
+        "heal_config": lambda: config.heal_config(file_content),
+    }
+    # The biggest schemas are slow enough to be timed fewer times
+    repeat = max(1, repeat if options < 100_000 else repeat // 3)
+    results = {}
+    for method, function in methods.items():
+        try:
+            results[method] = measure(function, repeat)
+        except Exception as err:
+            # Recorded, so that a method failing on some inputs is visible
+            results[method] = {"error": f"{type(err).__name__}: {err}"}
+    return results
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES, help="numbers of options")
+    parser.add_argument("--variants", nargs="+", default=list(VARIANTS), choices=list(VARIANTS))
+    parser.add_argument("--repeat", type=int, default=5, help="timed runs of each method")
+    parser.add_argument("--output", help="JSON file to write (default: standard output)")
+    arguments = parser.parse_args()
+
+    results = {}
+    for options in arguments.sizes:
+        for variant in arguments.variants:
+            for method, measures in benchmark(options, variant, arguments.repeat).items():
+                key = f"{options}/{variant}/{method}"
+                results[key] = measures
+                if "error" in measures:
+                    print(f"{key:40} {measures['error']}", file=sys.stderr)
+                    continue
+                print(
+                    f"{key:40} {measures['seconds_min'] * 1000:10.3f} ms "
+                    f"{measures['peak_bytes'] / 1024:10.1f} KiB peak",
+                    file=sys.stderr,
+                )
+
+    report = {
+        "metadata": {
+            "commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "repeat": arguments.repeat,
+            "peak_rss_kb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+        },
+        "results": results,
+    }
+    output = json.dumps(report, indent=2)
+    if arguments.output:
+        with open(arguments.output, "w") as file:
+            file.write(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
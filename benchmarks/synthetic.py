@@ -0,0 +1,92 @@
+"""
+Generate synthetic schemas and config files for the benchmarks.
+Everything is derived from a seed, so the same arguments always give
+the same schema and file.
+"""
+import random
+
+from type_config import TypeConfig
+
+
+def make_schema(options: int, type_hint: bool = False) -> TypeConfig:
+    """
+    Return a TypeConfig with the given number of options, spread
+    over a few simple types; some have a default, some can be empty.
+    """
+    config = TypeConfig(type_hint=type_hint)
+    config.add_type(
+        type="Integer",
+        validate=lambda value: value is None or value.lstrip("-").isdigit(),
+        cast=lambda value: int(value) if value else None,
+        error="The value must be an integer",
+    )
+    config.add_type(
+        type="Word",
+        validate=lambda value: value is None or value.isalnum(),
+        cast=lambda value: value,
+        error="The value must be a single word",
+    )
+    config.add_type(
+        type="List>=2",
+        validate=lambda value: value is None or len(value.split(",")) >= 2,
+        cast=lambda value: [item.strip() for item in value.split(",")] if value else [],
+        error="The list must have at least two items",
+    )
+    config.add_type(
+        type="Flag",
+        validate=lambda value: value in (None, "true", "false"),
+        cast=lambda value: value == "true",
+        error="The value must be true or false",
+    )
+
+    types = ("Integer", "Word", "List>=2", "Flag")
+    defaults = ("0", "word", "a, b", "false")
+    for index in range(options):
+        kind = index % 4
+        config.add_option(
+            type=types[kind],
+            option=f"option {index}",
+            help=f"Option number {index}\nIt is used by the benchmarks",
+            default=defaults[kind] if index % 3 == 0 else "",
+            can_be_empty=index % 5 == 0,
+            important_help="Generated option" if index % 7 == 0 else "",
+        )
+    return config
+
+
+def make_values(options: int) -> dict:
+    """
+    Return valid values for the options of make_schema.
+    """
+    values = ("42", "value", "x, y, z", "true")
+    return {f"option {index}": values[index % 4] for index in range(options)}
+
+
+def make_file(
+    config: TypeConfig,
+    options: int,
+    comment_density: float = 0.0,
+    inline_comments: float = 0.0,
+    corruption_rate: float = 0.0,
+    seed: int = 0,
+) -> str:
+    """
+    Return the content of a config file for the options of make_schema,
+    written by create_config, with:
+    - comment_density: extra comment lines per option
+    - inline_comments: the share of values followed by a comment
+    - corruption_rate: the share of options whose line is broken
+    """
+    generator = random.Random(seed)
+    lines = []
+    for line in config.create_config(make_values(options)).splitlines():
+        if "=" in line and not line.startswith("#"):
+            if generator.random() < corruption_rate:
+                line = line.replace("=", "|", 1)
+            elif generator.random() < inline_comments:
+                line += " # an inline comment"
+
+            extra_comments = int(comment_density) + (generator.random() < comment_density % 1)
+            lines.extend("# An extra comment line" for _ in range(extra_comments))
+        lines.append(line)
+    return "\n".join(lines)
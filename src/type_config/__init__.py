@@ -1,16 +1,247 @@
-from typing import Tuple, Dict, Any
+import io
+import threading
+from collections import OrderedDict
+from collections.abc import Awaitable
+from contextlib import contextmanager
+import os
+from functools import partial
+from types import MappingProxyType
+from typing import List, Tuple, Dict, Set, Any, Callable, Iterable, Iterator, IO, Mapping, TYPE_CHECKING
 
 import type_config.errors as er
+import type_config.lookup as lookup
+import type_config.parallel as parallel
+from type_config.specs import BrokenLine, OptionSpec, TypeSpec
+
+# The other modules are imported when they are first used, so that
+# importing type_config stays fast (see __getattr__ for the names
+# they export)
+if TYPE_CHECKING:
+    from concurrent.futures import Executor
+
+    import type_config.profiling as profiling
+    from type_config.frozen import FrozenTypeConfig
+    from type_config.lazy import LazyConfig
+    from type_config.watching import ConfigWatcher
+
+# The classes of the other modules that can be imported from
+# type_config, {name: module}
+_LAZY_NAMES = {
+    "ConfigWatcher": "type_config.watching",
+    "FrozenTypeConfig": "type_config.frozen",
+    "LazyConfig": "type_config.lazy",
+    "ProfileStats": "type_config.profiling",
+}
+
+# What parse_config and parse_config_iter can read from
+ConfigSource = str | bytes | IO[str] | IO[bytes] | Iterable[str] | Iterable[bytes]
+
+
+# {type: whether its objects have to be awaited}, filled as they are met
+_AWAITABLE_TYPES: Dict[type, bool] = {}
+
+
+def _is_awaitable(value: Any) -> bool:
+    """
+    Whether value has to be awaited. The answer is kept for its type,
+    so that the validators only check isinstance(value, Awaitable),
+    which is slow, once per type: see _validate_value.
+    """
+    awaitable = _AWAITABLE_TYPES[type(value)] = isinstance(value, Awaitable)
+    return awaitable
+
+
+def _reject_awaitable(option: str, type: str, awaitable: Any):
+    """
+    Used by the synchronous validation when a function of the option's
+    type returned something to await (an object with an async def
+    __call__, or a function returning a coroutine), which can't be
+    taken as a result.
+    """
+    close = getattr(awaitable, "close", None)
+    if close is not None:
+        # Avoid the "coroutine was never awaited" warning
+        close()
+    raise er.ValidationError(
+        f"[{option}]: the type [{type}] is asynchronous, use avalidate_config."
+    )
+
+
+def _validate_value(
+    option: str,
+    type: str,
+    empty_value: Any,
+    can_be_empty: bool,
+    validate: Callable[[Any], bool] | None,
+    cast: Callable[[Any], Any] | None,
+    error: str,
+    value: Any,
+) -> Any:
+    """
+    Validate and cast the given value, using the option's settings
+    and the functions of its type (None if the type is unknown).
+    empty_value is what replaces a missing value: the option's
+    default, or None.
+    This is what TypeConfig.compile binds to each option.
+    """
+    if not value:
+        value = empty_value
+        if not value and not can_be_empty:
+            raise er.ValidationError(f"[{option}]: can't be left empty.")
+
+    if validate is None:
+        raise er.ValidationError(f"[{type}]: is not part of the expected types.")
+
+    is_valid = validate(value)
+    if is_valid:
+        # Functions returning coroutines aren't found by compile: what
+        # they return is rejected (type is a parameter, hence __class__)
+        if (
+            is_valid is not True
+            and _AWAITABLE_TYPES.get(is_valid.__class__) is not False
+            and _is_awaitable(is_valid)
+        ):
+            _reject_awaitable(option, type, is_valid)
+        result = cast(value)
+        if _AWAITABLE_TYPES.get(result.__class__) is not False and _is_awaitable(result):
+            _reject_awaitable(option, type, result)
+        return result
+    raise er.ValidationError(f"[{option}]: {error} (value: {value})")
+
+
+def _parse_value(
+    option: str,
+    type: str,
+    empty_value: Any,
+    can_be_empty: bool,
+    parse: Callable[[Any], Any],
+    error: str,
+    value: Any,
+) -> Any:
+    """
+    Validate and cast the given value in one step, with the parse
+    function of the option's type, which returns the casted value or
+    raises a ValueError, TypeError or ValidationError.
+    Empty values that can be empty are None, without being parsed.
+    This is what TypeConfig.compile binds to the options whose type
+    has a parse function.
+    """
+    if not value:
+        value = empty_value
+        if not value:
+            if not can_be_empty:
+                raise er.ValidationError(f"[{option}]: can't be left empty.")
+            return None
+
+    try:
+        result = parse(value)
+    except (ValueError, TypeError, er.ValidationError) as err:
+        raise er.ValidationError(f"[{option}]: {error or err} (value: {value})") from err
+    if _AWAITABLE_TYPES.get(result.__class__) is not False and _is_awaitable(result):
+        _reject_awaitable(option, type, result)
+    return result
+
+
+def _broken_line(line_number: int, original_line: str, line: str, error: str) -> BrokenLine:
+    """
+    Return the record of a broken line, given as it was read and
+    stripped. Its span is the option (the text before the inline
+    comment, after the type) or, if there is none, the whole line.
+    Only broken lines are looked at again.
+    """
+    indent = len(original_line) - len(original_line.lstrip())
+    start = line.find("]") + 1
+    end = line.find("#", start)
+    if end == -1:
+        end = len(line)
+    text = line[start:end]
+    if text.strip():
+        start += len(text) - len(text.lstrip())
+        end -= len(text) - len(text.rstrip())
+    else:
+        start, end = 0, len(line)
+    return BrokenLine(line_number, indent + start + 1, indent + end + 1, line, error)
 
 
 class TypeConfig:
-    def __init__(self, type_hint=False) -> None:
+    def __init__(self, type_hint=False, cache_size=0, normalize_keys=False) -> None:
         self._options_types = {}
         self._options = {}
         self.type_hint = type_hint
+        # How option names are matched: exactly (False), with
+        # lookup.normalize_key (True) or with the given function
+        self._normalize_keys = normalize_keys
+        if normalize_keys is True:
+            normalize_keys = lookup.normalize_key
+        # The options' names and aliases, {normalized name: option}
+        self._index = lookup.OptionIndex(normalize_keys or None)
+        # Changes each time an option or a type is added
+        self._schema_version = 0
+        # Validators prepared by compile, {option: validator}
+        self._plan: Dict[str, Callable[[Any], Any]] | None = None
+        self._plan_workloads: Dict[str, str] = {}
+        # Validators used by avalidate_config, {option: coroutine function},
+        # and the options with an asynchronous type, awaited concurrently
+        self._plan_asynchronous: Dict[str, Callable[[Any], Any]] = {}
+        self._plan_concurrent: Set[str] = set()
+        # Results of parse_and_validate, {(content_hash, schema_version): (validated, errors)}
+        self._cache: OrderedDict = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._cache_size = cache_size
+        self._cache_hits = 0
+        self._cache_misses = 0
+        # The ProfileStats of profile, while it's used
+        self._profile: "profiling.ProfileStats | None" = None
+        # Parts of the config file prepared by _get_templates
+        self._templates: List[Tuple[str, str, Any, str]] = []
+        self._templates_key: Tuple[int, bool] | None = None
+        # What merge_configs needs of each option, prepared by _get_merge_plan
+        self._merge_plan: Dict[str, Tuple[Any, bool]] = {}
+        self._merge_plan_version: int | None = None
+        # The hash of the options used by the disk cache
+        self._options_fingerprint: bytes = b""
+        self._options_fingerprint_version: int | None = None
 
-    def add_type(self, type, validate, cast, error):
-        self._options_types[type] = {"validate": validate, "cast": cast, "error": error}
+    def _schema_changed(self):
+        """
+        Forget everything that was computed from the current
+        options and types.
+        """
+        self._schema_version += 1
+        self._plan = None
+
+    def add_type(
+        self,
+        type,
+        validate=None,
+        cast=None,
+        error="",
+        workload=parallel.PURE,
+        validate_batch=None,
+        cast_batch=None,
+        parse=None,
+    ):
+        if workload not in parallel.WORKLOADS:
+            raise ValueError(
+                f"[{type}]: the workload must be one of {', '.join(parallel.WORKLOADS)}."
+            )
+        if parse is None and (validate is None or cast is None):
+            raise ValueError(f"[{type}]: either validate and cast, or parse, must be given.")
+        if parse is not None and (validate or cast or validate_batch or cast_batch):
+            raise ValueError(
+                f"[{type}]: parse can't be used with validate, cast, validate_batch or cast_batch."
+            )
+        self._options_types[type] = TypeSpec(
+            type=type,
+            validate=validate,
+            cast=cast,
+            error=error,
+            workload=workload,
+            validate_batch=validate_batch,
+            cast_batch=cast_batch,
+            parse=parse,
+        )
+        self._schema_changed()
 
     def add_option(
         self,
@@ -20,16 +251,129 @@ class TypeConfig:
         default="",
         can_be_empty=False,
         important_help="",
+        aliases=(),
     ):
-        self._options[option] = {
-            "type": type,
-            "option": option,
-            "default": default,
-            "can_be_empty": can_be_empty,
-            "important_help": important_help,
-            "help": help,
+        self._index.add(option, aliases)
+        self._options[option] = OptionSpec(
+            type=type,
+            option=option,
+            default=default,
+            can_be_empty=can_be_empty,
+            important_help=important_help,
+            help=help,
+            aliases=aliases,
+        )
+        self._schema_changed()
+
+    def _rebuild_index(self):
+        """
+        Index the names and aliases of all the options again.
+        """
+        self._index = lookup.OptionIndex(self._index.normalize)
+        for option, option_info in self._options.items():
+            self._index.add(option, option_info.aliases)
+
+    def freeze(self) -> "FrozenTypeConfig":
+        """
+        Return a read-only copy of this TypeConfig, which can be
+        shared and used by many threads at the same time.
+        """
+        from type_config.frozen import FrozenTypeConfig
+
+        return FrozenTypeConfig(self)
+
+    def watch(self, path: str | os.PathLike, **options) -> "ConfigWatcher":
+        """
+        Load the config file at path and return a ConfigWatcher, which
+        keeps its validated values up to date when the file changes
+        (see watching.ConfigWatcher for the options).
+        """
+        from type_config.watching import ConfigWatcher
+
+        return ConfigWatcher(self, path, **options)
+
+    def snapshot(self, registry: Mapping[str, Callable] = {}) -> bytes:
+        """
+        Return a compact copy of the options and types, that can be
+        sent to other processes or written to a file and read back
+        with TypeConfig.from_snapshot.
+        The types' functions are stored by name: their name in the
+        registry ({name: function}) if present, else their importable
+        qualified name ("module:function"). Lambdas and nested
+        functions must be in the registry.
+        """
+        import type_config.serialization as serialization
+
+        return serialization.dump_schema(
+            self.type_hint,
+            self._cache_size,
+            self._normalize_keys,
+            self._options,
+            self._options_types,
+            registry,
+        )
+
+    @staticmethod
+    def from_snapshot(
+        snapshot: bytes, registry: Mapping[str, Callable] = {}
+    ) -> "TypeConfig":
+        """
+        Create a TypeConfig from the result of snapshot, looking up
+        the functions in the registry ({name: function}) or importing
+        them.
+        """
+        import type_config.serialization as serialization
+
+        type_hint, cache_size, normalize_keys, options, types = serialization.load_schema(
+            snapshot, registry
+        )
+        config = TypeConfig(type_hint=type_hint, cache_size=cache_size, normalize_keys=normalize_keys)
+        config._options = options
+        config._options_types = types
+        config._rebuild_index()
+        return config
+
+    def generate_module(self, registry: Mapping[str, Callable] = {}) -> str:
+        """
+        Return the source of a Python module with a
+        parse_and_validate(text) function written for the current
+        options and types, which returns the same results as
+        parse_config followed by validate_config, without looking up
+        the options' settings and types for each value.
+        Save it to a .py file and import it like any other module.
+
+        The types' functions are imported by their qualified name; the
+        ones in the registry ({name: function}), like lambdas, must be
+        given to the module's bind function before it's used.
+        """
+        import type_config.codegen as codegen
+
+        return codegen.generate_module(
+            self._options, self._options_types, self._index.keys, self._index.normalize, registry
+        )
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # The cache, its lock and what is prepared from the options
+        # and types are rebuilt when needed, instead of being pickled
+        return {
+            "type_hint": self.type_hint,
+            "cache_size": self._cache_size,
+            "normalize_keys": self._normalize_keys,
+            "options": dict(self._options),
+            "types": dict(self._options_types),
         }
 
+    def __setstate__(self, state: Dict[str, Any]):
+        TypeConfig.__init__(
+            self,
+            type_hint=state["type_hint"],
+            cache_size=state["cache_size"],
+            normalize_keys=state["normalize_keys"],
+        )
+        self._options = state["options"]
+        self._options_types = state["types"]
+        self._rebuild_index()
+
     def get_options(self):
         return self._options.copy()
 
@@ -41,19 +385,40 @@ class TypeConfig:
         Extract option and value from the given line.
         The type, if present, is ignored.
         """
-        # Remove type
-        if "]" in line:
-            _, _, line = line.partition("]")
-
-        # Remove inline comments 
-        line = line.split("#")[0]
+        # Skip the type, if present
+        start = line.find("]") + 1
 
-        option, equal_sign, value = line.partition("=")
+        # Ignore inline comments
+        end = line.find("#", start)
+        if end == -1:
+            end = len(line)
 
-        if not equal_sign or not option:
+        equal_sign = line.find("=", start, end)
+        if equal_sign == -1 or equal_sign == start:
             raise er.ParsingError(f"A broken line has been found.")
 
-        return (option.strip(), value.strip())
+        return (line[start:equal_sign].strip(), line[equal_sign + 1 : end].strip())
+
+    def _read_lines(self, source: ConfigSource) -> Iterator[str]:
+        """
+        Yield the lines of the given source, one at a time.
+        The source can be a string, bytes, an open text or binary file
+        or any iterable of lines; bytes are decoded as UTF-8.
+        """
+        if isinstance(source, str):
+            yield from source.splitlines()
+            return
+        if isinstance(source, (bytes, bytearray)):
+            source = source.decode("utf-8")
+            yield from source.splitlines()
+            return
+
+        for line in source:
+            if isinstance(line, (bytes, bytearray)):
+                line = line.decode("utf-8")
+            # Lines coming from files keep their line ending; empty items
+            # are empty lines (counted by parse_config_records)
+            yield from line.splitlines() or ("",)
 
     def _clean_file(self, file_content: str) -> str:
         """
@@ -71,7 +436,7 @@ class TypeConfig:
 
     def _validate_option(self, option: str, value: str | None) -> Any:
         """
-        Validate the given option's value.
+        Validate the given option's value, with its compiled validator.
 
         Raise an exception if:
             - The option is not part of the config's options
@@ -79,73 +444,675 @@ class TypeConfig:
             - A value that can't be empty is left empty
             - The value is invalid.
         """
-        option_info = self._options.get(option, None)
-        if not option_info:
-            raise er.ValidationError(f"[{option}]: is not part of the expected options.")
+        option = self._index.resolve(option)
+        validator = self._get_plan().get(option, None)
+        if validator is None:
+            raise er.ValidationError(self._unknown_option_error(option))
+        return validator(value)
 
-        type = option_info["type"]
-        default = option_info["default"]
-        can_be_empty = option_info["can_be_empty"]
+    def parse_config_iter(
+        self, source: ConfigSource
+    ) -> Iterator[Tuple[str, str, str]]:
+        """
+        Parse the given source one line at a time, without reading
+        it all in memory first.
+        Yield ("option", option, value) for each {option: value} pair
+        and ("error", line, error) for each broken line.
+        Empty lines and comments are skipped.
+        Aliases and option names written differently (if normalize_keys
+        is used) are replaced by the options' names.
+        """
+        resolve = self._index.resolve if self._index.is_needed else None
+        for line in self._read_lines(source):
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
 
-        if not value:
-            value = default if default else None
-        if not value and not can_be_empty:
-            raise er.ValidationError(f"[{option}]: can't be left empty.")
-        # Until here
+            try:
+                option, value = self._get_option(line)
+            except er.ParsingError as err:
+                yield ("error", line, str(err))
+                continue
 
-        try:
-            validating_func = self._options_types[type]["validate"]
-            casting_func = self._options_types[type]["cast"]
-        except KeyError:
-            raise er.ValidationError(f"[{type}]: is not part of the expected types.")
-
-        is_valid = validating_func(value)
-        if is_valid:
-            return casting_func(value)
-        else:
-            raise er.ValidationError(
-                f"[{option}]: {self._options_types[type]['error']} (value: {value})"
-            )
+            if resolve is not None:
+                option = resolve(option)
+            yield ("option", option, value)
 
-    def parse_config(self, file_content: str) -> Tuple[Dict[str, str], Dict[str, str]]:
+    def parse_config(
+        self, file_content: ConfigSource
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
         """
         Parse the given string to extract the {option: value} pairs.
         Return a Tuple containing the extracted_values and parsing_errors.
+
+        Bytes, open files and iterables of lines are accepted too
+        (see parse_config_iter).
         """
-        cleaned_file = self._clean_file(file_content)
+        if self._profile is not None:
+            with self._profile.method("parse_config", file_content) as file_content:
+                return self._collect_events(self.parse_config_iter(file_content))
+        return self._collect_events(self.parse_config_iter(file_content))
 
+    def parse_config_records(
+        self,
+        file_content: ConfigSource,
+        max_errors: int | None = None,
+        stop_on_max_errors: bool = False,
+    ) -> Tuple[Dict[str, str], List[BrokenLine], int]:
+        """
+        Parse the given config like parse_config, but return the broken
+        lines as a list of BrokenLine records, with their line number
+        and the columns of the broken part, in the order they were found
+        (identical broken lines each get their own record).
+        Return a tuple containing the extracted values, the records and
+        the number of broken lines found.
+
+        At most max_errors records are kept (the others are only
+        counted); with stop_on_max_errors, parsing stops at the
+        max_errors-th broken line.
+        """
+        resolve = self._index.resolve if self._index.is_needed else None
+        get_option = self._get_option
         config = {}
-        errors = {}
-        for line in cleaned_file.splitlines():
+        errors = []
+        error_count = 0
+        for line_number, original_line in enumerate(self._read_lines(file_content), 1):
+            line = original_line.strip()
+            if not line or line[0] == "#":
+                continue
+
             try:
-                option, value = self._get_option(line)
+                option, value = get_option(line)
             except er.ParsingError as err:
-                errors[line.strip()] = str(err) 
+                error_count += 1
+                if max_errors is None or len(errors) < max_errors:
+                    errors.append(_broken_line(line_number, original_line, line, str(err)))
+                if stop_on_max_errors and max_errors is not None and error_count >= max_errors:
+                    break
                 continue
 
+            if resolve is not None:
+                option = resolve(option)
             config[option] = value
 
+        return config, errors, error_count
+
+    def parse_config_file(
+        self, path: str | os.PathLike
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Parse the UTF-8 file at the given path, like parse_config.
+        The file is memory-mapped instead of being read and decoded:
+        only the options and values that are kept are decoded.
+        """
+        if self._profile is not None:
+            with self._profile.method("parse_config_file"):
+                self._profile.add_bytes("parse_config_file", os.path.getsize(path))
+                return self._parse_config_file(path)
+        return self._parse_config_file(path)
+
+    def _parse_config_file(
+        self, path: str | os.PathLike
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        import type_config.file_parsing as file_parsing
+
+        events = file_parsing.parse_file(path, self.parse_config_iter)
+        if self._index.is_needed:
+            resolve = self._index.resolve
+            events = (
+                (event, resolve(key) if event == "option" else key, value)
+                for event, key, value in events
+            )
+        return self._collect_events(events)
+
+    def _collect_events(
+        self, events: Iterator[Tuple[str, str, str]]
+    ) -> Tuple[Dict[str, str], Dict[str, str]]:
+        """
+        Gather the events of parse_config_iter in the
+        (config, errors) tuple returned by parse_config.
+        """
+        config = {}
+        errors = {}
+        for event, key, value in events:
+            if event == "option":
+                config[key] = value
+            else:
+                errors[key] = value
+
         return (config, errors)
 
+    def compile(self) -> Dict[str, str]:
+        """
+        Prepare a validator for each option, with its type's functions,
+        default and can_be_empty already bound, so that validating
+        doesn't have to look them up for each value.
+        Return a dictionary with the options whose type is unknown
+        and their errors.
+
+        This is done automatically by validate_config and is redone
+        after an option or a type is added.
+        """
+        import type_config.asynchronous as asynchronous
+
+        plan = {}
+        errors = {}
+        workloads = {}
+        asynchronous_plan = {}
+        concurrent = set()
+        profile = self._profile
+        for option, option_info in self._options.items():
+            type = option_info.type
+            type_info = self._options_types.get(type, None)
+            if not type_info:
+                errors[option] = f"[{type}]: is not part of the expected types."
+                type_info = TypeSpec(type, None, None, "", parallel.PURE, None, None, None)
+            workloads[option] = type_info.workload
+            empty_value = option_info.default if option_info.default else None
+
+            if type_info.parse is not None:
+                is_asynchronous = asynchronous.is_asynchronous(type_info.parse)
+                functions = [type_info.parse]
+            else:
+                is_asynchronous = asynchronous.is_asynchronous(
+                    type_info.validate
+                ) or asynchronous.is_asynchronous(type_info.cast)
+                functions = [type_info.validate, type_info.cast]
+            if profile is not None:
+                functions = profile.instrument(option, type, functions, is_asynchronous)
+
+            if type_info.parse is not None:
+                arguments = (option, type, empty_value, option_info.can_be_empty, *functions, type_info.error)
+                validator = _parse_value
+                asynchronous_validator = asynchronous.aparse_value
+            else:
+                arguments = (
+                    option,
+                    type,
+                    empty_value,
+                    option_info.can_be_empty,
+                    *functions,
+                    type_info.error,
+                )
+                validator = _validate_value
+                asynchronous_validator = asynchronous.avalidate_value
+
+            # Every option goes through the asynchronous validators in
+            # avalidate_config, since normal functions can return awaitables
+            asynchronous_plan[option] = partial(asynchronous_validator, *arguments)
+            if profile is not None:
+                asynchronous_plan[option] = profile.count(option, type, asynchronous_plan[option], True)
+            if is_asynchronous:
+                concurrent.add(option)
+                plan[option] = partial(asynchronous.reject_asynchronous_value, option, type)
+            else:
+                plan[option] = partial(validator, *arguments)
+                if profile is not None:
+                    plan[option] = profile.count(option, type, plan[option], False)
+
+        self._plan = plan
+        self._plan_workloads = workloads
+        self._plan_asynchronous = asynchronous_plan
+        self._plan_concurrent = concurrent
+        return errors
+
+    def _get_plan(self) -> Dict[str, Callable[[Any], Any]]:
+        """
+        Return the compiled validators, compiling them if needed.
+        """
+        if self._plan is None:
+            self.compile()
+        return self._plan
+
+    @contextmanager
+    def profile(self) -> "Iterator[profiling.ProfileStats]":
+        """
+        Record, until the end of the with block, the calls, failures
+        and time spent validating each option, and the calls, time and
+        bytes read of parse_config, parse_config_file, validate_config
+        and heal_config:
+
+            with config.profile() as stats:
+                config.parse_and_validate(file_content)
+            print(stats.format_table())
+
+        The validators are compiled again with timers at the start and
+        without them at the end, so nothing is recorded, or slowed
+        down, outside of the block.
+        """
+        import type_config.profiling as profiling
+
+        stats = profiling.ProfileStats()
+        previous = self._profile
+        self._profile = stats
+        self._plan = None
+        try:
+            yield stats
+        finally:
+            self._profile = previous
+            self._plan = None
+
     def validate_config(
-        self, config: Dict[str, Any]
+        self, config: Dict[str, Any], executor: "Executor | None" = None
     ) -> Tuple[Dict[str, Any], Dict[str, str]]:
         """
         Validate a pre-existing dictionary containing all, or a part, of
         the TypeConfig's options.
         Return a tuple containing the validated data and
         a dictionary with the options that were not valid and their errors.
+
+        If an executor is given, the options whose type isn't "pure"
+        are validated in it.
+        """
+        if self._profile is not None:
+            with self._profile.method("validate_config", config):
+                return self._validate_config(config, executor)
+        return self._validate_config(config, executor)
+
+    def _validate_config(
+        self, config: Dict[str, Any], executor: "Executor | None"
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        plan = self._get_plan()
+        config = self._resolve_keys(config)
+        if executor is not None:
+            executors = {parallel.IO: executor, parallel.CPU: executor}
+            validated_config, errors = parallel.validate_with_executors(
+                plan, self._plan_workloads, config, executors
+            )
+            return validated_config, self._explain_errors(errors)
+
+        errors = dict()
+        validated_config = dict()
+
+        for option, value in config.items():
+            validator = plan.get(option, None)
+            if validator is None:
+                errors[option] = f"[{option}]: is not part of the expected options."
+                continue
+            try:
+                validated_config[option] = validator(value)
+            except er.ValidationError as err:
+                errors[option] = str(err)
+
+        return validated_config, self._explain_errors(errors)
+
+    def _resolve_keys(self, config: Mapping[str, Any]) -> Mapping[str, Any]:
+        """
+        Return config with the aliases and the option names written
+        differently replaced by the options' names, or config itself
+        if the options have no aliases and names aren't normalized.
+        """
+        if not self._index.is_needed:
+            return config
+        resolve = self._index.resolve
+        options = self._options
+        # The names of the options (like the ones given by parse_config)
+        # don't need to be normalized
+        return {
+            option if option in options else resolve(option): value
+            for option, value in config.items()
+        }
+
+    def _unknown_option_error(self, option: str) -> str:
+        """
+        Return the error of an unknown option, with the options whose
+        names are close to it, if any.
+        """
+        error = f"[{option}]: is not part of the expected options."
+        suggestions = self._index.suggest(option)
+        if suggestions:
+            error += f" Did you mean {' or '.join(f'[{name}]' for name in suggestions)}?"
+        return error
+
+    def _explain_errors(self, errors: Dict[str, str]) -> Dict[str, str]:
+        """
+        Add suggestions to the errors of the unknown options.
+        Nothing is looked up when there are no errors.
+        """
+        for option in errors:
+            if option not in self._options:
+                errors[option] = self._unknown_option_error(option)
+        return errors
+
+    def validate_many(
+        self, configs: List[Dict[str, Any]]
+    ) -> List[Tuple[Dict[str, Any], Dict[str, str]]]:
+        """
+        Validate many dictionaries at once, like validate_config.
+        The values are validated one option at a time, using the types'
+        validate_batch and cast_batch functions when available.
+        Return a list with a (validated, errors) tuple for each dictionary.
+        """
+        import type_config.batch as batch
+
+        plan = self._get_plan()
+        configs = [self._resolve_keys(config) for config in configs]
+        results = batch.validate_many(self._options, self._options_types, plan, configs)
+        return [(validated, self._explain_errors(errors)) for validated, errors in results]
+
+    async def avalidate_config(
+        self, config: Dict[str, Any], max_concurrency: int | None = None
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Validate config like validate_config, supporting types whose
+        validate and cast are coroutine functions.
+        The options with an asynchronous type are validated concurrently
+        (at most max_concurrency at a time, if given), while the others
+        are validated one after the other, awaiting what their functions
+        return if it has to be awaited.
+        """
+        import type_config.asynchronous as asynchronous
+
+        self._get_plan()
+        validated_config, errors = await asynchronous.avalidate_with_plan(
+            self._plan_asynchronous, self._plan_concurrent, self._resolve_keys(config), max_concurrency
+        )
+        return validated_config, self._explain_errors(errors)
+
+    def validate_config_parallel(
+        self, config: Dict[str, Any], max_workers: int | None = None
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Validate config like validate_config, running the options whose
+        type has an "io" workload in a pool of threads and those with
+        a "cpu" workload in a pool of processes.
+        max_workers is the size of each pool.
+        """
+        from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+
+        plan = self._get_plan()
+        config = self._resolve_keys(config)
+        workloads = self._plan_workloads
+        used_workloads = {workloads[option] for option in config if option in workloads}
+
+        with ThreadPoolExecutor(max_workers) as threads:
+            executors = {parallel.IO: threads}
+            if parallel.CPU not in used_workloads:
+                validated_config, errors = parallel.validate_with_executors(
+                    plan, workloads, config, executors
+                )
+                return validated_config, self._explain_errors(errors)
+
+            with ProcessPoolExecutor(max_workers) as processes:
+                executors[parallel.CPU] = processes
+                validated_config, errors = parallel.validate_with_executors(
+                    plan, workloads, config, executors
+                )
+                return validated_config, self._explain_errors(errors)
+
+    def revalidate(
+        self,
+        previous_config: Mapping[str, Any],
+        previous_validated: Mapping[str, Any],
+        config: Mapping[str, Any],
+    ) -> Tuple[Dict[str, Any], Dict[str, str], Set[str]]:
+        """
+        Validate config, reusing the results of a previous validation
+        (previous_validated, obtained from previous_config) for the
+        options whose value didn't change.
+        Return a tuple containing the validated data, a dictionary with
+        the options that were not valid and their errors, and the set of
+        options that were added, changed or removed.
+
+        The previous results must come from this TypeConfig, with the
+        same options and types.
         """
         errors = dict()
         validated_config = dict()
+        changed_options = set()
+        plan = self._get_plan()
+        missing = object()
+        previous_config = self._resolve_keys(previous_config)
+        config = self._resolve_keys(config)
+
+        for option, value in config.items():
+            previous_value = previous_config.get(option, missing)
+            if previous_value is missing or previous_value != value:
+                changed_options.add(option)
+            elif option in previous_validated:
+                validated_config[option] = previous_validated[option]
+                continue
+
+            validator = plan.get(option, None)
+            if validator is None:
+                errors[option] = f"[{option}]: is not part of the expected options."
+                continue
+            try:
+                validated_config[option] = validator(value)
+            except er.ValidationError as err:
+                errors[option] = str(err)
+
+        for option in previous_config:
+            if option not in config:
+                changed_options.add(option)
+
+        return validated_config, self._explain_errors(errors), changed_options
+
+    def load_lazy(self, file_content: ConfigSource) -> "LazyConfig":
+        """
+        Parse the given config and return a read-only mapping with its
+        options, whose values are validated and casted only when they
+        are read for the first time (see lazy.LazyConfig).
+        """
+        from type_config.lazy import LazyConfig
+
+        config, parsing_errors = self.parse_config(file_content)
+        return LazyConfig(self, config, parsing_errors)
+
+    def parse_and_validate(
+        self, file_content: ConfigSource
+    ) -> Tuple[Mapping[str, Any], Mapping[str, str]]:
+        """
+        Parse and validate the given config in one go.
+        Return a tuple containing the validated data and a dictionary
+        with both the parsing and the validation errors.
+
+        If the TypeConfig has a cache, strings and bytes are looked up in
+        it first; cached results are read-only mappings shared by every
+        call that gets them.
+        """
+        key = self._cache_key(file_content)
+        if key is None:
+            return self._parse_and_validate(file_content)
+
+        result = self._get_cached(key)
+        if result is None:
+            result = self._store_cached(key, self._parse_and_validate(file_content))
+        return result
+
+    async def aparse_and_validate(
+        self, file_content: ConfigSource, max_concurrency: int | None = None
+    ) -> Tuple[Mapping[str, Any], Mapping[str, str]]:
+        """
+        Asynchronous version of parse_and_validate, which validates
+        using avalidate_config.
+        """
+        key = self._cache_key(file_content)
+        result = self._get_cached(key) if key is not None else None
+        if result is not None:
+            return result
+
+        config, parsing_errors = self.parse_config(file_content)
+        validated_config, validation_errors = await self.avalidate_config(
+            config, max_concurrency
+        )
+        result = (validated_config, {**parsing_errors, **validation_errors})
+        if key is None:
+            return result
+        return self._store_cached(key, result)
+
+    def _parse_and_validate(
+        self, file_content: ConfigSource
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        config, parsing_errors = self.parse_config(file_content)
+        validated_config, validation_errors = self.validate_config(config)
+        return validated_config, {**parsing_errors, **validation_errors}
+
+    def parse_and_validate_file(
+        self,
+        path: str | os.PathLike,
+        disk_cache: bool | str | os.PathLike = False,
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Parse and validate the config file at path, like
+        parse_and_validate.
+
+        With disk_cache (True for the default directory, see
+        persistent_cache.default_directory, or the path of a directory), the
+        results are kept on disk and used again, by any process, as
+        long as the content of the file and the options and types are
+        the same. Only the options whose type has the "io" workload are
+        validated again, since their results can depend on more than
+        their values.
+
+        The entries are pickles, which can run code when they are read:
+        the cache is only used if the directory is owned by the current
+        user and nobody else can write to it (a new directory is created
+        that way). It isn't used either if the types' functions read
+        values that can't be pickled, since their changes couldn't be
+        detected.
+        """
+        fingerprint = self._get_fingerprint() if disk_cache else None
+        if fingerprint is None:
+            config, parsing_errors = self.parse_config_file(path)
+            validated_config, validation_errors = self.validate_config(config)
+            return validated_config, {**parsing_errors, **validation_errors}
+
+        import hashlib
+        import type_config.persistent_cache as persistent_cache
 
+        directory = persistent_cache.default_directory() if disk_cache is True else disk_cache
+        with open(path, "rb") as file:
+            content = file.read()
+        content_hash = hashlib.blake2b(content, digest_size=16).digest()
+
+        entry = persistent_cache.read_entry(directory, path, fingerprint, content_hash)
+        if entry is not None:
+            return self._validate_cached(*entry)
+
+        config, parsing_errors = self.parse_config(content)
+        validated_config, validation_errors = self.validate_config(config)
+        persistent_cache.write_entry(
+            directory,
+            path,
+            fingerprint,
+            content_hash,
+            (config, validated_config, parsing_errors, validation_errors),
+        )
+        return validated_config, {**parsing_errors, **validation_errors}
+
+    def _validate_cached(
+        self,
+        config: Dict[str, str],
+        validated_config: Dict[str, Any] | None,
+        parsing_errors: Dict[str, str],
+        validation_errors: Dict[str, str],
+    ) -> Tuple[Dict[str, Any], Dict[str, str]]:
+        """
+        Return the results of an entry of the disk cache, validating
+        the values that weren't stored and the ones of "io" types.
+        The results are in the same order as without the cache.
+        """
+        if validated_config is None:
+            validated_config, validation_errors = self.validate_config(config)
+            return validated_config, {**parsing_errors, **validation_errors}
+
+        io_types = {
+            type for type, type_info in self._options_types.items() if type_info.workload == parallel.IO
+        }
+        if not io_types:
+            return validated_config, {**parsing_errors, **validation_errors}
+
+        options = self._options
+        plan = self._get_plan()
+        errors = dict(parsing_errors)
+        validated = dict()
         for option, value in config.items():
+            option_info = options.get(option, None)
+            if option_info is None or option_info.type not in io_types:
+                if option in validated_config:
+                    validated[option] = validated_config[option]
+                else:
+                    errors[option] = validation_errors[option]
+                continue
             try:
-                validated_config[option] = self._validate_option(option, value)
+                validated[option] = plan[option](value)
             except er.ValidationError as err:
                 errors[option] = str(err)
+        return validated, errors
+
+    def _get_fingerprint(self) -> bytes | None:
+        """
+        Return the hash of the options and types that keys the
+        disk cache, or None if it can't be computed. The options' part
+        is computed again when they change; the types' functions are
+        described each time, since the values they read can change.
+        """
+        import type_config.persistent_cache as persistent_cache
 
-        return validated_config, errors
+        if self._options_fingerprint_version != self._schema_version:
+            self._options_fingerprint = persistent_cache.options_fingerprint(self._options.values())
+            self._options_fingerprint_version = self._schema_version
+        return persistent_cache.schema_fingerprint(
+            self._options_fingerprint, self._normalize_keys, self._options_types.values()
+        )
+
+    def _cache_key(self, file_content: ConfigSource) -> Tuple[bytes, int] | None:
+        """
+        Return the key of the given content in the cache, or None
+        if it can't be cached.
+        """
+        if not self._cache_size or not isinstance(file_content, (str, bytes)):
+            return None
+
+        import hashlib
+
+        content = file_content.encode("utf-8") if isinstance(file_content, str) else file_content
+        return (hashlib.blake2b(content, digest_size=16).digest(), self._schema_version)
+
+    def _get_cached(self, key: Tuple[bytes, int]) -> Tuple[Mapping, Mapping] | None:
+        with self._cache_lock:
+            result = self._cache.get(key, None)
+            if result is None:
+                self._cache_misses += 1
+                return None
+
+            self._cache_hits += 1
+            self._cache.move_to_end(key)
+            return result
+
+    def _store_cached(
+        self, key: Tuple[bytes, int], result: Tuple[Dict, Dict]
+    ) -> Tuple[Mapping, Mapping]:
+        validated_config, errors = result
+        result = (MappingProxyType(validated_config), MappingProxyType(errors))
+        with self._cache_lock:
+            self._cache[key] = result
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+        return result
+
+    def cache_info(self) -> Dict[str, int]:
+        """
+        Return the hits, misses, current size and maximum size
+        of the parse_and_validate cache.
+        """
+        with self._cache_lock:
+            return {
+                "hits": self._cache_hits,
+                "misses": self._cache_misses,
+                "size": len(self._cache),
+                "max_size": self._cache_size,
+            }
+
+    def clear_cache(self):
+        """
+        Empty the parse_and_validate cache and reset its counters.
+        """
+        with self._cache_lock:
+            self._cache.clear()
+            self._cache_hits = 0
+            self._cache_misses = 0
 
     def merge_config(
         self, overwriting_config: Dict[str, Any], overwritable_config: Dict[str, Any]
@@ -163,20 +1130,20 @@ class TypeConfig:
         is raised.
         """
         result_config = {}
+        overwriting_config = self._resolve_keys(overwriting_config)
+        overwritable_config = self._resolve_keys(overwritable_config)
         options = set([*overwriting_config.keys(), *overwritable_config.keys()])
 
         for option in options:
             option_info = self._options.get(option, None)
             if not option_info:
-                raise er.ParsingError(
-                    f"[{option}]: is not part of the expected options."
-                )
+                raise er.ParsingError(self._unknown_option_error(option))
 
             result_value = None
             overwriting_value = overwriting_config.get(option, None)
             overwrited_value = overwritable_config.get(option, None)
-            default_value = option_info["default"]
-            can_be_empty = option_info["can_be_empty"]
+            default_value = option_info.default
+            can_be_empty = option_info.can_be_empty
 
             if overwriting_value is not None:
                 result_value = overwriting_value
@@ -193,16 +1160,135 @@ class TypeConfig:
 
         return result_config
 
-    def _formatter(self, option_info, add_type=False):
-        help = "\n".join([f"# {line}" for line in option_info["help"].splitlines()]) 
-        important_help = "\n".join([f"# !!! {line}" for line in option_info["important_help"].splitlines()]) 
+    def _get_merge_plan(self) -> Dict[str, Tuple[Any, bool]]:
+        """
+        Return, for each option, the value used by merge_configs when
+        no layer has one (its default, or None) and whether it can be
+        empty, {option: (default, can_be_empty)}.
+        They are prepared again when the options change.
+        """
+        if self._merge_plan_version == self._schema_version:
+            return self._merge_plan
+
+        self._merge_plan = {
+            option: (option_info.default if option_info.default else None, option_info.can_be_empty)
+            for option, option_info in self._options.items()
+        }
+        self._merge_plan_version = self._schema_version
+        return self._merge_plan
+
+    def merge_configs(
+        self, *layers: Mapping[str, Any], provenance: bool = False
+    ) -> Tuple[Dict[str, Any], ...]:
+        """
+        Merge any number of configs (layers) in one pass, without
+        modifying them nor validating their values: the values of the
+        later layers are preferred to the ones of the earlier layers,
+        like merging them two at a time with merge_config.
+        Return a tuple containing the merged config and a dictionary
+        with the options that are unknown or left empty and their errors.
+
+        If provenance is True, a third dictionary tells where each
+        value comes from: the index of its layer, "default" or None
+        (an empty option).
+        """
+        values: Dict[str, Any] = {}
+        sources: Dict[str, int] = {}
+        for index, layer in enumerate(layers):
+            for option, value in self._resolve_keys(layer).items():
+                # Only None values are overwritten
+                if value is not None:
+                    values[option] = value
+                    sources[option] = index
+                elif option not in values:
+                    values[option] = None
 
-        result = (
-            "[{type}] {option} = {default}\n" if add_type else "{option} = {default}\n"
+        merge_plan = self._get_merge_plan()
+        merged_config = {}
+        errors = {}
+        for option, value in values.items():
+            settings = merge_plan.get(option, None)
+            if settings is None:
+                errors[option] = self._unknown_option_error(option)
+            elif value is not None:
+                merged_config[option] = value
+            elif settings[0] is not None:
+                merged_config[option] = settings[0]
+                sources[option] = "default"
+            elif settings[1]:
+                merged_config[option] = None
+            else:
+                errors[option] = f"[{option}]: can't be left empty"
+
+        if not provenance:
+            return merged_config, errors
+        return (
+            merged_config,
+            errors,
+            {option: sources.get(option, None) for option in merged_config},
         )
-        result += f"{important_help}\n" if important_help else ""
-        result += help
-        return result.format(**option_info)
+
+    def _get_templates(self) -> List[Tuple[str, str, Any, str]]:
+        """
+        Return, for each option, the parts of its text that don't
+        change between renders: (option, text before the value,
+        default value, text after the value).
+        They are prepared again when the options, the types or
+        type_hint change.
+        """
+        key = (self._schema_version, bool(self.type_hint))
+        if self._templates_key == key:
+            return self._templates
+
+        templates = []
+        for option, option_info in self._options.items():
+            if self.type_hint:
+                header = f"[{option_info.type}] {option} = "
+            else:
+                header = f"{option} = "
+            templates.append((option, header, option_info.default, f"\n{option_info.comment}"))
+
+        self._templates = templates
+        self._templates_key = key
+        return templates
+
+    def _iter_formatted(self, values: Mapping[str, Any]) -> Iterator[str]:
+        """
+        Yield the formatted options, separated by empty lines, using
+        the given values in place of the defaults.
+        """
+        separator = ""
+        for option, header, default, comment in self._get_templates():
+            yield f"{separator}{header}{values.get(option, default)}{comment}"
+            separator = "\n\n"
+
+    def _format(self, values: Mapping[str, Any]) -> str:
+        """
+        Return all the text yielded by _iter_formatted.
+        """
+        return "\n\n".join(
+            [
+                f"{header}{values.get(option, default)}{comment}"
+                for option, header, default, comment in self._get_templates()
+            ]
+        )
+
+    def _write_chunks(self, file: IO, chunks: Iterable[str]):
+        """
+        Write the chunks to a text or binary file (encoded as UTF-8).
+        """
+        if isinstance(file, (io.RawIOBase, io.BufferedIOBase)):
+            for chunk in chunks:
+                file.write(chunk.encode("utf-8"))
+        else:
+            for chunk in chunks:
+                file.write(chunk)
+
+    def iter_config_chunks(self, values_to_inject: Dict[str, str]={}) -> Iterator[str]:
+        """
+        Yield the text returned by create_config one option at a time.
+        """
+        return self._iter_formatted(values_to_inject)
 
     def create_config(self, values_to_inject: Dict[str, str]={}) -> str:
         """
@@ -211,46 +1297,115 @@ class TypeConfig:
         If values_to_inject is given, the pairs in the dictionary
         overwrite the default option's value when writing.
         """
-        options_to_write = []
-        for option_info in self._options.values():
-            option_info_copy = option_info.copy()
+        return self._format(values_to_inject)
 
-            if option_info_copy["option"] in values_to_inject:
-                option_info_copy["default"] = values_to_inject[option_info_copy["option"]]
+    def write_config(self, file: IO, values_to_inject: Dict[str, str]={}):
+        """
+        Write the text returned by create_config to the given open file,
+        one option at a time.
+        """
+        self._write_chunks(file, self._iter_formatted(values_to_inject))
 
-            options_to_write.append(
-                self._formatter(option_info_copy, self.type_hint)
-            )
+    def iter_healed_chunks(self, file_content: ConfigSource) -> Iterator[str]:
+        """
+        Yield the text returned by heal_config one option at a time.
+        """
+        return self._iter_formatted(self._healed_values(file_content))
 
-        return "\n\n".join(options_to_write)
+    def _heal(self, file_content: ConfigSource) -> Tuple[Dict[str, str], Dict[str, List[str]]]:
+        """
+        Read the given file in one pass and return the values that
+        heal_config keeps, along with the report of heal_config_report.
+        """
+        values = {}
+        lines = {}
+        dropped = []
+        resolve = self._index.resolve if self._index.is_needed else None
+        for line in self._read_lines(file_content):
+            line = line.strip()
+            if not line or line[0] == "#":
+                continue
+            # Probably two options on the same line
+            if line.count("=") > 1:
+                dropped.append(line)
+                continue
+            try:
+                option, value = self._get_option(line)
+            except er.ParsingError:
+                dropped.append(line)
+                continue
+            if resolve is not None:
+                option = resolve(option)
+            if option not in self._options:
+                dropped.append(line)
+                continue
+
+            # When an option is repeated, the last value is used
+            if option in lines:
+                dropped.append(lines[option])
+            values[option] = value
+            lines[option] = line
 
-    def heal_config(self, file_content: str) -> str:
+        # The existing values are written in place of the defaults
+        values = {option: value for option, value in values.items() if value}
+        report = {
+            "kept": [option for option in self._options if option in values],
+            "dropped": dropped,
+            "defaulted": [option for option in self._options if option not in values],
+        }
+        return values, report
+
+    def _healed_values(self, file_content: ConfigSource) -> Dict[str, str]:
+        """
+        Return the values of the given file that heal_config keeps.
+        """
+        values, _ = self._heal(file_content)
+        return values
+
+    def heal_config(self, file_content: ConfigSource) -> str:
         """
         Restore the config file when corrupted.
         If an {option: value} pair isn't corrupted,
         the value is stored and the user's configuration
         retained, else the default value is used.
+        Broken lines and unknown options are dropped.
+        The TypeConfig's options are left untouched.
         """
-        cleaned_file = self._clean_file(file_content)
+        if self._profile is not None:
+            with self._profile.method("heal_config", file_content) as file_content:
+                return self._format(self._healed_values(file_content))
+        return self._format(self._healed_values(file_content))
 
-        config = dict()
-        for line in cleaned_file.splitlines():
-            value = None
-            if line.count("=") > 1:
-                continue
-            option, value = self._get_option(line)
-            config[option] = value
+    def heal_config_report(
+        self, file_content: ConfigSource
+    ) -> Tuple[str, Dict[str, List[str]]]:
+        """
+        Return the text returned by heal_config and a report with:
+            - "kept": the options whose value was kept
+            - "dropped": the lines that were removed
+            - "defaulted": the options written with their default value
+        """
+        values, report = self._heal(file_content)
+        return self._format(values), report
 
-        options_to_write = []
-        for option_info in self._options.values():
-            option = option_info["option"]
-            # Overwriting the stored info gives a new default
-            # to maintain the existing values
-            if option in config and config[option]:
-                option_info["default"] = config[option]
+    def heal_config_to(self, file: IO, file_content: ConfigSource):
+        """
+        Write the text returned by heal_config to the given open file,
+        one option at a time.
+        """
+        self._write_chunks(file, self.iter_healed_chunks(file_content))
+
+
+def __getattr__(name: str) -> Any:
+    # Import the classes of the other modules when they are first used
+    module = _LAZY_NAMES.get(name, None)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    import importlib
+
+    value = globals()[name] = getattr(importlib.import_module(module), name)
+    return value
 
-            options_to_write.append(
-                self._formatter(option_info, self.type_hint)
-            )
 
-        return "\n\n".join(options_to_write)
+def __dir__() -> List[str]:
+    return sorted({*globals(), *_LAZY_NAMES})
@@ -0,0 +1,161 @@
+from collections.abc import Awaitable
+from functools import partial
+from types import FunctionType, MethodType
+from typing import Tuple, Dict, Any, Callable, Collection, Mapping
+
+import type_config.errors as er
+
+# The flag of the code of coroutine functions (inspect.CO_COROUTINE)
+_CO_COROUTINE = 0x80
+
+
+def is_asynchronous(function: Callable | None) -> bool:
+    """
+    Whether the given function is a coroutine function
+    (it has to be awaited).
+    Like inspect.iscoroutinefunction, without importing inspect,
+    which is slow: this is used by TypeConfig.compile.
+    """
+    while isinstance(function, partial):
+        function = function.func
+    if isinstance(function, MethodType):
+        function = function.__func__
+    elif function is not None and not isinstance(function, FunctionType):
+        # Objects with an async def __call__
+        function = getattr(type(function), "__call__", None)
+    return isinstance(function, FunctionType) and bool(function.__code__.co_flags & _CO_COROUTINE)
+
+
+def reject_asynchronous_value(option: str, type: str, value: Any) -> Any:
+    """
+    Used by the synchronous validation for the options with an
+    asynchronous type, which can't be validated without awaiting.
+    """
+    raise er.ValidationError(
+        f"[{option}]: the type [{type}] is asynchronous, use avalidate_config."
+    )
+
+
+async def avalidate_value(
+    option: str,
+    type: str,
+    empty_value: Any,
+    can_be_empty: bool,
+    validate: Callable[[Any], Any],
+    cast: Callable[[Any], Any],
+    error: str,
+    value: Any,
+) -> Any:
+    """
+    Asynchronous version of type_config._validate_value: validate
+    and cast can be either normal functions or coroutine functions,
+    or return awaitables.
+    """
+    if not value:
+        value = empty_value
+        if not value and not can_be_empty:
+            raise er.ValidationError(f"[{option}]: can't be left empty.")
+
+    if validate is None:
+        raise er.ValidationError(f"[{type}]: is not part of the expected types.")
+
+    is_valid = validate(value)
+    if isinstance(is_valid, Awaitable):
+        is_valid = await is_valid
+    if not is_valid:
+        raise er.ValidationError(f"[{option}]: {error} (value: {value})")
+
+    result = cast(value)
+    if isinstance(result, Awaitable):
+        result = await result
+    return result
+
+
+async def aparse_value(
+    option: str,
+    type: str,
+    empty_value: Any,
+    can_be_empty: bool,
+    parse: Callable[[Any], Any],
+    error: str,
+    value: Any,
+) -> Any:
+    """
+    Asynchronous version of type_config._parse_value: parse can be
+    a normal function or a coroutine function, or return an awaitable.
+    """
+    if not value:
+        value = empty_value
+        if not value:
+            if not can_be_empty:
+                raise er.ValidationError(f"[{option}]: can't be left empty.")
+            return None
+
+    try:
+        result = parse(value)
+        if isinstance(result, Awaitable):
+            result = await result
+        return result
+    except (ValueError, TypeError, er.ValidationError) as err:
+        raise er.ValidationError(f"[{option}]: {error or err} (value: {value})") from err
+
+
+async def avalidate_with_plan(
+    asynchronous_plan: Mapping[str, Callable[[Any], Any]],
+    concurrent_options: Collection[str],
+    config: Mapping[str, Any],
+    max_concurrency: int | None = None,
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Validate config like TypeConfig.validate_config, with the
+    coroutine functions of asynchronous_plan: the concurrent_options
+    (the ones with an asynchronous type) are awaited concurrently, at
+    most max_concurrency at a time if given, and the others one after
+    the other, without going through the event loop unless what they
+    return has to be awaited.
+    """
+    # Imported here: compile uses this module without an event loop,
+    # and importing asyncio is slow
+    import asyncio
+
+    semaphore = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+
+    async def limited(validator: Callable[[Any], Any], value: Any) -> Any:
+        async with semaphore:
+            return await validator(value)
+
+    awaiting_options = []
+    awaitables = []
+    for option, value in config.items():
+        if option in concurrent_options:
+            validator = asynchronous_plan[option]
+            awaiting_options.append(option)
+            awaitables.append(limited(validator, value) if semaphore else validator(value))
+
+    results = dict(
+        zip(awaiting_options, await asyncio.gather(*awaitables, return_exceptions=True))
+    )
+
+    errors = dict()
+    validated_config = dict()
+    for option, value in config.items():
+        if option in results:
+            result = results[option]
+            if isinstance(result, er.ValidationError):
+                errors[option] = str(result)
+            elif isinstance(result, BaseException):
+                raise result
+            else:
+                validated_config[option] = result
+            continue
+
+        validator = asynchronous_plan.get(option, None)
+        if validator is None:
+            errors[option] = f"[{option}]: is not part of the expected options."
+            continue
+        try:
+            validated_config[option] = await validator(value)
+        except er.ValidationError as err:
+            errors[option] = str(err)
+
+    return validated_config, errors
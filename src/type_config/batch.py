@@ -0,0 +1,130 @@
+from typing import List, Tuple, Dict, Any, Callable, Mapping, Sequence
+
+import type_config.errors as er
+from type_config.specs import OptionSpec, TypeSpec
+
+
+def validate_many(
+    options: Mapping[str, OptionSpec],
+    types: Mapping[str, TypeSpec],
+    plan: Mapping[str, Callable[[Any], Any]],
+    configs: Sequence[Mapping[str, Any]],
+) -> List[Tuple[Dict[str, Any], Dict[str, str]]]:
+    """
+    Validate many configs like TypeConfig.validate_config, one option
+    at a time: all the values of an option (a column) are gathered
+    and, if its type has validate_batch or cast_batch, checked with a
+    single call.
+    Return a (validated, errors) tuple for each config, in the same order.
+    """
+    columns: Dict[str, List[Tuple[int, Any]]] = {}
+    for index, config in enumerate(configs):
+        for option, value in config.items():
+            column = columns.get(option, None)
+            if column is None:
+                column = columns[option] = []
+            column.append((index, value))
+
+    # {option: value} or {option: ValidationError} for each config
+    results: List[Dict[str, Any]] = [{} for _ in configs]
+    for option, column in columns.items():
+        validator = plan.get(option, None)
+        if validator is None:
+            error = er.ValidationError(f"[{option}]: is not part of the expected options.")
+            for index, _ in column:
+                results[index][option] = error
+            continue
+
+        type_info = types.get(options[option].type, None)
+        if type_info and (type_info.validate_batch or type_info.cast_batch):
+            _validate_column(option, options[option], type_info, column, results)
+            continue
+
+        for index, value in column:
+            try:
+                results[index][option] = validator(value)
+            except er.ValidationError as err:
+                results[index][option] = err
+
+    validated_configs = []
+    for config, result in zip(configs, results):
+        errors = dict()
+        validated_config = dict()
+        for option in config:
+            value = result[option]
+            if isinstance(value, er.ValidationError):
+                errors[option] = str(value)
+            else:
+                validated_config[option] = value
+        validated_configs.append((validated_config, errors))
+
+    return validated_configs
+
+
+def _validate_column(
+    option: str,
+    option_info: OptionSpec,
+    type_info: TypeSpec,
+    column: List[Tuple[int, Any]],
+    results: List[Dict[str, Any]],
+):
+    """
+    Validate all the values of an option with its type's batch functions,
+    falling back to the normal ones for what is missing.
+    """
+    empty_value = option_info.default if option_info.default else None
+    can_be_empty = option_info.can_be_empty
+
+    indexes = []
+    values = []
+    for index, value in column:
+        if not value:
+            value = empty_value
+            if not value and not can_be_empty:
+                results[index][option] = er.ValidationError(f"[{option}]: can't be left empty.")
+                continue
+        indexes.append(index)
+        values.append(value)
+    if not values:
+        return
+
+    validate_batch = type_info.validate_batch
+    if validate_batch:
+        are_valid = validate_batch(values)
+        _check_length(type_info, "validate_batch", are_valid, values)
+    else:
+        validate = type_info.validate
+        are_valid = [validate(value) for value in values]
+
+    valid_indexes = []
+    valid_values = []
+    for index, value, is_valid in zip(indexes, values, are_valid):
+        if is_valid:
+            valid_indexes.append(index)
+            valid_values.append(value)
+        else:
+            results[index][option] = er.ValidationError(
+                f"[{option}]: {type_info.error} (value: {value})"
+            )
+
+    cast_batch = type_info.cast_batch
+    if cast_batch:
+        casted_values = cast_batch(valid_values) if valid_values else []
+        _check_length(type_info, "cast_batch", casted_values, valid_values)
+    else:
+        cast = type_info.cast
+        casted_values = [cast(value) for value in valid_values]
+
+    for index, value in zip(valid_indexes, casted_values):
+        results[index][option] = value
+
+
+def _check_length(type_info: TypeSpec, hook: str, results: Sequence[Any], values: List[Any]):
+    """
+    Raise a ValueError if a batch function didn't return one result
+    for each value (zip would silently drop the values left).
+    """
+    if len(results) != len(values):
+        raise ValueError(
+            f"[{type_info.type}]: {hook} returned {len(results)} results for {len(values)} values."
+        )
@@ -0,0 +1,326 @@
+"""
+Write the source of a Python module with a parse_and_validate function
+specialized for the options and types of a TypeConfig
+(see TypeConfig.generate_module).
+
+Each option gets its own validator, with its name, default, whether it
+can be empty and its error messages written in the code, found in a
+dictionary by the option's name. The types' functions are imported by
+their qualified name (partials of them are rebuilt, other picklable
+callables are unpickled), or given to the module's bind function when
+they are in the registry.
+"""
+import ast
+import pickle
+from functools import partial
+from typing import Any, Callable, Dict, List, Mapping
+
+import type_config.asynchronous as asynchronous
+import type_config.serialization as serialization
+from type_config.specs import OptionSpec, TypeSpec
+
+_HEADER = '''"""
+Generated by TypeConfig.generate_module, don't edit it: generate it
+again when the options or types change.
+
+parse_and_validate(text) returns the same results as the TypeConfig's
+parse_config followed by validate_config.
+"""
+'''
+
+_PARSE_AND_VALIDATE = '''
+
+def _unknown_option_error(option):
+    error = f"[{{option}}]: is not part of the expected options."
+    suggestions = _suggest(_KEYS, {key})
+    if suggestions:
+        error += f" Did you mean {{' or '.join(f'[{{name}}]' for name in suggestions)}}?"
+    return error
+
+
+def parse_and_validate(text):
+    """
+    Parse and validate the given config (a string or UTF-8 bytes).
+    Return a tuple containing the validated data and a dictionary
+    with both the parsing and the validation errors.
+    """
+    if isinstance(text, (bytes, bytearray)):
+        text = text.decode("utf-8")
+
+    config = {{}}
+    errors = {{}}
+    for line in text.splitlines():
+        line = line.strip()
+        if not line or line[0] == "#":
+            continue
+        start = line.find("]") + 1
+        end = line.find("#", start)
+        if end == -1:
+            end = len(line)
+        equal_sign = line.find("=", start, end)
+        if equal_sign == -1 or equal_sign == start:
+            errors[line] = "A broken line has been found."
+            continue
+        option = line[start:equal_sign].strip()
+{resolve}        config[option] = line[equal_sign + 1 : end].strip()
+
+    validated_config = {{}}
+    validators = _VALIDATORS
+    for option, value in config.items():
+        validator = validators.get(option, None)
+        if validator is None:
+            errors[option] = _unknown_option_error(option)
+            continue
+        try:
+            validated_config[option] = validator(value)
+        except _ValidationError as err:
+            errors[option] = str(err)
+
+    return validated_config, errors
+'''
+
+
+def _literal(value: Any) -> str | None:
+    """
+    Return the Python literal of value, or None if it can't be written
+    as one (the literal must give back an equal value of the same type).
+    """
+    text = repr(value)
+    try:
+        result = ast.literal_eval(text)
+    except (ValueError, TypeError, SyntaxError, MemoryError, RecursionError):
+        return None
+    return text if type(result) is type(value) and result == value else None
+
+
+class _ModuleWriter:
+    """
+    Collect the imports, the functions and the registry names used by
+    the generated code.
+    """
+
+    def __init__(self, registry: Mapping[str, Callable]) -> None:
+        self.registry_names = {id(function): name for name, function in registry.items()}
+        self.modules: Dict[str, str] = {}
+        self.uses_partial = False
+        self.uses_pickle = False
+        # {id(function): its name in the module}
+        self.functions: Dict[int, str] = {}
+        # The functions and the constants that aren't literals
+        self.definitions: List[str] = []
+        # {name in the module: name in the registry}
+        self.bound: Dict[str, str] = {}
+
+    def module(self, name: str) -> str:
+        alias = self.modules.get(name, None)
+        if alias is None:
+            alias = self.modules[name] = f"_module_{len(self.modules)}"
+        return alias
+
+    def constant(self, value: Any) -> str:
+        """
+        Return the expression of value: a literal, or the name of a
+        constant unpickled when the module is imported.
+        """
+        literal = _literal(value)
+        if literal is not None:
+            return literal
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+        self.uses_pickle = True
+        name = f"_constant_{len(self.definitions)}"
+        self.definitions.append(f"{name} = _pickle.loads({data!r})")
+        return name
+
+    def _expression(self, type: str, function: Callable) -> str | None:
+        name = serialization.qualified_name(function)
+        if name is not None:
+            module, _, attributes = name.partition(":")
+            return f"{self.module(module)}.{attributes}"
+
+        if isinstance(function, partial):
+            arguments = [self._expression(type, function.func)]
+            arguments.extend(_literal(argument) for argument in function.args)
+            for keyword, argument in function.keywords.items():
+                literal = _literal(argument)
+                arguments.append(None if literal is None else f"{keyword}={literal}")
+            if None not in arguments:
+                self.uses_partial = True
+                return f"_partial({', '.join(arguments)})"
+
+        if getattr(function, "__code__", None) is not None:
+            # Lambdas and nested functions can't be pickled
+            return None
+        try:
+            data = pickle.dumps(function, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            return None
+        self.uses_pickle = True
+        return f"_pickle.loads({data!r})"
+
+    def function(self, type: str, function: Callable) -> str:
+        """
+        Return the name of function in the generated module.
+        """
+        name = self.functions.get(id(function), None)
+        if name is not None:
+            return name
+        name = self.functions[id(function)] = f"_function_{len(self.definitions)}"
+
+        registry_name = self.registry_names.get(id(function), None)
+        if registry_name is not None:
+            self.bound[name] = registry_name
+            self.definitions.append(f"{name} = None  # bind: {registry_name!r}")
+            return name
+
+        expression = self._expression(type, function)
+        if expression is None:
+            raise ValueError(
+                f"[{type}]: {function!r} can't be imported by name, add it to the registry."
+            )
+        self.definitions.append(f"{name} = {expression}")
+        return name
+
+
+def _validator_lines(
+    writer: _ModuleWriter, name: str, option_info: OptionSpec, type_info: TypeSpec | None
+) -> List[str]:
+    """
+    Return the code of the validator of an option, doing what
+    TypeConfig._validate_value or _parse_value would do.
+    """
+    option = option_info.option
+    lines = [f"def {name}(value):"]
+    if type_info is not None and (
+        asynchronous.is_asynchronous(type_info.parse)
+        if type_info.parse is not None
+        else asynchronous.is_asynchronous(type_info.validate) or asynchronous.is_asynchronous(type_info.cast)
+    ):
+        message = f"[{option}]: the type [{type_info.type}] is asynchronous, use avalidate_config."
+        lines.append(f"    raise _ValidationError({message!r})")
+        return lines
+
+    is_parsed = type_info is not None and type_info.parse is not None
+    empty_error = f"[{option}]: can't be left empty."
+    lines.append("    if not value:")
+    if option_info.default:
+        lines.append(f"        value = {writer.constant(option_info.default)}")
+    elif not option_info.can_be_empty:
+        lines.append(f"        raise _ValidationError({empty_error!r})")
+    elif is_parsed:
+        lines.append("        return None")
+    else:
+        lines.append("        value = None")
+
+    if type_info is None:
+        message = f"[{option_info.type}]: is not part of the expected types."
+        lines.append(f"    raise _ValidationError({message!r})")
+        return lines
+
+    # What has to be awaited is rejected, like _validate_value does
+    reject = f"_reject_awaitable({option!r}, {type_info.type!r}, {{name}})"
+    check = "_AWAITABLE_TYPES.get({name}.__class__) is not False and _is_awaitable({name})"
+    if is_parsed:
+        parse = writer.function(type_info.type, type_info.parse)
+        lines.append("    try:")
+        lines.append(f"        result = {parse}(value)")
+        lines.append("    except (ValueError, TypeError, _ValidationError) as err:")
+        if type_info.error:
+            message = f"[{option}]: {type_info.error}"
+            lines.append(f'        raise _ValidationError({message!r} + f" (value: {{value}})") from err')
+        else:
+            prefix = f"[{option}]: "
+            lines.append(f'        raise _ValidationError({prefix!r} + f"{{err}} (value: {{value}})") from err')
+        lines.append(f"    if {check.format(name='result')}:")
+        lines.append(f"        {reject.format(name='result')}")
+        lines.append("    return result")
+        return lines
+
+    validate = writer.function(type_info.type, type_info.validate)
+    cast = writer.function(type_info.type, type_info.cast)
+    message = f"[{option}]: {type_info.error}"
+    lines.append(f"    is_valid = {validate}(value)")
+    lines.append("    if is_valid:")
+    lines.append(f"        if is_valid is not True and {check.format(name='is_valid')}:")
+    lines.append(f"            {reject.format(name='is_valid')}")
+    lines.append(f"        result = {cast}(value)")
+    lines.append(f"        if {check.format(name='result')}:")
+    lines.append(f"            {reject.format(name='result')}")
+    lines.append("        return result")
+    lines.append(f'    raise _ValidationError({message!r} + f" (value: {{value}})")')
+    return lines
+
+
+def generate_module(
+    options: Mapping[str, OptionSpec],
+    types: Mapping[str, TypeSpec],
+    keys: Mapping[str, str],
+    normalize: Callable[[str], str] | None,
+    registry: Mapping[str, Callable],
+) -> str:
+    """
+    Return the source of the module (see TypeConfig.generate_module).
+    keys are the option names and aliases, {normalized key: option}.
+    """
+    writer = _ModuleWriter(registry)
+    validators = []
+    dispatch = []
+    for index, (option, option_info) in enumerate(options.items()):
+        name = f"_option_{index}"
+        validators.append("")
+        validators.append("")
+        validators.extend(_validator_lines(writer, name, option_info, types.get(option_info.type, None)))
+        dispatch.append(f"    {option!r}: {name},")
+
+    if normalize is not None:
+        key = f"{writer.function('normalize_keys', normalize)}(option)"
+    else:
+        key = "option"
+    # Like OptionIndex.is_needed
+    if normalize is not None or len(keys) != len(options):
+        resolve = f"        option = _KEYS.get({key}, option)\n"
+    else:
+        resolve = ""
+
+    lines = [_HEADER]
+    if writer.uses_partial:
+        lines.append("from functools import partial as _partial")
+    for module, alias in writer.modules.items():
+        lines.append(f"import {module} as {alias}")
+    if writer.uses_pickle:
+        lines.append("import pickle as _pickle")
+    lines.append("")
+    lines.append("from type_config import _AWAITABLE_TYPES, _is_awaitable, _reject_awaitable")
+    lines.append("from type_config.errors import ValidationError as _ValidationError")
+    lines.append("from type_config.lookup import suggest as _suggest")
+    lines.append("")
+    lines.append("# The functions of the types and the defaults that aren't literals")
+    lines.extend(writer.definitions)
+    lines.append("")
+    lines.append("# The functions that must be given to bind, by their name in the registry")
+    lines.append(f"REGISTRY_NAMES = {tuple(writer.bound.values())!r}")
+    lines.append("")
+    lines.append("")
+    lines.append("def bind(registry):")
+    lines.append('    """')
+    lines.append("    Set the functions of REGISTRY_NAMES from registry ({name: function}).")
+    lines.append('    """')
+    if writer.bound:
+        lines.append(f"    global {', '.join(writer.bound)}")
+        for name, registry_name in writer.bound.items():
+            lines.append(f"    {name} = registry[{registry_name!r}]")
+    else:
+        lines.append("    pass")
+    lines.extend(validators)
+    lines.append("")
+    lines.append("")
+    lines.append("# {option: validator}")
+    lines.append("_VALIDATORS = {")
+    lines.extend(dispatch)
+    lines.append("}")
+    lines.append("")
+    lines.append("# The names and aliases of the options, {normalized name: option}")
+    lines.append("_KEYS = {")
+    lines.extend(f"    {key_name!r}: {option!r}," for key_name, option in keys.items())
+    lines.append("}")
+
+    return "\n".join(lines) + _PARSE_AND_VALIDATE.format(key=key, resolve=resolve)
@@ -0,0 +1,114 @@
+import itertools
+import mmap
+import os
+import re
+from typing import Tuple, Callable, Iterator
+
+# A function parsing a string into ("option", option, value)
+# and ("error", line, error) events, like TypeConfig.parse_config_iter
+ParseText = Callable[[str], Iterator[Tuple[str, str, str]]]
+
+# Bytes that make a line different when read as a string: the line
+# breaks of str.splitlines other than "\n" (a "\r" before "\n" is
+# just a Windows line ending) and the ASCII characters that str.strip
+# removes while bytes.strip doesn't.
+_SPECIAL_BYTES = (
+    b"\x0b", b"\x0c", b"\x1c", b"\x1d", b"\x1e", b"\x1f",
+    b"\xc2\x85", b"\xe2\x80\xa8", b"\xe2\x80\xa9",
+)
+_LONE_CARRIAGE_RETURN = re.compile(rb"\r(?!\n)")
+_SPECIAL_LINE_BYTES = re.compile(rb"[\r\x0b\x0c\x1c-\x1f]|\xc2\x85|\xe2\x80[\xa8\xa9]")
+
+_COMMENT = ord("#")
+
+# Lines that are neither empty nor comments, when no special bytes are present.
+# Starting from the "\n" before the line is much faster than using "^".
+_FIRST_CONTENT_LINE = re.compile(rb"[ \t\r]*([^#\s][^\n]*)")
+_CONTENT_LINE = re.compile(rb"\n[ \t\r]*([^#\s][^\n]*)")
+
+
+def parse_file(
+    path: str | os.PathLike, parse_text: ParseText
+) -> Iterator[Tuple[str, str, str]]:
+    """
+    Parse the UTF-8 file at path like TypeConfig.parse_config_iter,
+    yielding the same events.
+    The file is memory-mapped and scanned as bytes: only the options,
+    values and broken lines that are kept get decoded, while empty
+    lines and comments are skipped without decoding them.
+    parse_text is used for the lines that must be read as strings.
+    """
+    with open(path, "rb") as file:
+        if os.fstat(file.fileno()).st_size == 0:
+            return
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as buffer:
+            yield from _parse_buffer(buffer, parse_text)
+
+
+def _has_special_bytes(buffer: mmap.mmap) -> bool:
+    """
+    Whether some lines of the buffer must be read as strings.
+    Looking for each byte sequence is faster than a regular expression.
+    """
+    if any(buffer.find(special) != -1 for special in _SPECIAL_BYTES):
+        return True
+    return buffer.find(b"\r") != -1 and _LONE_CARRIAGE_RETURN.search(buffer) is not None
+
+
+def _parse_buffer(
+    buffer: mmap.mmap, parse_text: ParseText
+) -> Iterator[Tuple[str, str, str]]:
+    if not _has_special_bytes(buffer):
+        # Empty lines and comments are skipped by the regular expressions
+        first_line = _FIRST_CONTENT_LINE.match(buffer)
+        lines = _CONTENT_LINE.finditer(buffer)
+        for match in itertools.chain((first_line,) if first_line else (), lines):
+            line = match.group(1).strip()
+            if line.isascii():
+                yield _parse_ascii_line(line)
+            else:
+                yield from parse_text(line.decode("utf-8"))
+        return
+
+    find = buffer.find
+    end_of_file = len(buffer)
+    start = 0
+    while start < end_of_file:
+        end = find(b"\n", start)
+        if end == -1:
+            end = end_of_file
+        line = buffer[start:end].rstrip(b"\r")
+        start = end + 1
+
+        if _SPECIAL_LINE_BYTES.search(line):
+            yield from parse_text(line.decode("utf-8"))
+            continue
+
+        line = line.strip()
+        if not line or line[0] == _COMMENT:
+            continue
+        if line.isascii():
+            yield _parse_ascii_line(line)
+        else:
+            # Some unicode whitespace is stripped only from strings
+            yield from parse_text(line.decode("utf-8"))
+
+
+def _parse_ascii_line(line: bytes) -> Tuple[str, str, str]:
+    """
+    Parse a stripped ASCII line, that isn't empty nor a comment,
+    like TypeConfig._get_option.
+    """
+    option_start = line.find(b"]") + 1
+    option_end = line.find(b"#", option_start)
+    if option_end == -1:
+        option_end = len(line)
+    equal_sign = line.find(b"=", option_start, option_end)
+    if equal_sign == -1 or equal_sign == option_start:
+        return ("error", line.decode("ascii"), "A broken line has been found.")
+
+    return (
+        "option",
+        line[option_start:equal_sign].strip().decode("ascii"),
+        line[equal_sign + 1 : option_end].strip().decode("ascii"),
+    )
@@ -0,0 +1,74 @@
+from types import MappingProxyType
+from typing import Any, Tuple
+
+from type_config import TypeConfig
+
+
+class FrozenTypeConfig(TypeConfig):
+    """
+    A read-only copy of a TypeConfig, returned by TypeConfig.freeze.
+
+    Its options, types and type_hint can't be changed and everything
+    that depends on them is prepared when it's created, so all of its
+    methods can be called by many threads at the same time, without
+    locks (the parse_and_validate cache has its own).
+    """
+
+    def __init__(self, config: TypeConfig) -> None:
+        super().__init__(
+            type_hint=config.type_hint,
+            cache_size=config._cache_size,
+            normalize_keys=config._normalize_keys,
+        )
+        self._options = MappingProxyType(dict(config._options))
+        self._options_types = MappingProxyType(dict(config._options_types))
+        self._rebuild_index()
+        self.compile()
+        self._get_templates()
+        self._get_merge_plan()
+        self._get_fingerprint()
+        self._frozen = True
+
+    @property
+    def type_hint(self) -> bool:
+        return self._type_hint
+
+    @type_hint.setter
+    def type_hint(self, type_hint: bool):
+        if getattr(self, "_frozen", False):
+            raise AttributeError("FrozenTypeConfig can't be modified.")
+        self._type_hint = type_hint
+
+    def add_type(self, *args, **kwargs):
+        raise TypeError("FrozenTypeConfig can't be modified.")
+
+    def add_option(self, *args, **kwargs):
+        raise TypeError("FrozenTypeConfig can't be modified.")
+
+    def profile(self):
+        # Profiling compiles the validators again, which isn't thread-safe
+        raise TypeError("FrozenTypeConfig can't be profiled, profile the TypeConfig it comes from.")
+
+    def freeze(self) -> "FrozenTypeConfig":
+        return self
+
+    def __reduce__(self):
+        config = TypeConfig.__new__(TypeConfig)
+        TypeConfig.__setstate__(config, self.__getstate__())
+        return (FrozenTypeConfig, (config,))
+
+    def _key(self) -> Tuple[Any, ...]:
+        return (
+            self._type_hint,
+            self._normalize_keys,
+            tuple(self._options.values()),
+            tuple(self._options_types.values()),
+        )
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, FrozenTypeConfig):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self) -> int:
+        return hash(self._key())
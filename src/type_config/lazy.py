@@ -0,0 +1,107 @@
+from collections.abc import Mapping
+from typing import Any, Dict, Iterator
+
+import type_config.errors as er
+
+_MISSING = object()
+
+
+class LazyConfig(Mapping):
+    """
+    A read-only mapping returned by TypeConfig.load_lazy, with the
+    options of a parsed config, whose values are validated and casted
+    the first time they are read, and then kept.
+
+    Reading an option that isn't valid raises a ValidationError (each
+    time, without validating it again), while reading an option that
+    isn't in the config raises a KeyError.
+    validate_all validates everything that's left and returns all
+    the errors, including the broken lines found when parsing.
+
+    Two threads reading an option for the first time at the same time
+    can both validate it: the result is the same.
+    """
+
+    __slots__ = ("_config", "_plan", "_values", "_results", "_errors", "parsing_errors")
+
+    def __init__(self, config, values: Dict[str, str], parsing_errors: Dict[str, str]) -> None:
+        self._config = config
+        # The validators of when the config was loaded
+        self._plan = config._get_plan()
+        self._values = values
+        self._results: Dict[str, Any] = {}
+        self._errors: Dict[str, str] = {}
+        self.parsing_errors = parsing_errors
+
+    def __getitem__(self, option: str) -> Any:
+        try:
+            return self._results[option]
+        except KeyError:
+            pass
+
+        if option not in self._values:
+            resolved = self._resolve(option)
+            if resolved is None:
+                raise KeyError(option)
+            return self[resolved]
+
+        error = self._errors.get(option, None)
+        if error is None:
+            result = self._validate(option)
+            if result is not _MISSING:
+                return result
+            error = self._errors[option]
+        raise er.ValidationError(error)
+
+    def _resolve(self, option: object) -> str | None:
+        """
+        Return the option of an alias, or of a name written differently,
+        if it's in the config.
+        """
+        if not isinstance(option, str):
+            return None
+        resolved = self._config._index.resolve(option)
+        return resolved if resolved != option and resolved in self._values else None
+
+    def _validate(self, option: str) -> Any:
+        """
+        Validate the value of option, keeping the result or the error.
+        Return the result, or _MISSING if the value isn't valid.
+        """
+        validator = self._plan.get(option, None)
+        if validator is None:
+            self._errors[option] = self._config._unknown_option_error(option)
+            return _MISSING
+        try:
+            result = self._results[option] = validator(self._values[option])
+        except er.ValidationError as err:
+            self._errors[option] = str(err)
+            return _MISSING
+        return result
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._values)
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def __contains__(self, option: object) -> bool:
+        return option in self._values or self._resolve(option) is not None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({len(self._results)} of {len(self._values)} options validated)"
+
+    def validate_all(self) -> Dict[str, str]:
+        """
+        Validate the options that weren't read yet and return the
+        parsing errors and the errors of all the options, like
+        parse_and_validate.
+        """
+        for option in self._values:
+            if option not in self._results and option not in self._errors:
+                self._validate(option)
+        errors = {**self.parsing_errors}
+        for option in self._values:
+            if option in self._errors:
+                errors[option] = self._errors[option]
+        return errors
@@ -0,0 +1,87 @@
+import re
+from typing import Callable, Dict, Iterable, List, Tuple
+
+_SEPARATORS = re.compile(r"[\s_-]+")
+
+
+def normalize_key(key: str) -> str:
+    """
+    The key normalization of TypeConfig(normalize_keys=True):
+    case is ignored and spaces, underscores and hyphens are the same,
+    so "Shopping List", "shopping_list" and "shopping-list" match.
+    """
+    return _SEPARATORS.sub(" ", key.strip()).casefold()
+
+
+class OptionIndex:
+    """
+    The names and aliases of the options, {key: option}, where the keys
+    are normalized with normalize (if given).
+    Finding the option of a name is a single dictionary lookup.
+    """
+
+    __slots__ = ("normalize", "keys", "options_keys")
+
+    def __init__(self, normalize: Callable[[str], str] | None) -> None:
+        self.normalize = normalize
+        self.keys: Dict[str, str] = {}
+        # The keys of each option, to remove them when it's added again
+        self.options_keys: Dict[str, Tuple[str, ...]] = {}
+
+    @property
+    def is_needed(self) -> bool:
+        """
+        Whether some names differ from the options they resolve to.
+        """
+        return self.normalize is not None or len(self.keys) != len(self.options_keys)
+
+    def add(self, option: str, aliases: Iterable[str]):
+        """
+        Add (or replace) the keys of option.
+        Raise a ValueError if one is already used by another option.
+        """
+        normalize = self.normalize
+        keys = []
+        for name in (option, *aliases):
+            key = normalize(name) if normalize else name
+            owner = self.keys.get(key, option)
+            if owner != option:
+                raise ValueError(f"[{name}]: is already used by the option [{owner}].")
+            if key not in keys:
+                keys.append(key)
+
+        for key in self.options_keys.pop(option, ()):
+            del self.keys[key]
+        for key in keys:
+            self.keys[key] = option
+        self.options_keys[option] = tuple(keys)
+
+    def resolve(self, name: str) -> str:
+        """
+        Return the option of the given name or alias, or name if
+        it's unknown.
+        """
+        normalize = self.normalize
+        return self.keys.get(normalize(name) if normalize else name, name)
+
+    def suggest(self, name: str, limit: int = 3) -> List[str]:
+        """
+        Return the options whose names or aliases are close to the
+        given one. Slow: only used to explain errors.
+        """
+        return suggest(self.keys, self.normalize(name) if self.normalize else name, limit)
+
+
+def suggest(keys: Dict[str, str], key: str, limit: int = 3) -> List[str]:
+    """
+    Return the options of the keys ({key: option}) close to the given
+    (normalized) key, at most limit of them.
+    """
+    import difflib
+
+    options = []
+    for match in difflib.get_close_matches(key, keys, n=limit * 2):
+        option = keys[match]
+        if option not in options:
+            options.append(option)
+    return options[:limit]
@@ -0,0 +1,59 @@
+from typing import Tuple, Dict, Any, Callable, Mapping, TYPE_CHECKING
+
+import type_config.errors as er
+
+# Only used in annotations: importing concurrent.futures is slow
+if TYPE_CHECKING:
+    from concurrent.futures import Executor, Future
+
+# The kinds of work a type's functions can do, set with add_type's workload.
+# Pure types are cheap and always run in the calling thread.
+PURE = "pure"
+# Types doing I/O (files, network...) run in threads.
+IO = "io"
+# Types doing heavy computations run in processes; their functions
+# must be importable (no lambdas) to be sent to the processes.
+CPU = "cpu"
+
+WORKLOADS = (PURE, IO, CPU)
+
+
+def validate_with_executors(
+    plan: Mapping[str, Callable[[Any], Any]],
+    workloads: Mapping[str, str],
+    config: Mapping[str, Any],
+    executors: "Mapping[str, Executor]",
+) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    Validate config like TypeConfig.validate_config, running each
+    option's validator in the executor of its type's workload.
+    Options without an executor are validated in the calling thread,
+    while the others are running.
+
+    The results (and their order) are the same as validating
+    one option at a time.
+    """
+    futures: "Dict[str, Future]" = {}
+    for option, value in config.items():
+        validator = plan.get(option, None)
+        executor = executors.get(workloads.get(option, PURE), None)
+        if validator is not None and executor is not None:
+            futures[option] = executor.submit(validator, value)
+
+    errors = dict()
+    validated_config = dict()
+    for option, value in config.items():
+        validator = plan.get(option, None)
+        if validator is None:
+            errors[option] = f"[{option}]: is not part of the expected options."
+            continue
+        try:
+            future = futures.get(option, None)
+            if future is None:
+                validated_config[option] = validator(value)
+            else:
+                validated_config[option] = future.result()
+        except er.ValidationError as err:
+            errors[option] = str(err)
+
+    return validated_config, errors
@@ -0,0 +1,328 @@
+"""
+The on-disk cache of TypeConfig.parse_and_validate_file (disk_cache).
+
+Each config file has one entry in the cache directory, named after a
+hash of its absolute path, holding the parsed values, the validated
+values and the errors. An entry is used only if both the content of
+the file and the schema (the fingerprint of the options and types)
+are the same as when it was written; otherwise it's written again.
+Entries are pickles, so they are only read from and written to a
+directory owned by the current user that nobody else can write to.
+"""
+import functools
+import hashlib
+import os
+import pickle
+import sys
+import stat
+import tempfile
+import types
+from operator import attrgetter
+from typing import Any, Callable, Dict, Iterable, Tuple
+
+from type_config.specs import OptionSpec, TypeSpec
+
+# Changes when the layout of an entry changes
+CACHE_VERSION = 2
+
+_MAGIC = b"TCDC"
+_HASH_SIZE = 16
+_HEADER_SIZE = len(_MAGIC) + 1 + 2 * _HASH_SIZE
+
+_BUILTIN_FUNCTIONS = (
+    types.BuiltinFunctionType,
+    types.MethodDescriptorType,
+    types.WrapperDescriptorType,
+    types.ClassMethodDescriptorType,
+)
+
+# What an entry holds: the parsed config, the validated config
+# (None if it couldn't be pickled), the parsing errors and the
+# validation errors
+Entry = Tuple[Dict[str, str], Dict[str, Any] | None, Dict[str, str], Dict[str, str]]
+
+
+def default_directory() -> str:
+    """
+    Return $XDG_CACHE_HOME/type_config, or ~/.cache/type_config.
+    """
+    base = os.environ.get("XDG_CACHE_HOME", "") or os.path.join(os.path.expanduser("~"), ".cache")
+    return os.path.join(base, "type_config")
+
+
+def _hash(data: bytes) -> bytes:
+    return hashlib.blake2b(data, digest_size=_HASH_SIZE).digest()
+
+
+def _describe_code(code: Any) -> str:
+    """
+    Describe a code object with its bytecode, names and constants
+    (the nested functions' code included), which don't change between
+    processes, unlike its marshal dump.
+    """
+    constants = ", ".join(
+        _describe_code(constant) if hasattr(constant, "co_code") else repr(constant)
+        for constant in code.co_consts
+    )
+    return f"{code.co_code.hex()}:{code.co_names}:({constants})"
+
+
+class _Undescribable(Exception):
+    """
+    Raised when the state of a function can't be described, so the
+    schema has no fingerprint and the disk cache isn't used.
+    """
+
+
+def _global_names(code: Any) -> set:
+    """
+    Return the names used by a code object and its nested functions,
+    the globals they read among them.
+    """
+    names = set(code.co_names)
+    for constant in code.co_consts:
+        if hasattr(constant, "co_code"):
+            names |= _global_names(constant)
+    return names
+
+
+def _describe_class(cls: type) -> str:
+    """
+    Describe a class by its name and the code of its own methods.
+    """
+    methods = []
+    for name, attribute in sorted(vars(cls).items()):
+        # staticmethod and classmethod objects keep the function in __func__
+        code = getattr(getattr(attribute, "__func__", attribute), "__code__", None)
+        if code is not None:
+            methods.append(f"{name}={_describe_code(code)}")
+    return f"class {cls.__module__}:{cls.__qualname__}({', '.join(methods)})"
+
+
+def _describe_instance(value: Any) -> str:
+    """
+    Describe an object by its class and its pickle, which holds its
+    state; objects that can't be pickled can't be described.
+    """
+    try:
+        data = pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception as err:
+        raise _Undescribable(f"{type(value).__qualname__} can't be pickled") from err
+    return f"{_describe_class(type(value))}:{_hash(data).hex()}"
+
+
+def _describe_value(value: Any, seen: set) -> str:
+    """
+    Describe a value in a way that changes when its content changes,
+    and is the same in every process (sets are sorted).
+    """
+    if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+        return f"{type(value).__name__}:{value!r}"
+    if type(value) in (tuple, list):
+        return f"{type(value).__name__}({', '.join(_describe_value(item, seen) for item in value)})"
+    if type(value) in (set, frozenset):
+        items = sorted(_describe_value(item, seen) for item in value)
+        return f"{type(value).__name__}({', '.join(items)})"
+    if type(value) is dict:
+        items = (f"{_describe_value(key, seen)}: {_describe_value(item, seen)}" for key, item in value.items())
+        return f"dict({', '.join(items)})"
+    if isinstance(value, types.ModuleType):
+        return f"module {value.__name__}"
+    if callable(value):
+        return _describe_function(value, seen)
+    return _describe_instance(value)
+
+
+def _describe_function(function: Callable | None, seen: set) -> str:
+    """
+    Describe a function in a way that changes when its name, its code
+    or the values it reads (defaults, closures, globals, the object
+    of a method) change, and is the same in every process.
+    Raise _Undescribable if one of these values can't be described.
+    """
+    if function is None:
+        return "None"
+    if isinstance(function, functools.partial):
+        arguments = _describe_value(function.args, seen)
+        keywords = _describe_value(sorted(function.keywords.items()), seen)
+        return f"partial({_describe_function(function.func, seen)}, {arguments}, {keywords})"
+    if isinstance(function, type):
+        return _describe_class(function)
+
+    name = f"{getattr(function, '__module__', '')}:{getattr(function, '__qualname__', '')}"
+    bound_to = getattr(function, "__self__", None)
+    code = getattr(function, "__code__", None)
+    if code is not None:
+        # Python functions, and methods through their __func__
+        python_function = getattr(function, "__func__", function)
+        if id(python_function) in seen:
+            # A function calling itself, directly or not
+            return f"recursive {name}"
+        seen.add(id(python_function))
+        parts = [
+            name,
+            _describe_code(code),
+            _describe_value(python_function.__defaults__, seen),
+            _describe_value(python_function.__kwdefaults__, seen),
+        ]
+        for cell in python_function.__closure__ or ():
+            try:
+                parts.append(_describe_value(cell.cell_contents, seen))
+            except ValueError:
+                parts.append("empty cell")
+        module_globals = python_function.__globals__
+        for global_name in sorted(_global_names(code)):
+            if global_name in module_globals:
+                parts.append(f"{global_name}={_describe_value(module_globals[global_name], seen)}")
+        if bound_to is not None:
+            parts.append(_describe_value(bound_to, seen))
+        return ":".join(parts)
+
+    if bound_to is not None and not isinstance(bound_to, types.ModuleType):
+        # Built-in methods of an object, like re.compile(...).fullmatch
+        return f"{type(bound_to).__qualname__}.{function.__name__}:{_describe_value(bound_to, seen)}"
+    if isinstance(function, _BUILTIN_FUNCTIONS):
+        # len, str.isdigit...: they don't hold any state
+        return name
+    wrapped = getattr(function, "__wrapped__", None)
+    if wrapped is not None:
+        # functools.lru_cache and other wrappers written in C
+        return f"{type(function).__qualname__}({_describe_function(wrapped, seen)})"
+    # Callable objects
+    return _describe_instance(function)
+
+
+def options_fingerprint(options: Iterable[OptionSpec]) -> bytes:
+    """
+    Return a hash of the settings of the options that change the
+    results of parsing and validating (not their help).
+    """
+    key_settings = attrgetter("option", "type", "default", "can_be_empty", "aliases")
+    option_settings = [key_settings(option) for option in options]
+    try:
+        options_data = pickle.dumps(option_settings, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        options_data = repr(option_settings).encode("utf-8")
+    return _hash(options_data)
+
+
+def schema_fingerprint(
+    options_hash: bytes, normalize_keys: Any, types: Iterable[TypeSpec]
+) -> bytes | None:
+    """
+    Return a hash of everything that changes the results of parsing
+    and validating: the options (options_hash, see
+    options_fingerprint), the types and their functions (by name and
+    code, with the values they read from their defaults, closures,
+    globals and bound objects), the key normalization and the Python
+    version.
+    The same schema, built by the same code, gives the same hash in
+    every process. Return None if a function reads a value that can't
+    be described (it can't be pickled): the disk cache can't be used.
+    """
+
+    def describe(value: Any) -> str:
+        return _describe_function(value, set()) if callable(value) else repr(value)
+
+    try:
+        parts = [f"{CACHE_VERSION}:{sys.implementation.cache_tag}", describe(normalize_keys)]
+        for type in types:
+            parts.append(repr(tuple(describe(type[field]) for field in type._fields)))
+    except (_Undescribable, RecursionError):
+        return None
+    return _hash(options_hash + "\n".join(parts).encode("utf-8"))
+
+
+def entry_path(directory: str | os.PathLike, path: str | os.PathLike) -> str:
+    """
+    Return the path of the entry of the config file at path.
+    """
+    name = _hash(os.fsencode(os.path.abspath(path))).hex()
+    return os.path.join(directory, f"{name}.cache")
+
+
+def is_private(directory: str | os.PathLike) -> bool:
+    """
+    Return whether directory is a directory owned by the current user
+    that nobody else can write to. Entries are unpickled, which can
+    run code: anyone able to write one could run code in our process.
+    There are no owners nor modes to check on Windows.
+    """
+    if not hasattr(os, "getuid"):
+        return True
+    try:
+        status = os.stat(directory)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(status.st_mode)
+        and status.st_uid == os.getuid()
+        and not status.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def read_entry(
+    directory: str | os.PathLike, path: str | os.PathLike, fingerprint: bytes, content_hash: bytes
+) -> Entry | None:
+    """
+    Return the entry of the config file at path if it was written with
+    the same schema and content, else None.
+    Missing, outdated and broken entries are all ignored, and nothing
+    is read from a directory that isn't private (see is_private).
+    """
+    if not is_private(directory):
+        return None
+    try:
+        with open(entry_path(directory, path), "rb") as file:
+            if hasattr(os, "getuid") and os.fstat(file.fileno()).st_uid != os.getuid():
+                return None
+            data = file.read()
+    except OSError:
+        return None
+
+    header = _MAGIC + bytes((CACHE_VERSION,)) + fingerprint + content_hash
+    if data[:_HEADER_SIZE] != header:
+        return None
+    try:
+        return pickle.loads(memoryview(data)[_HEADER_SIZE:])
+    except Exception:
+        return None
+
+
+def write_entry(
+    directory: str | os.PathLike,
+    path: str | os.PathLike,
+    fingerprint: bytes,
+    content_hash: bytes,
+    entry: Entry,
+):
+    """
+    Write the entry of the config file at path, replacing the previous
+    one at once (readers see either of them, never half of one).
+    Nothing is written if the directory can't be written to, or isn't
+    private (see is_private).
+    """
+    config, validated, parsing_errors, validation_errors = entry
+    try:
+        payload = pickle.dumps(entry, protocol=pickle.HIGHEST_PROTOCOL)
+    except Exception:
+        # Values that can't be pickled are validated again when read,
+        # and so are their errors
+        payload = pickle.dumps((config, None, parsing_errors, {}), protocol=pickle.HIGHEST_PROTOCOL)
+
+    header = _MAGIC + bytes((CACHE_VERSION,)) + fingerprint + content_hash
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+        if not is_private(directory):
+            return
+        descriptor, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(descriptor, "wb") as file:
+                file.write(header)
+                file.write(payload)
+            os.replace(temporary, entry_path(directory, path))
+        except BaseException:
+            os.unlink(temporary)
+            raise
+    except OSError:
+        pass
@@ -0,0 +1,232 @@
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Mapping
+
+import type_config.errors as er
+
+_OPTION_COUNTERS = ("calls", "failures", "validate_calls", "validate_seconds", "cast_calls", "cast_seconds")
+
+
+class Timed:
+    """
+    Call function, adding the call and the time it took to the
+    counters of an option (entry[name + "_calls"] and entry[name + "_seconds"]).
+    A class instead of a closure, so that it can be sent to processes.
+    """
+
+    __slots__ = ("entry", "calls", "seconds", "function")
+
+    def __init__(self, entry: Dict[str, Any], name: str, function: Callable) -> None:
+        self.entry = entry
+        self.calls = f"{name}_calls"
+        self.seconds = f"{name}_seconds"
+        self.function = function
+
+    def __call__(self, value: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return self.function(value)
+        finally:
+            entry = self.entry
+            entry[self.seconds] += time.perf_counter() - start
+            entry[self.calls] += 1
+
+
+class AsyncTimed(Timed):
+    """
+    Timed, for coroutine functions: the time is measured until the
+    result is available, including the time spent waiting.
+    """
+
+    __slots__ = ()
+
+    async def __call__(self, value: Any) -> Any:
+        start = time.perf_counter()
+        try:
+            return await self.function(value)
+        finally:
+            entry = self.entry
+            entry[self.seconds] += time.perf_counter() - start
+            entry[self.calls] += 1
+
+
+class Counted:
+    """
+    Call an option's validator, counting the calls and the failures
+    (ValidationError) in its entry.
+    """
+
+    __slots__ = ("entry", "validator")
+
+    def __init__(self, entry: Dict[str, Any], validator: Callable[[Any], Any]) -> None:
+        self.entry = entry
+        self.validator = validator
+
+    def __call__(self, value: Any) -> Any:
+        self.entry["calls"] += 1
+        try:
+            return self.validator(value)
+        except er.ValidationError:
+            self.entry["failures"] += 1
+            raise
+
+
+class AsyncCounted(Counted):
+    """
+    Counted, for the asynchronous validators.
+    """
+
+    __slots__ = ()
+
+    async def __call__(self, value: Any) -> Any:
+        self.entry["calls"] += 1
+        try:
+            return await self.validator(value)
+        except er.ValidationError:
+            self.entry["failures"] += 1
+            raise
+
+
+def _size(text: str | bytes) -> int:
+    return len(text) if isinstance(text, (bytes, bytearray)) else len(text.encode("utf-8"))
+
+
+def _counted_lines(source: Iterable, entry: Dict[str, Any]) -> Iterator:
+    for line in source:
+        entry["bytes"] += _size(line)
+        yield line
+
+
+class ProfileStats:
+    """
+    What was recorded by TypeConfig.profile:
+        - options: {option: counters} with the calls and failures of
+          its validator and the calls and seconds spent in its type's
+          validate and cast (parse counts as validate)
+        - methods: {method: counters} with the calls, seconds and bytes
+          read of parse_config, parse_config_file, validate_config and
+          heal_config
+    Values validated in other processes aren't recorded.
+    """
+
+    def __init__(self) -> None:
+        self.options: Dict[str, Dict[str, Any]] = {}
+        self.methods: Dict[str, Dict[str, Any]] = {}
+
+    def option_entry(self, option: str, type: str) -> Dict[str, Any]:
+        """
+        Return the counters of the given option, creating them if needed.
+        """
+        entry = self.options.get(option, None)
+        if entry is None or entry["type"] != type:
+            entry = self.options[option] = {"type": type, **dict.fromkeys(_OPTION_COUNTERS, 0)}
+        return entry
+
+    def instrument(
+        self, option: str, type: str, functions: Iterable[Callable | None], asynchronous: bool
+    ) -> List[Callable | None]:
+        """
+        Return the type's validate and cast (or parse, as validate),
+        timed in the counters of option.
+        """
+        entry = self.option_entry(option, type)
+        timed = AsyncTimed if asynchronous else Timed
+        return [
+            None if function is None else timed(entry, name, function)
+            for name, function in zip(("validate", "cast"), functions)
+        ]
+
+    def count(self, option: str, type: str, validator: Callable, asynchronous: bool) -> Callable:
+        """
+        Return the option's validator, counting its calls and failures.
+        """
+        counted = AsyncCounted if asynchronous else Counted
+        return counted(self.option_entry(option, type), validator)
+
+    @contextmanager
+    def method(self, name: str, source: Any = None) -> Iterator[Any]:
+        """
+        Time a call of the named method; the bytes of the source it
+        reads are counted (files and iterables while being read), so
+        the source to use is given back.
+        """
+        entry = self.methods.get(name, None)
+        if entry is None:
+            entry = self.methods[name] = {"calls": 0, "seconds": 0.0, "bytes": 0}
+
+        if isinstance(source, (str, bytes, bytearray)):
+            entry["bytes"] += _size(source)
+        elif isinstance(source, Mapping):
+            entry["bytes"] += sum(
+                _size(value) for value in source.values() if isinstance(value, (str, bytes))
+            )
+        elif source is not None:
+            source = _counted_lines(source, entry)
+
+        start = time.perf_counter()
+        try:
+            yield source
+        finally:
+            entry["seconds"] += time.perf_counter() - start
+            entry["calls"] += 1
+
+    def add_bytes(self, name: str, size: int):
+        """
+        Count size bytes read by the named method, while it's timed.
+        """
+        self.methods[name]["bytes"] += size
+
+    def types(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Return the counters of the options summed by type,
+        {type: counters}.
+        """
+        types = {}
+        for entry in self.options.values():
+            total = types.get(entry["type"], None)
+            if total is None:
+                total = types[entry["type"]] = dict.fromkeys(_OPTION_COUNTERS, 0)
+            for counter in _OPTION_COUNTERS:
+                total[counter] += entry[counter]
+        return types
+
+    def as_dict(self) -> Dict[str, Dict[str, Dict[str, Any]]]:
+        """
+        Return a copy of everything recorded:
+        {"options": ..., "types": ..., "methods": ...}.
+        """
+        return {
+            "options": {option: entry.copy() for option, entry in self.options.items()},
+            "types": self.types(),
+            "methods": {method: entry.copy() for method, entry in self.methods.items()},
+        }
+
+    def format_table(self, limit: int | None = None) -> str:
+        """
+        Return the recorded counters as plain text tables, with the
+        slowest options and types first (at most limit options).
+        """
+        def total_seconds(entry: Dict[str, Any]) -> float:
+            return entry["validate_seconds"] + entry["cast_seconds"]
+
+        lines = [f"{'method':30} {'calls':>8} {'seconds':>10} {'bytes':>12}"]
+        for method, entry in self.methods.items():
+            lines.append(f"{method:30} {entry['calls']:8} {entry['seconds']:10.6f} {entry['bytes']:12}")
+
+        for title, entries in (("type", self.types()), ("option", self.options)):
+            lines.append("")
+            lines.append(
+                f"{title:30} {'calls':>8} {'failures':>8} {'validate s':>12} {'cast s':>12}"
+            )
+            ordered = sorted(entries.items(), key=lambda item: total_seconds(item[1]), reverse=True)
+            if title == "option" and limit is not None:
+                ordered = ordered[:limit]
+            for name, entry in ordered:
+                lines.append(
+                    f"{name:30} {entry['calls']:8} {entry['failures']:8} "
+                    f"{entry['validate_seconds']:12.6f} {entry['cast_seconds']:12.6f}"
+                )
+        return "\n".join(lines)
+
+    def __str__(self) -> str:
+        return self.format_table()
@@ -0,0 +1,149 @@
+import importlib
+import inspect
+import pickle
+from typing import Any, Callable, Dict, Mapping, Tuple
+
+from type_config.specs import OptionSpec, TypeSpec
+
+# Changes when the layout of a snapshot changes
+SNAPSHOT_VERSION = 1
+
+# The TypeSpec fields holding functions
+_FUNCTION_FIELDS = ("validate", "cast", "validate_batch", "cast_batch", "parse")
+
+# A function in a snapshot: None, ("name", registry name),
+# ("import", "module:qualified.name") or ("object", callable object)
+# for the picklable callables that aren't functions, like partials
+FunctionReference = Tuple[str, Any] | None
+
+
+def qualified_name(function: Callable) -> str | None:
+    """
+    Return "module:qualified.name" if function can be imported
+    with that name, else None (lambdas, nested functions...).
+    """
+    module = getattr(function, "__module__", None)
+    if module is None:
+        # Methods of builtin types, like str.isdigit
+        module = getattr(getattr(function, "__objclass__", None), "__module__", None)
+    name = getattr(function, "__qualname__", None)
+    if not module or not name or "<" in name:
+        return None
+    try:
+        found = import_function(f"{module}:{name}")
+    except (ImportError, AttributeError):
+        return None
+    return f"{module}:{name}" if found is function else None
+
+
+def import_function(name: str) -> Callable:
+    """
+    Import the function with the given "module:qualified.name".
+    """
+    module, _, attributes = name.partition(":")
+    found = importlib.import_module(module)
+    for attribute in attributes.split("."):
+        found = getattr(found, attribute)
+    return found
+
+
+def _dump_function(
+    type: str, function: Callable | None, names: Mapping[int, str]
+) -> FunctionReference:
+    if function is None:
+        return None
+    name = names.get(id(function), None)
+    if name is not None:
+        return ("name", name)
+    name = qualified_name(function)
+    if name is not None:
+        return ("import", name)
+    if not inspect.isfunction(function):
+        try:
+            pickle.dumps(function, protocol=pickle.HIGHEST_PROTOCOL)
+        except Exception:
+            pass
+        else:
+            return ("object", function)
+    raise ValueError(
+        f"[{type}]: {function!r} can't be imported by name, add it to the registry."
+    )
+
+
+def _load_function(
+    type: str, reference: FunctionReference, registry: Mapping[str, Callable]
+) -> Callable | None:
+    if reference is None:
+        return None
+    kind, target = reference
+    if kind == "import":
+        return import_function(target)
+    if kind == "object":
+        return target
+    try:
+        return registry[target]
+    except KeyError:
+        raise ValueError(f"[{type}]: {target} is not part of the registry.") from None
+
+
+def dump_schema(
+    type_hint: bool,
+    cache_size: int,
+    normalize_keys: bool | Callable[[str], str],
+    options: Mapping[str, OptionSpec],
+    types: Mapping[str, TypeSpec],
+    registry: Mapping[str, Callable],
+) -> bytes:
+    """
+    Return a snapshot of the given schema, where each function is
+    replaced by its name in the registry ({name: function}) or,
+    if it's not there, by its importable qualified name.
+    """
+    names = {id(function): name for name, function in registry.items()}
+    dumped_types = []
+    for type_info in types.values():
+        row = [getattr(type_info, field) for field in TypeSpec._fields]
+        for field in _FUNCTION_FIELDS:
+            index = TypeSpec._fields.index(field)
+            row[index] = _dump_function(type_info.type, row[index], names)
+        dumped_types.append(tuple(row))
+
+    dumped_options = [
+        tuple(getattr(option_info, field) for field in OptionSpec.__slots__)
+        for option_info in options.values()
+    ]
+    if callable(normalize_keys):
+        normalize_keys = _dump_function("normalize_keys", normalize_keys, names)
+    return pickle.dumps(
+        (SNAPSHOT_VERSION, type_hint, cache_size, normalize_keys, dumped_types, dumped_options),
+        protocol=pickle.HIGHEST_PROTOCOL,
+    )
+
+
+def load_schema(
+    snapshot: bytes, registry: Mapping[str, Callable]
+) -> Tuple[bool, int, bool | Callable, Dict[str, OptionSpec], Dict[str, TypeSpec]]:
+    """
+    Read a snapshot written by dump_schema, returning its type_hint,
+    cache_size, normalize_keys, options and types, with the functions
+    looked up in the registry or imported.
+    """
+    version, *schema = pickle.loads(snapshot)
+    if version != SNAPSHOT_VERSION:
+        raise ValueError(f"Unsupported snapshot version: {version}.")
+    type_hint, cache_size, normalize_keys, dumped_types, dumped_options = schema
+    if isinstance(normalize_keys, tuple):
+        normalize_keys = _load_function("normalize_keys", normalize_keys, registry)
+
+    function_indexes = [TypeSpec._fields.index(field) for field in _FUNCTION_FIELDS]
+    types = {}
+    for row in dumped_types:
+        row = list(row)
+        for index in function_indexes:
+            row[index] = _load_function(row[0], row[index], registry)
+        types[row[0]] = TypeSpec(*row)
+
+    # The options' comments are in the snapshot, so they aren't formatted again
+    from_slots = OptionSpec._from_slots
+    options = {row[1]: from_slots(row) for row in dumped_options}
+    return type_hint, cache_size, normalize_keys, options, types
@@ -0,0 +1,158 @@
+from collections.abc import Mapping
+from typing import Any, Callable, Iterator, Tuple
+
+
+def _hash_value(value: Any) -> int:
+    """
+    Return the hash of a field's value; unhashable values (like a list
+    default) are left out, so equal records still have equal hashes.
+    """
+    try:
+        return hash(value)
+    except TypeError:
+        return 0
+
+
+class _Spec(Mapping):
+    """
+    A read-only record with a fixed set of fields, which can also be
+    read like a dictionary ({field: value}).
+    """
+
+    __slots__ = ()
+    _fields: Tuple[str, ...] = ()
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f"{type(self).__name__} is read-only.")
+
+    def __getitem__(self, field: str) -> Any:
+        if field not in self._fields:
+            raise KeyError(field)
+        return getattr(self, field)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._fields)
+
+    def __len__(self) -> int:
+        return len(self._fields)
+
+    def __hash__(self) -> int:
+        return hash(tuple(_hash_value(getattr(self, field)) for field in self._fields))
+
+    def __reduce__(self):
+        return (type(self), tuple(getattr(self, field) for field in self._fields))
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{field}={getattr(self, field)!r}" for field in self._fields)
+        return f"{type(self).__name__}({values})"
+
+    @classmethod
+    def _from_slots(cls, values: Tuple[Any, ...]):
+        """
+        Create a record from the values of all its __slots__, in order,
+        without computing anything again (used to load snapshots).
+        """
+        spec = cls.__new__(cls)
+        set_field = object.__setattr__
+        for name, value in zip(cls.__slots__, values):
+            set_field(spec, name, value)
+        return spec
+
+    def replace(self, **changes: Any):
+        """
+        Return a new record with the given fields changed.
+        """
+        values = {field: getattr(self, field) for field in self._fields}
+        values.update(changes)
+        return type(self)(**values)
+
+
+class OptionSpec(_Spec):
+    """
+    An option added with TypeConfig.add_option.
+    """
+
+    _fields = ("type", "option", "default", "can_be_empty", "important_help", "help", "aliases")
+    # comment is the help text as it's written in the config file
+    __slots__ = _fields + ("comment",)
+
+    def __init__(
+        self,
+        type: str,
+        option: str,
+        default: Any,
+        can_be_empty: bool,
+        important_help: str,
+        help: str,
+        aliases: Tuple[str, ...] = (),
+    ) -> None:
+        set_field = object.__setattr__
+        set_field(self, "type", type)
+        set_field(self, "option", option)
+        set_field(self, "default", default)
+        set_field(self, "can_be_empty", can_be_empty)
+        set_field(self, "important_help", important_help)
+        set_field(self, "help", help)
+        set_field(self, "aliases", tuple(aliases))
+
+        comment = "\n".join([f"# {line}" for line in help.splitlines()])
+        important_comment = "\n".join(
+            [f"# !!! {line}" for line in important_help.splitlines()]
+        )
+        if important_comment:
+            comment = f"{important_comment}\n{comment}"
+        set_field(self, "comment", comment)
+
+
+class TypeSpec(_Spec):
+    """
+    A type added with TypeConfig.add_type.
+    """
+
+    __slots__ = ("type", "validate", "cast", "error", "workload", "validate_batch", "cast_batch", "parse")
+    _fields = __slots__
+
+    def __init__(
+        self,
+        type: str,
+        validate: Callable[[Any], bool] | None,
+        cast: Callable[[Any], Any] | None,
+        error: str,
+        workload: str,
+        validate_batch: Callable | None,
+        cast_batch: Callable | None,
+        parse: Callable[[Any], Any] | None = None,
+    ) -> None:
+        set_field = object.__setattr__
+        set_field(self, "type", type)
+        set_field(self, "validate", validate)
+        set_field(self, "cast", cast)
+        set_field(self, "error", error)
+        set_field(self, "workload", workload)
+        set_field(self, "validate_batch", validate_batch)
+        set_field(self, "cast_batch", cast_batch)
+        set_field(self, "parse", parse)
+
+
+class BrokenLine(_Spec):
+    """
+    A line that couldn't be parsed, found by
+    TypeConfig.parse_config_records.
+    line_number starts at 1 and counts every line of the source (empty
+    lines and comments included); column and end_column (excluded)
+    are the span of the broken part in the original line, starting at 1.
+    """
+
+    __slots__ = ("line_number", "column", "end_column", "line", "error")
+    _fields = __slots__
+
+    def __init__(self, line_number: int, column: int, end_column: int, line: str, error: str) -> None:
+        set_field = object.__setattr__
+        set_field(self, "line_number", line_number)
+        set_field(self, "column", column)
+        set_field(self, "end_column", end_column)
+        set_field(self, "line", line)
+        set_field(self, "error", error)
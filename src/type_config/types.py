@@ -0,0 +1,309 @@
+"""
+Ready-made types, to be added with TypeConfig.add_type:
+
+    config.add_type(type="Port", **types.integer(minimum=1, maximum=65535))
+
+Each function returns the arguments of add_type (parse, error and,
+for paths that must exist, workload). The values are validated and
+casted in a single step by parse, which is a function of this module
+(or a partial of one), so the types can be pickled and sent to processes.
+"""
+import datetime
+import enum
+import os
+import pathlib
+import re
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Type
+
+import type_config.parallel as parallel
+
+_TRUE = frozenset(("true", "yes", "on", "1"))
+_FALSE = frozenset(("false", "no", "off", "0"))
+
+_DURATION_UNITS = {
+    "ms": 0.001,
+    "s": 1,
+    "m": 60,
+    "h": 3600,
+    "d": 86400,
+    "w": 604800,
+}
+_DURATION_PART = re.compile(r"\s*(\d+(?:\.\d+)?)\s*(ms|s|m|h|d|w)", re.IGNORECASE)
+
+_SIZE_UNITS = {
+    "": 1,
+    "b": 1,
+    "k": 1000, "kb": 1000, "kib": 1024,
+    "m": 1000**2, "mb": 1000**2, "mib": 1024**2,
+    "g": 1000**3, "gb": 1000**3, "gib": 1024**3,
+    "t": 1000**4, "tb": 1000**4, "tib": 1024**4,
+}
+_SIZE = re.compile(r"\s*(\d+(?:\.\d+)?)\s*([a-z]*)\s*", re.IGNORECASE)
+
+
+def _check_bounds(value: Any, minimum: Any, maximum: Any) -> Any:
+    if minimum is not None and value < minimum:
+        raise ValueError(f"{value} is less than {minimum}")
+    if maximum is not None and value > maximum:
+        raise ValueError(f"{value} is more than {maximum}")
+    return value
+
+
+def _bounds_text(minimum: Any, maximum: Any) -> str:
+    if minimum is not None and maximum is not None:
+        return f" between {minimum} and {maximum}"
+    if minimum is not None:
+        return f" of at least {minimum}"
+    if maximum is not None:
+        return f" of at most {maximum}"
+    return ""
+
+
+def parse_integer(value: Any) -> int:
+    if value.__class__ is str:
+        return int(value)
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise TypeError(f"{value!r} is not an integer")
+    return value
+
+
+def parse_bounded_integer(minimum: int | None, maximum: int | None, value: Any) -> int:
+    return _check_bounds(parse_integer(value), minimum, maximum)
+
+
+def integer(minimum: int | None = None, maximum: int | None = None) -> Dict[str, Any]:
+    """
+    Whole numbers (int), optionally between minimum and maximum
+    (included).
+    """
+    if minimum is None and maximum is None:
+        parse = parse_integer
+    else:
+        parse = partial(parse_bounded_integer, minimum, maximum)
+    return {
+        "parse": parse,
+        "error": f"The value must be an integer{_bounds_text(minimum, maximum)}",
+    }
+
+
+def parse_float(value: Any) -> float:
+    if isinstance(value, bool) or not isinstance(value, (str, int, float)):
+        raise TypeError(f"{value!r} is not a number")
+    number = float(value)
+    if number != number:
+        raise ValueError("nan is not a number")
+    return number
+
+
+def parse_bounded_float(minimum: float | None, maximum: float | None, value: Any) -> float:
+    return _check_bounds(parse_float(value), minimum, maximum)
+
+
+def floating(minimum: float | None = None, maximum: float | None = None) -> Dict[str, Any]:
+    """
+    Numbers (float), optionally between minimum and maximum (included).
+    """
+    if minimum is None and maximum is None:
+        parse = parse_float
+    else:
+        parse = partial(parse_bounded_float, minimum, maximum)
+    return {
+        "parse": parse,
+        "error": f"The value must be a number{_bounds_text(minimum, maximum)}",
+    }
+
+
+def parse_boolean(value: Any) -> bool:
+    if isinstance(value, bool):
+        return value
+    word = str(value).strip().lower()
+    if word in _TRUE:
+        return True
+    if word in _FALSE:
+        return False
+    raise ValueError(f"{value!r} is not a boolean")
+
+
+def boolean() -> Dict[str, Any]:
+    """
+    true/false, yes/no, on/off or 1/0, in any case (bool).
+    """
+    return {
+        "parse": parse_boolean,
+        "error": "The value must be true or false",
+    }
+
+
+def parse_choice(choices: Dict[str, Any], value: Any) -> Any:
+    try:
+        return choices[value if isinstance(value, str) else str(value)]
+    except KeyError:
+        raise ValueError(f"{value!r} is not a valid choice") from None
+
+
+def parse_choice_ignoring_case(choices: Dict[str, Any], value: Any) -> Any:
+    return parse_choice(choices, str(value).casefold())
+
+
+def choice(choices: Iterable[str] | Type[enum.Enum], case_sensitive: bool = True) -> Dict[str, Any]:
+    """
+    One of the given strings, or the name of a member of the given
+    Enum class (the member is returned).
+    """
+    if isinstance(choices, type) and issubclass(choices, enum.Enum):
+        values = {member.name: member for member in choices}
+    else:
+        values = {choice: choice for choice in choices}
+
+    names = ", ".join(values)
+    if case_sensitive:
+        parse = partial(parse_choice, values)
+    else:
+        parse = partial(
+            parse_choice_ignoring_case, {name.casefold(): value for name, value in values.items()}
+        )
+    return {
+        "parse": parse,
+        "error": f"The value must be one of: {names}",
+    }
+
+
+def parse_list(
+    item: Callable[[str], Any] | None,
+    separator: str,
+    min_length: int,
+    max_length: int | None,
+    value: Any,
+) -> List[Any]:
+    items = [part.strip() for part in value.split(separator)] if isinstance(value, str) else list(value)
+    if len(items) < min_length:
+        raise ValueError(f"there are less than {min_length} items")
+    if max_length is not None and len(items) > max_length:
+        raise ValueError(f"there are more than {max_length} items")
+    if item is not None:
+        items = [item(part) for part in items]
+    return items
+
+
+def list_of(
+    item: Dict[str, Any] | None = None,
+    separator: str = ",",
+    min_length: int = 0,
+    max_length: int | None = None,
+) -> Dict[str, Any]:
+    """
+    Lists of values separated by separator (list), with their spaces
+    stripped, and at least min_length and at most max_length items.
+    item is another type of this module (like integer()), used to
+    parse each item.
+    """
+    if max_length is not None:
+        length = f" of {min_length} to {max_length} items"
+    elif min_length:
+        length = f" of at least {min_length} items"
+    else:
+        length = ""
+    error = f"The value must be a list{length}, separated by '{separator}'"
+    if item is not None:
+        error += f" ({item['error'][0].lower()}{item['error'][1:]})"
+    return {
+        "parse": partial(
+            parse_list, item["parse"] if item else None, separator, min_length, max_length
+        ),
+        "error": error,
+    }
+
+
+def parse_duration(value: Any) -> datetime.timedelta:
+    if isinstance(value, datetime.timedelta):
+        return value
+    text = str(value).strip()
+    try:
+        return datetime.timedelta(seconds=float(text))
+    except OverflowError:
+        raise ValueError(f"{value!r} is too long") from None
+    except ValueError:
+        pass
+
+    seconds = 0.0
+    end = 0
+    for match in _DURATION_PART.finditer(text):
+        if match.start() != end:
+            break
+        seconds += float(match.group(1)) * _DURATION_UNITS[match.group(2).lower()]
+        end = match.end()
+    if end == 0 or end != len(text):
+        raise ValueError(f"{value!r} is not a duration")
+    try:
+        return datetime.timedelta(seconds=seconds)
+    except OverflowError:
+        raise ValueError(f"{value!r} is too long") from None
+
+
+def duration() -> Dict[str, Any]:
+    """
+    Durations like 90, 1.5s, 500ms or 1h 30m (datetime.timedelta);
+    numbers without a unit are seconds.
+    Units: ms, s, m, h, d, w.
+    """
+    return {
+        "parse": parse_duration,
+        "error": "The value must be a duration, like 30s, 5m or 1h 30m",
+    }
+
+
+def parse_size(value: Any) -> int:
+    if isinstance(value, int) and not isinstance(value, bool):
+        return value
+    match = _SIZE.fullmatch(str(value))
+    if match is None or match.group(2).lower() not in _SIZE_UNITS:
+        raise ValueError(f"{value!r} is not a size")
+    try:
+        return int(float(match.group(1)) * _SIZE_UNITS[match.group(2).lower()])
+    except OverflowError:
+        raise ValueError(f"{value!r} is too big") from None
+
+
+def size() -> Dict[str, Any]:
+    """
+    Sizes in bytes like 512, 10KB, 1.5 MiB or 2G (int).
+    K, M, G and T are powers of 1000, KiB, MiB, GiB and TiB of 1024.
+    """
+    return {
+        "parse": parse_size,
+        "error": "The value must be a size, like 512, 10KB or 1.5 MiB",
+    }
+
+
+def parse_path(must_exist: bool, kind: str | None, value: Any) -> pathlib.Path:
+    path = pathlib.Path(os.path.expanduser(value))
+    if kind == "file" and not path.is_file():
+        raise ValueError(f"{path} is not a file")
+    if kind == "directory" and not path.is_dir():
+        raise ValueError(f"{path} is not a directory")
+    if must_exist and not path.exists():
+        raise ValueError(f"{path} doesn't exist")
+    return path
+
+
+def path(must_exist: bool = False, kind: str | None = None) -> Dict[str, Any]:
+    """
+    Paths (pathlib.Path), with "~" expanded.
+    If must_exist, the path must exist; if kind is "file" or
+    "directory", it must be an existing file or directory.
+    Checking the file system is I/O, so these use the "io" workload.
+    """
+    if kind not in (None, "file", "directory"):
+        raise ValueError("kind must be None, 'file' or 'directory'.")
+    if kind is not None:
+        error = f"The value must be the path of an existing {kind}"
+    elif must_exist:
+        error = "The value must be an existing path"
+    else:
+        error = "The value must be a path"
+    return {
+        "parse": partial(parse_path, must_exist, kind),
+        "error": error,
+        "workload": parallel.IO if must_exist or kind else parallel.PURE,
+    }
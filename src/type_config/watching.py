@@ -0,0 +1,289 @@
+import asyncio
+import ctypes
+import ctypes.util
+import hashlib
+import os
+import select
+import struct
+import sys
+import threading
+from types import MappingProxyType
+from typing import Any, Callable, Dict, List, Mapping, Set, Tuple
+
+# Called with (changed_options, new_values, errors) after a reload
+Subscriber = Callable[[Set[str], Mapping[str, Any], Mapping[str, str]], Any]
+
+# (mtime, size, inode) of the file, None if it can't be read
+_Signature = Tuple[int, int, int] | None
+
+# inotify(7) constants
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_IN_DELETE = 0x200
+_IN_Q_OVERFLOW = 0x4000
+_EVENT = struct.Struct("iIII")
+
+
+def _signature(path: str) -> _Signature:
+    try:
+        stat = os.stat(path)
+    except OSError:
+        return None
+    return (stat.st_mtime_ns, stat.st_size, stat.st_ino)
+
+
+class _Inotify:
+    """
+    Wait for the changes of a file with Linux's inotify, through ctypes.
+    The file's directory is watched, so that files replaced by renaming
+    another one (like most editors do) are noticed too.
+    """
+
+    def __init__(self, path: str) -> None:
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        self.name = os.fsencode(os.path.basename(path))
+        self.fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+        mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE | _IN_DELETE
+        directory = os.fsencode(os.path.dirname(os.path.abspath(path)))
+        if libc.inotify_add_watch(self.fd, directory, mask) < 0:
+            error = ctypes.get_errno()
+            os.close(self.fd)
+            raise OSError(error, "inotify_add_watch failed")
+
+    def wait(self, timeout: float) -> bool:
+        """
+        Wait at most timeout seconds for the file to change.
+        """
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+
+        changed = False
+        while True:
+            try:
+                data = os.read(self.fd, 64 * 1024)
+            except BlockingIOError:
+                return changed
+            offset = 0
+            while offset < len(data):
+                _, mask, _, length = _EVENT.unpack_from(data, offset)
+                offset += _EVENT.size
+                name = data[offset : offset + length].rstrip(b"\0")
+                offset += length
+                if name == self.name or mask & _IN_Q_OVERFLOW:
+                    changed = True
+
+    def close(self):
+        os.close(self.fd)
+
+
+class ConfigWatcher:
+    """
+    Keep the validated values of a config file up to date, returned by
+    TypeConfig.watch.
+
+    The file is reloaded only when its modification time, size or inode
+    change and its content is different (compared with a hash); only the
+    options whose values changed are validated again (see revalidate).
+    Readers get the current (values, errors) snapshot, which is replaced
+    at once after a reload, so they never see half of a reload.
+
+    check reloads the file once; start, or using the watcher in a with
+    block, watches it in a background thread, and watch_async in an
+    asyncio task. Changes are applied once the file stops changing for
+    debounce seconds.
+    """
+
+    def __init__(
+        self,
+        config,
+        path: str | os.PathLike,
+        interval: float = 1.0,
+        debounce: float = 0.1,
+        use_inotify: bool = True,
+    ) -> None:
+        self.config = config
+        self.path = os.fspath(path)
+        self.interval = interval
+        self.debounce = debounce
+        self.use_inotify = use_inotify
+        # The exception raised by the last reload in the background, if any
+        self.last_exception: BaseException | None = None
+        self._subscribers: List[Subscriber] = []
+        self._signature: _Signature = None
+        self._hash: bytes | None = None
+        self._parsed: Dict[str, str] = {}
+        self._snapshot: Tuple[Mapping[str, Any], Mapping[str, str]] = (
+            MappingProxyType({}),
+            MappingProxyType({}),
+        )
+        self._lock = threading.Lock()
+        self._stopping = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._load(_signature(self.path), initial=True)
+
+    @property
+    def snapshot(self) -> Tuple[Mapping[str, Any], Mapping[str, str]]:
+        """
+        The validated values and the errors of the last reload, as
+        read-only mappings.
+        """
+        return self._snapshot
+
+    @property
+    def values(self) -> Mapping[str, Any]:
+        return self._snapshot[0]
+
+    @property
+    def errors(self) -> Mapping[str, str]:
+        return self._snapshot[1]
+
+    def subscribe(self, subscriber: Subscriber) -> Subscriber:
+        """
+        Call subscriber(changed_options, new_values, errors) after each
+        reload that changes some values or errors.
+        Return subscriber, so that this can be used as a decorator.
+        """
+        self._subscribers.append(subscriber)
+        return subscriber
+
+    def unsubscribe(self, subscriber: Subscriber):
+        self._subscribers.remove(subscriber)
+
+    def check(self) -> bool:
+        """
+        Reload the file if it changed, and return whether it did.
+        """
+        signature = _signature(self.path)
+        if signature is None or signature == self._signature:
+            return False
+        return self._load(signature)
+
+    def _load(self, signature: _Signature, initial: bool = False) -> bool:
+        with self._lock:
+            with open(self.path, "rb") as file:
+                content = file.read()
+            content_hash = hashlib.blake2b(content, digest_size=16).digest()
+            if content_hash == self._hash:
+                # Touched, but not changed
+                self._signature = signature
+                return False
+
+            config = self.config
+            parsed, parsing_errors = config.parse_config(content)
+            previous_values, previous_errors = self._snapshot
+            validated, validation_errors, changed_options = config.revalidate(
+                self._parsed, previous_values, parsed
+            )
+            errors = {**parsing_errors, **validation_errors}
+            self._signature = signature
+            self._hash = content_hash
+            self._parsed = parsed
+            # Replaced at once: readers see either the old or the new one
+            snapshot = self._snapshot = (MappingProxyType(validated), MappingProxyType(errors))
+
+        if not initial and (changed_options or errors != previous_errors):
+            for subscriber in list(self._subscribers):
+                subscriber(changed_options, *snapshot)
+        return True
+
+    def _settle(self, wait: Callable[[float], Any]) -> _Signature:
+        """
+        Wait until the file stops changing for debounce seconds and
+        return its signature.
+        """
+        signature = _signature(self.path)
+        while not self._stopping.is_set():
+            wait(self.debounce)
+            current = _signature(self.path)
+            if current == signature:
+                break
+            signature = current
+        return signature
+
+    def _reload_settled(self, wait: Callable[[float], Any]):
+        signature = self._settle(wait)
+        if signature is not None and signature != self._signature and not self._stopping.is_set():
+            self._load(signature)
+
+    def _run(self):
+        inotify = None
+        if self.use_inotify and sys.platform.startswith("linux"):
+            try:
+                inotify = _Inotify(self.path)
+            except (OSError, AttributeError):
+                # Not available: poll instead
+                inotify = None
+
+        try:
+            while not self._stopping.is_set():
+                if inotify is not None:
+                    inotify.wait(self.interval)
+                else:
+                    self._stopping.wait(self.interval)
+                if self._stopping.is_set():
+                    break
+                if _signature(self.path) == self._signature:
+                    continue
+                try:
+                    self._reload_settled(self._stopping.wait)
+                except Exception as err:
+                    # Keep watching: the file can be fixed later
+                    self.last_exception = err
+        finally:
+            if inotify is not None:
+                inotify.close()
+
+    def start(self) -> "ConfigWatcher":
+        """
+        Watch the file in a background (daemon) thread.
+        """
+        if self._thread is None:
+            self._stopping.clear()
+            self._thread = threading.Thread(target=self._run, name=f"watch {self.path}", daemon=True)
+            self._thread.start()
+        return self
+
+    def stop(self):
+        """
+        Stop watching the file, waiting for the background thread to
+        end. watch_async returns at its next check (after up to interval
+        seconds): await its task to wait for it.
+        """
+        self._stopping.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    def __enter__(self) -> "ConfigWatcher":
+        return self.start()
+
+    def __exit__(self, *exception):
+        self.stop()
+
+    async def watch_async(self):
+        """
+        Watch the file (polling it every interval seconds) until stop is
+        called or the task is cancelled. Files are read and validated
+        in a thread, without blocking the event loop.
+        """
+        self._stopping.clear()
+        while not self._stopping.is_set():
+            await asyncio.sleep(self.interval)
+            if self._stopping.is_set() or _signature(self.path) == self._signature:
+                continue
+            signature = _signature(self.path)
+            while True:
+                await asyncio.sleep(self.debounce)
+                current = _signature(self.path)
+                if current == signature:
+                    break
+                signature = current
+            try:
+                await asyncio.to_thread(self.check)
+            except Exception as err:
+                self.last_exception = err
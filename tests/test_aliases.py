@@ -0,0 +1,119 @@
+import pytest
+
+import type_config.errors as er
+from type_config import TypeConfig
+
+
+class TestAliases:
+    config = TypeConfig(normalize_keys=True)
+    exact_config = TypeConfig()
+
+    file_content = (
+        "Shopping_List = eggs, milk, bread\n"
+        "LIMIT = 3\n"
+        "shoping list = typo\n"
+    )
+
+    def setup_class(self):
+        for config in (self.config, self.exact_config):
+            config.add_option(
+                    option="shopping list",
+                    type="List",
+                    help="What I have to buy",
+                    aliases=("groceries",),
+                    )
+            config.add_option(
+                    option="limit",
+                    type="Integer",
+                    help="How many things I can buy",
+                    default="10",
+                    aliases=("max items", "maximum"),
+                    )
+            config.add_type(
+                    type="List",
+                    parse=lambda value: [item.strip() for item in value.split(",")],
+                    )
+            config.add_type(
+                    type="Integer",
+                    parse=int,
+                    )
+
+    def test_parse(self):
+        config, errors = self.config.parse_config(self.file_content)
+        assert config == {"shopping list": "eggs, milk, bread", "limit": "3", "shoping list": "typo"}
+        assert errors == {}
+
+    def test_parse_file(self, tmp_path):
+        path = tmp_path / "config.txt"
+        path.write_text(self.file_content)
+        assert self.config.parse_config_file(path) == self.config.parse_config(self.file_content)
+
+    def test_validate(self):
+        validated, errors = self.config.validate_config({"Groceries": "a, b", "max-items": "2"})
+        assert validated == {"shopping list": ["a", "b"], "limit": 2}
+        assert errors == {}
+        assert self.config.validate_many([{"MAXIMUM": "1"}]) == [({"limit": 1}, {})]
+        assert self.config._validate_option("Max_Items", "5") == 5
+
+    def test_exact_names(self):
+        # Without normalize_keys, only the names and aliases are matched
+        validated, errors = self.exact_config.validate_config({"groceries": "a", "Groceries": "a", "maximum": "1"})
+        assert validated == {"shopping list": ["a"], "limit": 1}
+        assert list(errors) == ["Groceries"]
+
+    def test_suggestions(self):
+        _, errors = self.config.parse_and_validate(self.file_content)
+        assert errors == {
+            "shoping list": "[shoping list]: is not part of the expected options. Did you mean [shopping list]?"
+            }
+        _, errors = self.config.validate_config({"something else": "1"})
+        assert errors == {"something else": "[something else]: is not part of the expected options."}
+        with pytest.raises(er.ParsingError, match=r"Did you mean \[limit\]\?"):
+            self.config.merge_config({"limt": "1"}, {})
+
+    def test_merge(self):
+        assert self.config.merge_config({"Groceries": "a"}, {"MAX_ITEMS": "4"}) == {
+            "shopping list": "a",
+            "limit": "4",
+            }
+
+    def test_heal(self):
+        healed = self.config.heal_config(self.file_content)
+        assert healed == self.config.create_config({"shopping list": "eggs, milk, bread", "limit": "3"})
+
+    def test_revalidate(self):
+        previous_config = {"groceries": "a", "limit": "1"}
+        previous_validated, _ = self.config.validate_config(previous_config)
+        validated, errors, changed = self.config.revalidate(
+            previous_config, previous_validated, {"Shopping List": "a", "maximum": "2"}
+            )
+        assert validated == {"shopping list": ["a"], "limit": 2}
+        assert changed == {"limit"}
+
+    def test_conflicts(self):
+        config = TypeConfig(normalize_keys=True)
+        config.add_option(option="limit", type="Integer", help="A test option")
+        with pytest.raises(ValueError):
+            config.add_option(option="LIMIT", type="Integer", help="A test option")
+        with pytest.raises(ValueError):
+            config.add_option(option="other", type="Integer", help="A test option", aliases=("Limit",))
+        assert list(config.get_options()) == ["limit"]
+        # Adding an option again replaces its aliases
+        config.add_option(option="limit", type="Integer", help="A test option", aliases=("maximum",))
+        config.add_option(option="limit", type="Integer", help="A test option")
+        config.add_option(option="other", type="Integer", help="A test option", aliases=("maximum",))
+
+    def test_custom_normalization(self):
+        config = TypeConfig(normalize_keys=str.upper)
+        config.add_option(option="limit", type="Integer", help="A test option")
+        config.add_type(type="Integer", parse=int)
+        assert config.validate_config({"Limit": "1"}) == ({"limit": 1}, {})
+
+    def test_copies(self):
+        snapshot = self.config.snapshot({"list": self.config.get_types()["List"].parse})
+        copies = [
+            TypeConfig.from_snapshot(snapshot, {"list": self.config.get_types()["List"].parse}),
+            self.config.freeze(),
+            ]
+        for copy in copies:
+            assert copy.validate_config({"max_items": "1"}) == ({"limit": 1}, {})
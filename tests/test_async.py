@@ -0,0 +1,139 @@
+import asyncio
+import warnings
+
+import pytest
+
+from type_config import TypeConfig, types
+from type_config.errors import ValidationError
+
+
+async def is_value(value):
+    await asyncio.sleep(0)
+    return value == "value"
+
+
+async def cast_async(value):
+    await asyncio.sleep(0)
+    return "Async passed"
+
+
+class IsValue:
+    async def __call__(self, value):
+        await asyncio.sleep(0)
+        return value == "value"
+
+
+class TestAsyncValidation:
+    config = TypeConfig()
+
+    config_to_validate = {
+            "sync": "value",
+            "async": "value",
+            "async2": "wrong",
+            "empty": "",
+            "ayyy": "value",
+            }
+
+    result = (
+            {"sync": "Sync passed", "async": "Async passed"},
+            {
+                "async2": "[async2]: The test value was not 'value' (value: wrong)",
+                "empty": "[empty]: can't be left empty.",
+                "ayyy": "[ayyy]: is not part of the expected options.",
+            },
+        )
+
+    def setup_class(self):
+        for option, type in (("sync", "SyncType"), ("async", "AsyncType"), ("async2", "AsyncType"), ("empty", "AsyncType")):
+            self.config.add_option(
+                    option=option,
+                    type=type,
+                    help="A test option",
+                    )
+        self.config.add_type(
+                type="SyncType",
+                validate=lambda x: x == "value",
+                cast=lambda x: "Sync passed",
+                error="The test value was not 'value'",
+                )
+        self.config.add_type(
+                type="AsyncType",
+                validate=is_value,
+                cast=cast_async,
+                error="The test value was not 'value'",
+                )
+
+    def test_avalidate(self):
+        assert asyncio.run(self.config.avalidate_config(self.config_to_validate)) == self.result
+
+    def test_keeps_order(self):
+        validated, errors = asyncio.run(self.config.avalidate_config(self.config_to_validate))
+        assert list(errors) == list(self.result[1])
+
+    def test_max_concurrency(self):
+        running = 0
+        most_running = 0
+
+        async def counting_validate(value):
+            nonlocal running, most_running
+            running += 1
+            most_running = max(most_running, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return True
+
+        config = TypeConfig()
+        config.add_type(type="Counting", validate=counting_validate, cast=str, error="")
+        for index in range(10):
+            config.add_option(option=f"test{index}", type="Counting", help="A test option")
+
+        values = {f"test{index}": "value" for index in range(10)}
+        validated, _ = asyncio.run(config.avalidate_config(values, max_concurrency=3))
+        assert len(validated) == 10
+        assert most_running == 3
+
+    def test_sync_validation_rejects_async_types(self):
+        assert self.config.validate_config({"async": "value"}) == (
+            {},
+            {"async": "[async]: the type [AsyncType] is asynchronous, use avalidate_config."},
+        )
+        with pytest.raises(ValidationError, match=r"use avalidate_config"):
+            self.config._validate_option("async", "value")
+
+    def test_aparse_and_validate(self):
+        file_content = "sync = value\nasync = value\nbroken"
+        assert asyncio.run(self.config.aparse_and_validate(file_content)) == (
+            {"sync": "Sync passed", "async": "Async passed"},
+            {"broken": "A broken line has been found."},
+        )
+
+    def test_callable_objects_and_returned_coroutines(self):
+        config = TypeConfig()
+        config.add_type(type="Object", validate=IsValue(), cast=str, error="Not 'value'")
+        config.add_type(type="Lambda", validate=lambda value: is_value(value), cast=str, error="Not 'value'")
+        config.add_type(type="Parse", parse=lambda value: cast_async(value))
+        config.add_type(type="Integer", **types.integer())
+        for type in ("Object", "Lambda", "Parse", "Integer"):
+            config.add_option(option=type, type=type, help="A test option")
+            config.add_option(option=f"wrong {type}", type=type, help="A test option")
+        values = {"Object": "value", "Lambda": "value", "Parse": "1", "Integer": "1"}
+        values.update({f"wrong {type}": "wrong" for type in ("Object", "Lambda", "Integer")})
+
+        assert asyncio.run(config.avalidate_config(values)) == (
+            {"Object": "value", "Lambda": "value", "Parse": "Async passed", "Integer": 1},
+            {
+                "wrong Object": "[wrong Object]: Not 'value' (value: wrong)",
+                "wrong Lambda": "[wrong Lambda]: Not 'value' (value: wrong)",
+                "wrong Integer": "[wrong Integer]: The value must be an integer (value: wrong)",
+            },
+        )
+
+        # Without an event loop they are rejected, instead of taking
+        # the coroutine as a valid result
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            validated, errors = config.validate_config(values)
+        assert validated == {"Integer": 1}
+        assert errors["Object"] == "[Object]: the type [Object] is asynchronous, use avalidate_config."
+        assert errors["wrong Lambda"] == "[wrong Lambda]: the type [Lambda] is asynchronous, use avalidate_config."
+        assert errors["Parse"] == "[Parse]: the type [Parse] is asynchronous, use avalidate_config."
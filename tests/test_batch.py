@@ -0,0 +1,89 @@
+import pytest
+
+from type_config import TypeConfig
+
+
+class TestBatchValidation:
+    config = TypeConfig()
+    batches = []
+
+    configs = [
+            {"number": "1", "test": "value", "empty": ""},
+            {"number": "", "ayyy": "value", "test": "wrong"},
+            {"test": "value", "number": "nope", "empty": None},
+            {},
+            ]
+
+    def setup_class(self):
+        self.config.add_option(
+                option="number",
+                type="Number",
+                help="A test option",
+                default="0",
+                )
+        self.config.add_option(
+                option="test",
+                type="TestType",
+                help="A test option",
+                )
+        self.config.add_option(
+                option="empty",
+                type="Number",
+                help="A test option",
+                can_be_empty=True,
+                )
+        self.config.add_type(
+                type="Number",
+                validate=lambda x: x is None or x.isdigit(),
+                cast=lambda x: int(x) if x else None,
+                error="The value must be a number",
+                validate_batch=self.validate_numbers,
+                cast_batch=self.cast_numbers,
+                )
+        self.config.add_type(
+                type="TestType",
+                validate=lambda x: x == "value",
+                cast=lambda x: "Test passed",
+                error="The test value was not 'value'",
+                )
+
+    @classmethod
+    def validate_numbers(cls, values):
+        cls.batches.append(list(values))
+        return [value is None or value.isdigit() for value in values]
+
+    @staticmethod
+    def cast_numbers(values):
+        return [int(value) if value else None for value in values]
+
+    def setup_method(self):
+        self.batches.clear()
+
+    def test_same_results_as_validate(self):
+        assert self.config.validate_many(self.configs) == [
+            self.config.validate_config(config) for config in self.configs
+        ]
+
+    def test_same_order_as_validate(self):
+        for result, config in zip(self.config.validate_many(self.configs), self.configs):
+            expected = self.config.validate_config(config)
+            assert list(result[0]) == list(expected[0])
+            assert list(result[1]) == list(expected[1])
+
+    def test_one_batch_per_column(self):
+        self.config.validate_many(self.configs)
+        assert self.batches == [["1", "0", "nope"], [None, None]]
+
+    @pytest.mark.parametrize("hook", ["validate_batch", "cast_batch"])
+    def test_wrong_number_of_results(self, hook):
+        config = TypeConfig()
+        config.add_option(option="number", type="Number", help="A test option")
+        config.add_type(
+                type="Number",
+                validate=str.isdigit,
+                cast=int,
+                error="The value must be a number",
+                **{hook: lambda values: [True] * (len(values) - 1)},
+                )
+        with pytest.raises(ValueError, match=rf"\[Number\]: {hook} returned 1 results for 2 values"):
+            config.validate_many([{"number": "1"}, {"number": "2"}])
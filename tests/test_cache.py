@@ -0,0 +1,85 @@
+from types import MappingProxyType
+
+from type_config import TypeConfig
+
+
+class TestCache:
+    file_content = (
+        "test = value\n"
+        "test2 = \n"
+        "test | broken\n"
+    )
+
+    result = (
+        {"test": "Test passed"},
+        {"test | broken": "A broken line has been found.", "test2": "[test2]: can't be left empty."},
+    )
+
+    def setup_method(self):
+        self.casts = 0
+        self.config = self.make_config(cache_size=2)
+
+    def make_config(self, cache_size):
+        config = TypeConfig(cache_size=cache_size)
+        config.add_option(
+                option="test",
+                type="TestType",
+                help="A test option",
+                )
+        config.add_option(
+                option="test2",
+                type="TestType",
+                help="A test option",
+                )
+        config.add_type(
+                type="TestType",
+                validate=lambda x: x == "value",
+                cast=self.cast,
+                error="The test value was not 'value'"
+                )
+        return config
+
+    def cast(self, value):
+        self.casts += 1
+        return "Test passed"
+
+    def test_without_cache(self):
+        config = self.make_config(cache_size=0)
+        assert config.parse_and_validate(self.file_content) == self.result
+        assert config.cache_info()["size"] == 0
+
+    def test_hit(self):
+        first = self.config.parse_and_validate(self.file_content)
+        second = self.config.parse_and_validate(self.file_content.encode())
+        assert first == second == self.result
+        assert first[0] is second[0]
+        assert self.casts == 1
+        assert self.config.cache_info() == {"hits": 1, "misses": 1, "size": 1, "max_size": 2}
+
+    def test_read_only(self):
+        validated, errors = self.config.parse_and_validate(self.file_content)
+        assert isinstance(validated, MappingProxyType)
+        assert isinstance(errors, MappingProxyType)
+
+    def test_schema_change(self):
+        self.config.parse_and_validate(self.file_content)
+        self.config.add_option(option="test3", type="TestType", help="A test option")
+        self.config.parse_and_validate(self.file_content)
+        assert self.casts == 2
+
+    def test_lru_eviction(self):
+        self.config.parse_and_validate("test = value")
+        self.config.parse_and_validate("test = other")
+        self.config.parse_and_validate("test = value")
+        self.config.parse_and_validate("test2 = value")
+        assert self.config.cache_info()["size"] == 2
+        # "test = other" was the least recently used
+        self.config.parse_and_validate("test = value")
+        assert self.config.cache_info()["hits"] == 2
+        self.config.parse_and_validate("test = other")
+        assert self.config.cache_info()["misses"] == 4
+
+    def test_clear(self):
+        self.config.parse_and_validate(self.file_content)
+        self.config.clear_cache()
+        assert self.config.cache_info() == {"hits": 0, "misses": 0, "size": 0, "max_size": 2}
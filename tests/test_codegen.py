@@ -0,0 +1,153 @@
+import enum
+import importlib
+import os
+import random
+import sys
+import types as python_types
+
+import pytest
+
+from type_config import TypeConfig, types
+
+
+class Color(enum.Enum):
+    RED = "red"
+    BLUE = "blue"
+
+
+def load(source, name="generated_config"):
+    module = python_types.ModuleType(name)
+    exec(compile(source, name, "exec"), module.__dict__)
+    return module
+
+
+def is_word(value):
+    return value is None or value.isalnum()
+
+
+def random_file(options, seed):
+    """
+    Return a config file mixing good, bad, empty and unknown values,
+    aliases, comments and broken lines.
+    """
+    generator = random.Random(seed)
+    values = ("1", "-3", "12", "abc", "a b", "", "true", "no", "RED", "blue", "1, 2", "1, x", "5kb", "1h")
+    names = list(options) + ["port", "PORT NUMBER", "  Port   number ", "prot number", "unknown"]
+    lines = []
+    for _ in range(40):
+        kind = generator.random()
+        if kind < 0.1:
+            lines.append("# a comment")
+        elif kind < 0.2:
+            lines.append(generator.choice(("broken line", "= value", "[Type] broken", "")))
+        else:
+            line = f"{generator.choice(names)} = {generator.choice(values)}"
+            if generator.random() < 0.2:
+                line = "[Type] " + line
+            if generator.random() < 0.2:
+                line += " # inline"
+            lines.append(line)
+    return "\n".join(lines)
+
+
+class TestCodegen:
+    def make_config(self, normalize_keys):
+        config = TypeConfig(normalize_keys=normalize_keys)
+        config.add_type(type="Integer", **types.integer(minimum=0))
+        config.add_type(type="Boolean", **types.boolean())
+        config.add_type(type="Color", **types.choice(Color))
+        config.add_type(type="Letter", **types.choice(["a", "b"], case_sensitive=False))
+        config.add_type(type="Numbers", **types.list_of(types.integer()))
+        config.add_type(type="Size", **types.size())
+        config.add_type(type="Duration", **types.duration())
+        config.add_type(type="Word", validate=is_word, cast=str, error="Must be a single word")
+        config.add_type(
+            type="Lambda",
+            validate=lambda value: value is None or value.isdigit(),
+            cast=lambda value: value and int(value),
+            error="Must be digits",
+        )
+        config.add_option(option="Port Number", type="Integer", help="x", default="80", aliases=("port",))
+        config.add_option(option="debug", type="Boolean", help="x", can_be_empty=True)
+        config.add_option(option="color", type="Color", help="x", default="red")
+        config.add_option(option="letter", type="Letter", help="x")
+        config.add_option(option="numbers", type="Numbers", help="x", can_be_empty=True)
+        config.add_option(option="size", type="Size", help="x", default="1kb")
+        config.add_option(option="timeout", type="Duration", help="x")
+        config.add_option(option="word", type="Word", help="x", can_be_empty=True)
+        config.add_option(option="digits", type="Lambda", help="x", default="7")
+        config.add_option(option="it's \"odd\"", type="Missing", help="x")
+        return config
+
+    def registry(self, config):
+        lambda_type = config.get_types()["Lambda"]
+        return {"lambda.validate": lambda_type.validate, "lambda.cast": lambda_type.cast}
+
+    @pytest.mark.parametrize("normalize_keys", [False, True])
+    def test_same_results(self, normalize_keys):
+        config = self.make_config(normalize_keys)
+        module = load(config.generate_module(self.registry(config)))
+        assert set(module.REGISTRY_NAMES) == {"lambda.validate", "lambda.cast"}
+        module.bind(self.registry(config))
+
+        for seed in range(200):
+            file_content = random_file(config.get_options(), seed)
+            parsed, parsing_errors = config.parse_config(file_content)
+            validated, errors = config.validate_config(parsed)
+            assert module.parse_and_validate(file_content) == (validated, {**parsing_errors, **errors})
+            assert module.parse_and_validate(file_content.encode()) == (validated, {**parsing_errors, **errors})
+
+    def test_same_as_parse_and_validate(self):
+        config = TypeConfig()
+        config.add_type(type="Integer", validate=str.isdigit, cast=int, error="Must be an integer")
+        for index in range(20):
+            config.add_option(option=f"option {index}", type="Integer", help="x", default="1" if index % 2 else "")
+        module = load(config.generate_module())
+        file_content = "\n".join(f"option {index} = {index if index % 3 else ''}" for index in range(25))
+        assert module.parse_and_validate(file_content) == config.parse_and_validate(file_content)
+        assert module.REGISTRY_NAMES == ()
+
+    def test_asynchronous_type(self):
+        async def check(value):
+            return True
+
+        config = TypeConfig()
+        config.add_type(type="Async", validate=check, cast=str)
+        config.add_option(option="test", type="Async", help="x")
+        config.add_type(type="Returned", validate=lambda value: check(value), cast=str)
+        config.add_option(option="returned", type="Returned", help="x")
+        config.add_type(type="Parse", parse=lambda value: check(value))
+        config.add_option(option="parse", type="Parse", help="x")
+        # Functions returning coroutines are rejected like by validate_config
+        registry = {
+            "check": check,
+            "str": str,
+            "returned": config.get_types()["Returned"].validate,
+            "parse": config.get_types()["Parse"].parse,
+        }
+        module = load(config.generate_module(registry))
+        module.bind(registry)
+        file_content = "test = 1\nreturned = 1\nparse = 1"
+        assert module.parse_and_validate(file_content) == config.parse_and_validate(file_content)
+
+    def test_unregistered_function(self):
+        config = self.make_config(False)
+        with pytest.raises(ValueError, match=r"\[Lambda\]: .* add it to the registry"):
+            config.generate_module()
+
+    def test_importable(self, tmp_path, monkeypatch):
+        config = self.make_config(True)
+        path = tmp_path / "generated_schema.py"
+        path.write_text(config.generate_module(self.registry(config)))
+        monkeypatch.syspath_prepend(str(tmp_path))
+        monkeypatch.setattr(sys, "dont_write_bytecode", False)
+        module = importlib.import_module("generated_schema")
+        try:
+            module.bind(self.registry(config))
+            file_content = "port = 8080\ncolor = blue\nletter = A\ntimeout = 1h\nwrod = x"
+            expected = config.parse_and_validate(file_content)
+            assert module.parse_and_validate(file_content) == expected
+            assert module.__file__ == str(path)
+            assert os.path.exists(importlib.util.cache_from_source(str(path)))
+        finally:
+            del sys.modules["generated_schema"]
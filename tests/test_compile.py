@@ -0,0 +1,67 @@
+from type_config import TypeConfig
+from type_config.errors import ValidationError
+
+
+class TestCompile:
+    def setup_method(self):
+        self.config = TypeConfig()
+        self.config.add_option(
+                option="test",
+                type="TestType",
+                help="A test option",
+                )
+        self.config.add_option(
+                option="testDefault",
+                type="TestType",
+                help="A test option",
+                default="value"
+                )
+        self.config.add_option(
+                option="test2",
+                type="FakeType",
+                help="A test option",
+                )
+        self.config.add_type(
+                type="TestType",
+                validate=lambda x: x == "value",
+                cast=lambda x: "Test passed",
+                error="The test value was not 'value'"
+                )
+
+    def test_unknown_types(self):
+        assert self.config.compile() == {"test2": "[FakeType]: is not part of the expected types."}
+
+    def test_same_results_as_lookup(self):
+        config = {"test": "value", "testDefault": "", "test2": "value", "ayyy": "value", "bad": "nope"}
+        self.config.add_option(option="bad", type="TestType", help="A test option")
+        self.config.compile()
+
+        expected_validated = {}
+        expected_errors = {}
+        for option, value in config.items():
+            try:
+                expected_validated[option] = self.config._validate_option(option, value)
+            except ValidationError as err:
+                expected_errors[option] = str(err)
+
+        assert self.config.validate_config(config) == (expected_validated, expected_errors)
+
+    def test_adding_type_invalidates_plan(self):
+        self.config.compile()
+        self.config.add_type(
+                type="FakeType",
+                validate=lambda x: True,
+                cast=lambda x: "Fake passed",
+                error=""
+                )
+        assert self.config.validate_config({"test2": "value"}) == ({"test2": "Fake passed"}, {})
+
+    def test_adding_option_invalidates_plan(self):
+        self.config.compile()
+        self.config.add_option(option="new", type="TestType", help="A test option")
+        assert self.config.validate_config({"new": "value"}) == ({"new": "Test passed"}, {})
+
+    def test_compiles_on_first_validation(self):
+        assert self.config._plan is None
+        self.config.validate_config({"test": "value"})
+        assert self.config._plan is not None
@@ -0,0 +1,93 @@
+import io
+
+from type_config import TypeConfig
+from type_config.specs import BrokenLine
+
+
+class TestErrorRecords:
+    config = TypeConfig()
+    file_content = (
+        "# A comment\n"
+        "test = value\n"
+        "\n"
+        "  broken line # with a comment\n"
+        "broken line\n"
+        "[TestType]  also broken\n"
+        "[TestType]\n"
+        "test2 = value2\n"
+    )
+    error = "A broken line has been found."
+
+    def setup_class(self):
+        self.config.add_option(
+                option="test",
+                type="TestType",
+                help="A test option",
+                aliases=("alias",),
+                )
+
+    def test_records(self):
+        config, errors, error_count = self.config.parse_config_records(self.file_content)
+        assert config == {"test": "value", "test2": "value2"}
+        assert errors == [
+            BrokenLine(4, 3, 14, "broken line # with a comment", self.error),
+            BrokenLine(5, 1, 12, "broken line", self.error),
+            BrokenLine(6, 13, 24, "[TestType]  also broken", self.error),
+            BrokenLine(7, 1, 11, "[TestType]", self.error),
+        ]
+        assert error_count == 4
+        # Records can be read like dictionaries
+        assert dict(errors[0])["line_number"] == 4
+
+    def test_same_as_parse_config(self):
+        config, errors, _ = self.config.parse_config_records(self.file_content)
+        assert (config, {error.line: error.error for error in errors}) == self.config.parse_config(
+            self.file_content
+        )
+
+    def test_sources(self):
+        expected = self.config.parse_config_records(self.file_content)
+        assert self.config.parse_config_records(self.file_content.encode()) == expected
+        assert self.config.parse_config_records(io.StringIO(self.file_content)) == expected
+        assert self.config.parse_config_records(self.file_content.replace("\n", "\r\n")) == expected
+        # Lines without their line ending, empty lines included
+        assert self.config.parse_config_records(self.file_content.split("\n")) == expected
+        assert self.config.parse_config_records(["a = 1", "", "broken", "# c", "broken"])[1] == [
+            BrokenLine(3, 1, 7, "broken", self.error),
+            BrokenLine(5, 1, 7, "broken", self.error),
+        ]
+
+    def test_aliases(self):
+        config, _, _ = self.config.parse_config_records("alias = 1")
+        assert config == {"test": "1"}
+
+    def test_max_errors(self):
+        file_content = "broken\n" * 10 + "test = value\n"
+        config, errors, error_count = self.config.parse_config_records(file_content, max_errors=3)
+        assert config == {"test": "value"}
+        assert [error.line_number for error in errors] == [1, 2, 3]
+        assert error_count == 10
+
+    def test_stop_on_max_errors(self):
+        file_content = "test = value\n" + "broken\n" * 10 + "test2 = value\n"
+        config, errors, error_count = self.config.parse_config_records(
+            file_content, max_errors=3, stop_on_max_errors=True
+        )
+        assert config == {"test": "value"}
+        assert len(errors) == error_count == 3
+
+        config, errors, error_count = self.config.parse_config_records(
+            file_content, max_errors=0, stop_on_max_errors=True
+        )
+        assert (config, errors, error_count) == ({"test": "value"}, [], 1)
+
+    def test_stops_reading(self):
+        lines_read = []
+
+        def lines():
+            for number in range(1000):
+                lines_read.append(number)
+                yield "broken"
+
+        self.config.parse_config_records(lines(), max_errors=5, stop_on_max_errors=True)
+        assert len(lines_read) == 5
@@ -0,0 +1,54 @@
+import random
+
+from type_config import TypeConfig
+
+
+class TestFileParsing:
+    config = TypeConfig()
+
+    file_content = (
+        "# A comment with unicode: àèìòù\n"
+        "\n"
+        "[TestType] test = value # inline comment\n"
+        "test2 = \n"
+        "test | broken\n"
+        "   # Another comment\n"
+        "unicode option = välue\n"
+        "\xa0= only unicode whitespace before the equal sign\n"
+        "windows = line ending\r\n"
+        "# a comment\u2028split = by a unicode line break\n"
+        "vertical\x0btab = value\n"
+        "no = newline at the end"
+    )
+
+    def parse_file(self, tmp_path, content: str):
+        path = tmp_path / "config.ini"
+        path.write_bytes(content.encode("utf-8"))
+        return self.config.parse_config_file(path)
+
+    def test_same_as_parse_config(self, tmp_path):
+        assert self.parse_file(tmp_path, self.file_content) == self.config.parse_config(self.file_content)
+
+    def test_ascii_file(self, tmp_path):
+        content = "test = value\n# comment\ntest2 = other value # comment\nbroken line\n"
+        assert self.parse_file(tmp_path, content) == (
+            {"test": "value", "test2": "other value"},
+            {"broken line": "A broken line has been found."},
+        )
+
+    def test_empty_file(self, tmp_path):
+        assert self.parse_file(tmp_path, "") == ({}, {})
+
+    def test_random_files_without_special_characters(self, tmp_path):
+        pieces = ["a", "b", " ", "=", "#", "]", "[", "\n", "\r\n", "\t", "\xa0", "é"]
+        generator = random.Random(42)
+        for _ in range(300):
+            content = "".join(generator.choice(pieces) for _ in range(generator.randint(0, 40)))
+            assert self.parse_file(tmp_path, content) == self.config.parse_config(content), repr(content)
+
+    def test_random_files(self, tmp_path):
+        pieces = ["a", "b", " ", "=", "#", "]", "[", "\n", "\r", "\r\n", "\t", "\x0b", "\x0c", "\x1c", "\x1f", "\x85", "\u2028", "\xa0", "é", "\u3000"]
+        generator = random.Random(42)
+        for _ in range(300):
+            content = "".join(generator.choice(pieces) for _ in range(generator.randint(0, 40)))
+            assert self.parse_file(tmp_path, content) == self.config.parse_config(content), repr(content)
@@ -0,0 +1,114 @@
+import threading
+
+import pytest
+
+from type_config import TypeConfig
+from type_config.frozen import FrozenTypeConfig
+
+
+class TestFrozen:
+    config = TypeConfig(cache_size=8)
+
+    file_content = (
+        "test = value\n"
+        "test2 = wrong\n"
+        "broken line\n"
+    )
+
+    def setup_class(self):
+        self.config.add_option(
+                option="test",
+                type="TestType",
+                help="A test option",
+                default="value",
+                )
+        self.config.add_option(
+                option="test2",
+                type="TestType",
+                help="A test option",
+                )
+        self.config.add_type(
+                type="TestType",
+                validate=lambda x: x == "value",
+                cast=lambda x: "Test passed",
+                error="The test value was not 'value'"
+                )
+        self.frozen = self.config.freeze()
+
+    def test_same_api(self):
+        assert isinstance(self.frozen, FrozenTypeConfig)
+        assert self.frozen.parse_config(self.file_content) == self.config.parse_config(self.file_content)
+        parsed, _ = self.config.parse_config(self.file_content)
+        assert self.frozen.validate_config(parsed) == self.config.validate_config(parsed)
+        assert self.frozen.merge_config(parsed, {}) == self.config.merge_config(parsed, {})
+        assert self.frozen.create_config() == self.config.create_config()
+        assert self.frozen.heal_config(self.file_content) == self.config.heal_config(self.file_content)
+
+    def test_read_only(self):
+        with pytest.raises(TypeError):
+            self.frozen.add_option(option="test3", type="TestType", help="A test option")
+        with pytest.raises(TypeError):
+            self.frozen.add_type(type="OtherType", validate=bool, cast=str, error="")
+        with pytest.raises(AttributeError):
+            self.frozen.type_hint = True
+        with pytest.raises(TypeError):
+            self.frozen._options["test3"] = None
+
+    def test_not_affected_by_original(self):
+        config = TypeConfig()
+        config.add_option(option="test", type="TestType", help="A test option")
+        frozen = config.freeze()
+        config.add_option(option="test2", type="TestType", help="A test option")
+        assert list(frozen.get_options()) == ["test"]
+
+    def test_hashable(self):
+        assert hash(self.frozen) == hash(self.config.freeze())
+        assert self.frozen == self.config.freeze()
+        assert len({self.frozen, self.config.freeze()}) == 1
+
+    def test_hashable_with_unhashable_values(self):
+        def make_frozen(default):
+            config = TypeConfig()
+            config.add_option(option="test", type="TestType", help="A test option", default=default)
+            return config.freeze()
+
+        assert hash(make_frozen(["a", "b"])) == hash(make_frozen(["a", "b"]))
+        assert make_frozen(["a", "b"]) == make_frozen(["a", "b"])
+        assert make_frozen(["a", "b"]) != make_frozen(["c"])
+        assert len({make_frozen(["a", "b"]), make_frozen(["a", "b"]), make_frozen(["c"])}) == 2
+
+    def test_concurrent_calls(self):
+        parsed, _ = self.config.parse_config(self.file_content)
+        expected = (
+            self.config.validate_config(parsed),
+            self.config.parse_and_validate(self.file_content),
+            self.config.create_config({"test2": "injected"}),
+            self.config.heal_config(self.file_content),
+        )
+        results = []
+        errors = []
+        barrier = threading.Barrier(16)
+
+        def work():
+            try:
+                barrier.wait()
+                for _ in range(200):
+                    results.append((
+                        self.frozen.validate_config(parsed),
+                        self.frozen.parse_and_validate(self.file_content),
+                        self.frozen.create_config({"test2": "injected"}),
+                        self.frozen.heal_config(self.file_content),
+                    ))
+            except Exception as err:
+                errors.append(err)
+
+        threads = [threading.Thread(target=work) for _ in range(16)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert errors == []
+        assert len(results) == 16 * 200
+        assert all(result == expected for result in results)
+        assert self.frozen.cache_info()["hits"] == 16 * 200 - 1
@@ -0,0 +1,74 @@
+from concurrent.futures import ThreadPoolExecutor
+
+from type_config import TypeConfig
+
+
+class TestHealReport:
+    config = TypeConfig()
+
+    broken_config = """
+    test = kept value
+    [TestType] test2 value
+    unknown option = value
+    test3 = first value
+    test3 = second value # repeated option
+    test2 = a = b
+    test4 =
+    """
+
+    healed_config = (
+        "test = kept value\n"
+        "# A test option\n"
+        "\n"
+        "test2 = \n"
+        "# A test option\n"
+        "\n"
+        "test3 = second value\n"
+        "# A test option\n"
+        "\n"
+        "test4 = default value\n"
+        "# A test option"
+    )
+
+    report = {
+        "kept": ["test", "test3"],
+        "dropped": [
+            "[TestType] test2 value",
+            "unknown option = value",
+            "test3 = first value",
+            "test2 = a = b",
+        ],
+        "defaulted": ["test2", "test4"],
+    }
+
+    def setup_class(self):
+        for option in ("test", "test2", "test3"):
+            self.config.add_option(
+                    option=option,
+                    type="TestType",
+                    help="A test option",
+                    )
+        self.config.add_option(
+                option="test4",
+                type="TestType",
+                help="A test option",
+                default="default value",
+                )
+
+    def test_broken_lines_dont_stop_healing(self):
+        assert self.config.heal_config(self.broken_config) == self.healed_config
+
+    def test_report(self):
+        assert self.config.heal_config_report(self.broken_config) == (self.healed_config, self.report)
+
+    def test_options_are_untouched(self):
+        options = self.config.get_options()
+        self.config.heal_config(self.broken_config)
+        assert self.config.get_options() == options
+
+    def test_concurrent_healing(self):
+        files = [f"test = value {index}\ntest4 = other {index}" for index in range(200)]
+        with ThreadPoolExecutor(8) as executor:
+            results = list(executor.map(self.config.heal_config, files))
+        assert results == [self.config.heal_config(file) for file in files]
+        assert self.config.create_config().startswith("test = \n")
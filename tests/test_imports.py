@@ -0,0 +1,61 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import type_config
+
+
+def imported_modules(code):
+    """
+    Return the modules imported after running code in a new process.
+    """
+    environment = {**os.environ, "PYTHONPATH": os.pathsep.join(sys.path)}
+    output = subprocess.run(
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(sorted(sys.modules))"],
+        capture_output=True,
+        check=True,
+        text=True,
+        env=environment,
+    ).stdout
+    return set(eval(output))
+
+
+class TestImports:
+    slow_modules = {"asyncio", "concurrent.futures", "inspect", "difflib", "hashlib", "pickle", "ctypes"}
+
+    def test_import(self):
+        modules = imported_modules("from type_config import TypeConfig")
+        assert modules & self.slow_modules == set()
+        assert {module for module in modules if module.startswith("type_config")} == {
+            "type_config",
+            "type_config.errors",
+            "type_config.lookup",
+            "type_config.parallel",
+            "type_config.specs",
+        }
+
+    def test_validate(self):
+        modules = imported_modules(
+            "from type_config import TypeConfig\n"
+            "config = TypeConfig()\n"
+            "config.add_option(option='test', type='Integer', help='A test option')\n"
+            "config.add_type(type='Integer', validate=str.isdigit, cast=int)\n"
+            "assert config.parse_and_validate('test = 1') == ({'test': 1}, {})\n"
+        )
+        assert modules & self.slow_modules == set()
+
+    def test_lazy_names(self):
+        from type_config.frozen import FrozenTypeConfig
+        from type_config.lazy import LazyConfig
+        from type_config.profiling import ProfileStats
+        from type_config.watching import ConfigWatcher
+
+        assert type_config.FrozenTypeConfig is FrozenTypeConfig
+        assert type_config.LazyConfig is LazyConfig
+        assert type_config.ProfileStats is ProfileStats
+        assert type_config.ConfigWatcher is ConfigWatcher
+        assert {"TypeConfig", "FrozenTypeConfig", "ConfigWatcher"} <= set(dir(type_config))
+        with pytest.raises(AttributeError):
+            type_config.Missing
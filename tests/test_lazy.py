@@ -0,0 +1,86 @@
+from collections.abc import Mapping
+
+import pytest
+
+import type_config.errors as er
+from type_config import TypeConfig
+
+
+class TestLazy:
+    config = TypeConfig(normalize_keys=True)
+    calls = []
+
+    file_content = (
+        "test = value\n"
+        "test2 = wrong\n"
+        "ayyy = value\n"
+        "broken line\n"
+        "test3 = \n"
+    )
+
+    def setup_class(self):
+        for option in ("test", "test2", "test3"):
+            self.config.add_option(
+                    option=option,
+                    type="TestType",
+                    help="A test option",
+                    can_be_empty=option == "test3",
+                    aliases=(f"{option} alias",),
+                    )
+        self.config.add_type(
+                type="TestType",
+                validate=lambda x: self.calls.append(x) or x in ("value", None),
+                cast=lambda x: "Test passed" if x else None,
+                error="The test value was not 'value'"
+                )
+
+    def setup_method(self):
+        self.calls.clear()
+
+    def test_keys_without_validating(self):
+        lazy = self.config.load_lazy(self.file_content)
+        assert isinstance(lazy, Mapping)
+        assert list(lazy) == ["test", "test2", "ayyy", "test3"]
+        assert len(lazy) == 4
+        assert "test" in lazy and "TEST_ALIAS" in lazy and "test4" not in lazy
+        assert self.calls == []
+
+    def test_validated_once(self):
+        lazy = self.config.load_lazy(self.file_content)
+        assert lazy["test"] == "Test passed"
+        assert lazy["test"] == "Test passed"
+        assert lazy["Test-Alias"] == "Test passed"
+        assert lazy["test3"] is None
+        assert self.calls == ["value", None]
+
+    def test_errors(self):
+        lazy = self.config.load_lazy(self.file_content)
+        for _ in range(2):
+            with pytest.raises(er.ValidationError, match="not 'value'"):
+                lazy["test2"]
+        assert self.calls == ["wrong"]
+        with pytest.raises(er.ValidationError, match="not part of the expected options"):
+            lazy["ayyy"]
+        with pytest.raises(KeyError):
+            lazy["test4"]
+        assert lazy.get("test4", "default") == "default"
+
+    def test_validate_all(self):
+        lazy = self.config.load_lazy(self.file_content)
+        assert lazy["test"] == "Test passed"
+        errors = lazy.validate_all()
+        assert errors == self.config.parse_and_validate(self.file_content)[1]
+        assert self.calls.count("value") == 2
+        assert lazy.validate_all() == errors
+        assert self.calls.count("value") == 2
+
+    def test_same_as_eager(self):
+        lazy = self.config.load_lazy(self.file_content)
+        lazy.validate_all()
+        validated, _ = self.config.parse_and_validate(self.file_content)
+        assert {option: lazy[option] for option in validated} == validated
+
+    def test_read_only(self):
+        lazy = self.config.load_lazy(self.file_content)
+        with pytest.raises(TypeError):
+            lazy["test"] = "value"
@@ -0,0 +1,79 @@
+from type_config import TypeConfig
+
+
+class TestMergeLayers:
+    config = TypeConfig()
+
+    defaults = {"test": "default", "test2": None, "test3": "value3"}
+    system = {"test": "system", "testDefault": None}
+    user = {"test": None, "test2": "user", "emptyTest": None}
+    cli = {"test": False, "test3": None}
+
+    def setup_class(self):
+        for option in ("test", "test2", "test3"):
+            self.config.add_option(
+                    option=option,
+                    type="TestType",
+                    help="A test option",
+                    )
+        self.config.add_option(
+                option="testDefault",
+                type="TestType",
+                help="A test option",
+                default="value4",
+                )
+        self.config.add_option(
+                option="emptyTest",
+                type="TestType",
+                help="A test option",
+                can_be_empty=True,
+                )
+
+    def test_merge(self):
+        merged, errors = self.config.merge_configs(self.defaults, self.system, self.user, self.cli)
+        assert merged == {
+                "test": False,
+                "test2": "user",
+                "test3": "value3",
+                "testDefault": "value4",
+                "emptyTest": None,
+                }
+        assert errors == {}
+
+    def test_same_as_merge_config(self):
+        layers = ({**self.defaults, "test2": "default"}, self.system, self.user, self.cli)
+        chained = layers[0]
+        for layer in layers[1:]:
+            chained = self.config.merge_config(layer, chained)
+        assert self.config.merge_configs(*layers)[0] == chained
+        assert self.config.merge_configs(self.system, self.user) == (
+                self.config.merge_config(self.user, self.system),
+                {},
+                )
+
+    def test_provenance(self):
+        _, _, provenance = self.config.merge_configs(
+                self.defaults, self.system, self.user, self.cli, provenance=True
+                )
+        assert provenance == {
+                "test": 3,
+                "test2": 2,
+                "test3": 0,
+                "testDefault": "default",
+                "emptyTest": None,
+                }
+
+    def test_errors_collected(self):
+        merged, errors = self.config.merge_configs({"test": None, "tset2": "1"}, {"test3": "3"})
+        assert merged == {"test3": "3"}
+        assert list(errors) == ["test", "tset2"]
+        assert errors["test"] == "[test]: can't be left empty"
+        assert errors["tset2"].startswith("[tset2]: is not part of the expected options. Did you mean [test2]")
+
+    def test_layers_untouched(self):
+        layer = {"testDefault": None}
+        self.config.merge_configs(layer)
+        assert layer == {"testDefault": None}
+
+    def test_no_layers(self):
+        assert self.config.merge_configs() == ({}, {})
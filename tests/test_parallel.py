@@ -0,0 +1,86 @@
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from type_config import TypeConfig
+
+
+def is_value(value):
+    return value == "value"
+
+
+def to_upper(value):
+    return value.upper()
+
+
+class TestParallelValidation:
+    config = TypeConfig()
+    threads = set()
+
+    config_to_validate = {
+            "pure": "value",
+            "io": "value",
+            "io2": "wrong",
+            "cpu": "value",
+            "empty": "",
+            "ayyy": "value",
+            }
+
+    def setup_class(self):
+        for option, type in (("pure", "PureType"), ("io", "IOType"), ("io2", "IOType"), ("cpu", "CPUType"), ("empty", "IOType")):
+            self.config.add_option(
+                    option=option,
+                    type=type,
+                    help="A test option",
+                    )
+        self.config.add_type(
+                type="PureType",
+                validate=is_value,
+                cast=lambda x: self.threads.add(threading.get_ident()) or "Pure passed",
+                error="The test value was not 'value'",
+                )
+        self.config.add_type(
+                type="IOType",
+                validate=is_value,
+                cast=lambda x: self.threads.add(threading.get_ident()) or "IO passed",
+                error="The test value was not 'value'",
+                workload="io",
+                )
+        self.config.add_type(
+                type="CPUType",
+                validate=is_value,
+                cast=to_upper,
+                error="The test value was not 'value'",
+                workload="cpu",
+                )
+
+    def setup_method(self):
+        self.threads.clear()
+
+    def test_executor_matches_serial(self):
+        with ThreadPoolExecutor(4) as executor:
+            result = self.config.validate_config(self.config_to_validate, executor=executor)
+        assert result == self.config.validate_config(self.config_to_validate)
+        assert list(result[0]) == list(self.config.validate_config(self.config_to_validate)[0])
+
+    def test_executor_runs_io_types(self):
+        with ThreadPoolExecutor(4) as executor:
+            self.config.validate_config(self.config_to_validate, executor=executor)
+        assert threading.get_ident() in self.threads
+        assert len(self.threads) == 2
+
+    def test_parallel_matches_serial(self):
+        result = self.config.validate_config_parallel(self.config_to_validate, max_workers=2)
+        assert result == self.config.validate_config(self.config_to_validate)
+        assert result[0]["cpu"] == "VALUE"
+
+    def test_unknown_workload(self):
+        with pytest.raises(ValueError):
+            self.config.add_type(
+                    type="BadType",
+                    validate=is_value,
+                    cast=to_upper,
+                    error="",
+                    workload="gpu",
+                    )
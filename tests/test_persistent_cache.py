@@ -0,0 +1,254 @@
+import os
+import re
+import threading
+
+from type_config import TypeConfig, persistent_cache, types
+
+
+class Unpicklable:
+    def __init__(self, value):
+        self.value = value
+        self.lock = threading.Lock()
+
+    def __eq__(self, other):
+        return isinstance(other, Unpicklable) and other.value == self.value
+
+
+class Matches:
+    def __init__(self, pattern):
+        self.pattern = pattern
+
+    def __call__(self, value):
+        return value is not None and re.fullmatch(self.pattern, value) is not None
+
+
+def matching(pattern):
+    return lambda value: value is not None and pattern.fullmatch(value) is not None
+
+
+class TestPersistentCache:
+    file_content = (
+        "test = value\n"
+        "test2 = \n"
+        "test | broken\n"
+    )
+
+    result = (
+        {"test": "Test passed"},
+        {"test | broken": "A broken line has been found.", "test2": "[test2]: can't be left empty."},
+    )
+
+    casts = 0
+
+    def setup_method(self):
+        # Counted on the class: the state of self is part of the fingerprint
+        type(self).casts = 0
+
+    def make_config(self, cast=None, validate=None):
+        config = TypeConfig()
+        config.add_option(
+                option="test",
+                type="TestType",
+                help="A test option",
+                )
+        config.add_option(
+                option="test2",
+                type="TestType",
+                help="A test option",
+                )
+        config.add_type(
+                type="TestType",
+                validate=validate or (lambda x: x == "value"),
+                cast=cast or self.cast,
+                error="The test value was not 'value'"
+                )
+        return config
+
+    def cast(self, value):
+        type(self).casts += 1
+        return "Test passed"
+
+    def write(self, tmp_path, content):
+        path = tmp_path / "config.txt"
+        path.write_text(content)
+        return path
+
+    def test_without_cache(self, tmp_path):
+        path = self.write(tmp_path, self.file_content)
+        assert self.make_config().parse_and_validate_file(path) == self.result
+        assert self.make_config().parse_and_validate(self.file_content) == self.result
+
+    def test_warm_start(self, tmp_path):
+        path = self.write(tmp_path, self.file_content)
+        cache = tmp_path / "cache"
+        assert self.make_config().parse_and_validate_file(path, disk_cache=cache) == self.result
+        assert self.casts == 1
+        assert len(os.listdir(cache)) == 1
+
+        # Like another process, with the same schema
+        assert self.make_config().parse_and_validate_file(path, disk_cache=cache) == self.result
+        assert self.casts == 1
+
+    def test_content_changed(self, tmp_path):
+        path = self.write(tmp_path, self.file_content)
+        cache = tmp_path / "cache"
+        self.make_config().parse_and_validate_file(path, disk_cache=cache)
+        path.write_text("test = other\n")
+        validated, errors = self.make_config().parse_and_validate_file(path, disk_cache=cache)
+        assert validated == {}
+        assert errors == {"test": "[test]: The test value was not 'value' (value: other)"}
+        # The entry is replaced, not added
+        assert len(os.listdir(cache)) == 1
+
+    def test_schema_changed(self, tmp_path):
+        path = self.write(tmp_path, self.file_content)
+        cache = tmp_path / "cache"
+        config = self.make_config()
+        config.parse_and_validate_file(path, disk_cache=cache)
+
+        config.add_option(
+                option="test2",
+                type="TestType",
+                default="value",
+                help="A test option",
+                )
+        assert config.parse_and_validate_file(path, disk_cache=cache) == (
+            {"test": "Test passed", "test2": "Test passed"},
+            {"test | broken": "A broken line has been found."},
+        )
+        assert self.casts == 3
+
+        # The same option with another function
+        other = self.make_config(cast=lambda value: "Other cast")
+        assert other.parse_and_validate_file(path, disk_cache=cache)[0] == {"test": "Other cast"}
+
+        # Functions holding their state: methods of an object, callable
+        # objects and closures
+        path.write_text("test = abc\n")
+        error = "[test]: The test value was not 'value' (value: abc)"
+        for letters, digits in (
+            (re.compile("[a-z]+").fullmatch, re.compile("[0-9]+").fullmatch),
+            ({"abc"}.__contains__, {"123"}.__contains__),
+            (Matches("[a-z]+"), Matches("[0-9]+")),
+            (matching(re.compile("[a-z]+")), matching(re.compile("[0-9]+"))),
+        ):
+            config = self.make_config(validate=letters)
+            assert config.parse_and_validate_file(path, disk_cache=cache) == ({"test": "Test passed"}, {})
+            config = self.make_config(validate=digits)
+            assert config.parse_and_validate_file(path, disk_cache=cache) == ({}, {"test": error})
+
+    def test_fingerprint(self):
+        first = self.make_config()._get_fingerprint()
+        assert self.make_config()._get_fingerprint() == first
+        assert self.make_config(cast=str)._get_fingerprint() != first
+        assert TypeConfig(normalize_keys=True)._get_fingerprint() != TypeConfig()._get_fingerprint()
+        assert self.make_config().freeze()._get_fingerprint() == first
+
+        # The state of a function that can't be pickled can't be checked
+        lock = threading.Lock()
+        assert self.make_config(validate=lambda x: lock and x == "value")._get_fingerprint() is None
+
+    def test_unpicklable_state(self, tmp_path):
+        path = self.write(tmp_path, self.file_content)
+        cache = tmp_path / "cache"
+        lock = threading.Lock()
+        config = self.make_config(validate=lambda x: lock and x == "value")
+        assert config.parse_and_validate_file(path, disk_cache=cache) == self.result
+        assert not cache.exists()
+
+    def test_shared_directory(self, tmp_path):
+        path = self.write(tmp_path, self.file_content)
+        cache = tmp_path / "cache"
+        self.make_config().parse_and_validate_file(path, disk_cache=cache)
+        assert persistent_cache.is_private(cache)
+
+        # Others could write entries, which are unpickled: it isn't used
+        os.chmod(cache, 0o777)
+        assert not persistent_cache.is_private(cache)
+        assert self.make_config().parse_and_validate_file(path, disk_cache=cache) == self.result
+        assert self.casts == 2
+        os.unlink(persistent_cache.entry_path(cache, path))
+        self.make_config().parse_and_validate_file(path, disk_cache=cache)
+        assert os.listdir(cache) == []
+
+    def test_unpicklable_values(self, tmp_path):
+        path = self.write(tmp_path, "test = value\n")
+        cache = tmp_path / "cache"
+        config = self.make_config(cast=Unpicklable)
+        assert config.parse_and_validate_file(path, disk_cache=cache) == ({"test": Unpicklable("value")}, {})
+        # Only the parsing is skipped
+        assert config.parse_and_validate_file(path, disk_cache=cache) == ({"test": Unpicklable("value")}, {})
+
+    def test_io_types_validated_again(self, tmp_path):
+        folder = tmp_path / "folder"
+        folder.mkdir()
+        path = self.write(tmp_path, f"folder = {folder}\n")
+        cache = tmp_path / "cache"
+        config = TypeConfig()
+        config.add_option(option="folder", type="Folder", help="A folder")
+        config.add_type(type="Folder", **types.path(kind="directory"))
+
+        assert config.parse_and_validate_file(path, disk_cache=cache) == ({"folder": folder}, {})
+        folder.rmdir()
+        validated, errors = config.parse_and_validate_file(path, disk_cache=cache)
+        assert validated == {}
+        assert errors["folder"].startswith("[folder]: The value must be the path of an existing directory")
+
+    def test_errors_validated_again(self, tmp_path):
+        folder = tmp_path / "folder"
+        path = self.write(tmp_path, f"folder = {folder}\ntest = value\nbroken\n")
+        cache = tmp_path / "cache"
+        config = self.make_config(cast=Unpicklable)
+        config.add_option(option="folder", type="Folder", help="A folder")
+        config.add_type(type="Folder", **types.path(kind="directory"))
+
+        validated, errors = config.parse_and_validate_file(path, disk_cache=cache)
+        assert list(errors) == ["broken", "folder"]
+        # The values can't be stored, and their errors aren't kept either
+        folder.mkdir()
+        expected = ({"folder": folder, "test": Unpicklable("value")}, {"broken": "A broken line has been found."})
+        assert config.parse_and_validate_file(path, disk_cache=cache) == expected
+        assert config.parse_and_validate_file(path) == expected
+
+    def test_same_order(self, tmp_path):
+        folder = tmp_path / "folder"
+        folder.mkdir()
+        path = self.write(tmp_path, f"test2 = \nfolder = {folder}\ntest = value\nfolder2 = {folder}\n")
+        cache = tmp_path / "cache"
+        config = self.make_config()
+        for option in ("folder", "folder2"):
+            config.add_option(option=option, type="Folder", help="A folder")
+        config.add_type(type="Folder", **types.path(kind="directory"))
+
+        expected = config.parse_and_validate_file(path)
+        config.parse_and_validate_file(path, disk_cache=cache)
+        validated, errors = config.parse_and_validate_file(path, disk_cache=cache)
+        assert list(validated.items()) == list(expected[0].items())
+        assert list(errors.items()) == list(expected[1].items())
+
+    def test_broken_entry(self, tmp_path):
+        path = self.write(tmp_path, self.file_content)
+        cache = tmp_path / "cache"
+        self.make_config().parse_and_validate_file(path, disk_cache=cache)
+        entry = persistent_cache.entry_path(cache, path)
+        with open(entry, "r+b") as file:
+            file.truncate(os.path.getsize(entry) - 10)
+
+        assert self.make_config().parse_and_validate_file(path, disk_cache=cache) == self.result
+        assert self.casts == 2
+        assert self.make_config().parse_and_validate_file(path, disk_cache=cache) == self.result
+        assert self.casts == 2
+
+    def test_unwritable_directory(self, tmp_path):
+        path = self.write(tmp_path, self.file_content)
+        not_a_directory = tmp_path / "file"
+        not_a_directory.write_text("")
+        assert self.make_config().parse_and_validate_file(path, disk_cache=not_a_directory) == self.result
+        assert [name for name in os.listdir(tmp_path) if name.endswith(".tmp")] == []
+
+    def test_default_directory(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path / "xdg"))
+        assert persistent_cache.default_directory() == str(tmp_path / "xdg" / "type_config")
+        path = self.write(tmp_path, self.file_content)
+        self.make_config().parse_and_validate_file(path, disk_cache=True)
+        assert os.path.exists(persistent_cache.entry_path(persistent_cache.default_directory(), path))
@@ -0,0 +1,114 @@
+import asyncio
+import io
+import time
+
+import pytest
+
+import type_config.profiling as profiling
+from type_config import TypeConfig, types
+
+
+def slow_validate(value):
+    time.sleep(0.01)
+    return value == "value"
+
+
+class TestProfiling:
+    config = TypeConfig()
+    file_content = "test = value\ntest2 = wrong\nnumber = 12\nbroken line\n"
+
+    def setup_class(self):
+        self.config.add_option(
+                option="test",
+                type="SlowType",
+                help="A test option",
+                )
+        self.config.add_option(
+                option="test2",
+                type="SlowType",
+                help="A test option",
+                )
+        self.config.add_option(
+                option="number",
+                type="Integer",
+                help="A test option",
+                )
+        self.config.add_type(
+                type="SlowType",
+                validate=slow_validate,
+                cast=lambda x: "Test passed",
+                error="The test value was not 'value'"
+                )
+        self.config.add_type(type="Integer", **types.integer())
+
+    def test_counters(self):
+        expected = self.config.parse_and_validate(self.file_content)
+        with self.config.profile() as stats:
+            assert self.config.parse_and_validate(self.file_content) == expected
+
+        test = stats.options["test"]
+        assert test["type"] == "SlowType"
+        assert (test["calls"], test["failures"], test["validate_calls"], test["cast_calls"]) == (1, 0, 1, 1)
+        assert test["validate_seconds"] >= 0.01
+        test2 = stats.options["test2"]
+        assert (test2["calls"], test2["failures"], test2["validate_calls"], test2["cast_calls"]) == (1, 1, 1, 0)
+        # parse counts as validate
+        number = stats.options["number"]
+        assert (number["calls"], number["validate_calls"], number["cast_calls"]) == (1, 1, 0)
+
+        slow_type = stats.types()["SlowType"]
+        assert (slow_type["calls"], slow_type["failures"], slow_type["validate_calls"]) == (2, 1, 2)
+
+        assert stats.methods["parse_config"]["calls"] == 1
+        assert stats.methods["parse_config"]["bytes"] == len(self.file_content)
+        assert stats.methods["validate_config"]["bytes"] == len("value" + "wrong" + "12")
+        assert stats.methods["validate_config"]["seconds"] >= 0.02
+
+    def test_methods(self, tmp_path):
+        path = tmp_path / "config.txt"
+        path.write_text(self.file_content)
+        with self.config.profile() as stats:
+            self.config.parse_config(io.StringIO(self.file_content))
+            self.config.parse_config_file(path)
+            self.config.heal_config(self.file_content.encode())
+        for method in ("parse_config", "parse_config_file", "heal_config"):
+            assert stats.methods[method]["calls"] == 1
+            assert stats.methods[method]["bytes"] == len(self.file_content)
+
+    def test_asynchronous(self):
+        async def parse(value):
+            return int(value)
+
+        config = TypeConfig()
+        config.add_option(option="test", type="AsyncInteger", help="A test option")
+        config.add_type(type="AsyncInteger", parse=parse, error="Not an integer")
+        with config.profile() as stats:
+            asyncio.run(config.avalidate_config({"test": "x"}))
+        assert stats.options["test"]["calls"] == 1
+        assert stats.options["test"]["failures"] == 1
+        assert stats.options["test"]["validate_calls"] == 1
+
+    def test_disabled_after(self):
+        with self.config.profile() as stats:
+            self.config.validate_config({"number": "1"})
+        self.config.validate_config({"number": "1"})
+        assert stats.options["number"]["calls"] == 1
+        assert self.config._profile is None
+        assert not any(isinstance(validator, profiling.Counted) for validator in self.config._get_plan().values())
+
+    def test_export(self):
+        with self.config.profile() as stats:
+            self.config.validate_config({"number": "1", "test2": "wrong"})
+        exported = stats.as_dict()
+        assert set(exported) == {"options", "types", "methods"}
+        assert exported["types"]["Integer"]["calls"] == 1
+        table = stats.format_table()
+        assert "validate_config" in table
+        assert "SlowType" in table
+        assert "number" in table
+        assert str(stats) == table
+
+    def test_frozen(self):
+        with pytest.raises(TypeError):
+            with self.config.freeze().profile():
+                pass
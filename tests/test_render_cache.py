@@ -0,0 +1,37 @@
+from type_config import TypeConfig
+
+
+class TestRenderCache:
+    def setup_method(self):
+        self.config = TypeConfig()
+        self.config.add_option(
+                option="test",
+                type="TestType",
+                help="A test option",
+                default="value",
+                )
+
+    def test_type_hint_change(self):
+        assert self.config.create_config() == "test = value\n# A test option"
+        self.config.type_hint = True
+        assert self.config.create_config() == "[TestType] test = value\n# A test option"
+        self.config.type_hint = False
+        assert self.config.create_config() == "test = value\n# A test option"
+
+    def test_option_added(self):
+        self.config.create_config()
+        self.config.add_option(option="test2", type="TestType", help="Another option")
+        assert self.config.create_config() == (
+            "test = value\n# A test option\n\ntest2 = \n# Another option"
+        )
+
+    def test_option_replaced(self):
+        self.config.create_config()
+        self.config.add_option(option="test", type="TestType", help="A new help", default="new")
+        assert self.config.create_config() == "test = new\n# A new help"
+
+    def test_templates_are_reused(self):
+        self.config.create_config()
+        templates = self.config._templates
+        assert self.config.create_config({"test": "injected"}) == "test = injected\n# A test option"
+        assert self.config._templates is templates
@@ -0,0 +1,63 @@
+from type_config import TypeConfig
+
+
+class TestRevalidation:
+    config = TypeConfig()
+    casted = []
+
+    previous_config = {
+            "test": "value",
+            "test2": "value",
+            "test3": "",
+            "removed": "value"
+            }
+
+    new_config = {
+            "test": "value",
+            "test2": "other value",
+            "test3": "",
+            "added": "value"
+            }
+
+    def setup_class(self):
+        for option in ("test", "test2", "test3", "added", "removed"):
+            self.config.add_option(
+                    option=option,
+                    type="TestType",
+                    help="A test option",
+                    )
+        self.config.add_type(
+                type="TestType",
+                validate=lambda x: x == "value",
+                cast=lambda x: self.casted.append(x) or [x],
+                error="The test value was not 'value'"
+                )
+
+    def setup_method(self):
+        self.previous_validated, _ = self.config.validate_config(self.previous_config)
+        self.casted.clear()
+
+    def test_same_results_as_validate(self):
+        validated, errors, _ = self.config.revalidate(self.previous_config, self.previous_validated, self.new_config)
+        assert (validated, errors) == self.config.validate_config(self.new_config)
+
+    def test_changed_options(self):
+        _, _, changed_options = self.config.revalidate(self.previous_config, self.previous_validated, self.new_config)
+        assert changed_options == {"test2", "added", "removed"}
+
+    def test_only_changed_options_are_validated(self):
+        self.config.revalidate(self.previous_config, self.previous_validated, self.new_config)
+        # test2 isn't valid anymore, so only "added" is casted
+        assert self.casted == ["value"]
+
+    def test_previous_results_are_reused(self):
+        validated, _, _ = self.config.revalidate(self.previous_config, self.previous_validated, self.new_config)
+        assert validated["test"] is self.previous_validated["test"]
+
+    def test_nothing_changed(self):
+        assert self.config.revalidate(self.previous_config, self.previous_validated, self.previous_config) == (
+            self.previous_validated,
+            {"test3": "[test3]: can't be left empty."},
+            set(),
+        )
+        assert self.casted == []
@@ -0,0 +1,113 @@
+import pickle
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+from type_config import TypeConfig
+
+
+def is_value(value):
+    return value == "value"
+
+
+def to_upper(value):
+    return value.upper()
+
+
+def validate_in_worker(config, values):
+    return config.validate_config(values)
+
+
+class TestSnapshot:
+    config = TypeConfig(type_hint=True, cache_size=4)
+    values = {"test": "value", "test2": "wrong", "test3": ""}
+    file_content = "test = value\ntest2 = value\nbroken line\n"
+    registry = {}
+
+    def setup_class(self):
+        self.config.add_option(
+                option="test",
+                type="TestType",
+                help="A test option\nOn two lines",
+                important_help="Important",
+                )
+        self.config.add_option(
+                option="test2",
+                type="LambdaType",
+                help="A test option",
+                default="value",
+                )
+        self.config.add_option(
+                option="test3",
+                type="TestType",
+                help="A test option",
+                can_be_empty=True,
+                )
+        self.config.add_type(
+                type="TestType",
+                validate=is_value,
+                cast=to_upper,
+                error="The test value was not 'value'",
+                workload="cpu",
+                )
+        self.importable = self.config.get_types()
+        self.config.add_type(
+                type="LambdaType",
+                validate=lambda x: x == "value",
+                cast=lambda x: "Lambda passed",
+                error="The test value was not 'value'",
+                )
+        lambda_type = self.config.get_types()["LambdaType"]
+        self.registry = {"lambda.validate": lambda_type.validate, "lambda.cast": lambda_type.cast}
+
+    def assert_same(self, config):
+        assert config.get_options() == self.config.get_options()
+        assert config.get_types() == self.config.get_types()
+        assert config.type_hint == self.config.type_hint
+        assert config.create_config() == self.config.create_config()
+        assert config.validate_config(self.values) == self.config.validate_config(self.values)
+        assert config.parse_and_validate(self.file_content) == self.config.parse_and_validate(self.file_content)
+
+    def test_snapshot(self):
+        snapshot = self.config.snapshot(self.registry)
+        assert isinstance(snapshot, bytes)
+        loaded = TypeConfig.from_snapshot(snapshot, self.registry)
+        self.assert_same(loaded)
+        assert loaded.cache_info()["max_size"] == 4
+        assert loaded.get_options()["test"].comment == self.config.get_options()["test"].comment
+
+    def test_unnamed_function(self):
+        with pytest.raises(ValueError):
+            self.config.snapshot()
+        with pytest.raises(ValueError):
+            self.config.snapshot({"lambda.validate": self.registry["lambda.validate"]})
+
+    def test_missing_from_registry(self):
+        snapshot = self.config.snapshot(self.registry)
+        with pytest.raises(ValueError):
+            TypeConfig.from_snapshot(snapshot, {"lambda.cast": self.registry["lambda.cast"]})
+
+    def test_pickle(self):
+        config = TypeConfig()
+        config.add_option(option="test", type="TestType", help="A test option")
+        config.add_type(**self.importable["TestType"])
+        config.parse_and_validate("test = value")
+
+        loaded = pickle.loads(pickle.dumps(config))
+        assert loaded.get_options() == config.get_options()
+        assert loaded.validate_config({"test": "value"}) == ({"test": "VALUE"}, {})
+        assert loaded.cache_info()["size"] == 0
+
+        frozen = pickle.loads(pickle.dumps(config.freeze()))
+        assert frozen == config.freeze()
+        with pytest.raises(TypeError):
+            frozen.add_option(option="test2", type="TestType", help="A test option")
+
+    def test_process_pool(self):
+        config = TypeConfig()
+        config.add_option(option="test", type="TestType", help="A test option")
+        config.add_type(**self.importable["TestType"])
+
+        with ProcessPoolExecutor(1) as pool:
+            result = pool.submit(validate_in_worker, config, {"test": "value"}).result()
+        assert result == ({"test": "VALUE"}, {})
@@ -0,0 +1,69 @@
+import pickle
+
+import pytest
+
+from type_config import TypeConfig
+from type_config.specs import OptionSpec, TypeSpec
+
+
+class TestSpecs:
+    config = TypeConfig()
+
+    option_as_dict = {
+            "type": "TestType",
+            "option": "test",
+            "default": "default value",
+            "can_be_empty": False,
+            "important_help": "",
+            "help": "A {test} option",
+            "aliases": (),
+            }
+
+    def setup_class(self):
+        self.config.add_option(
+                option="test",
+                type="TestType",
+                help="A {test} option",
+                default="default value",
+                )
+        self.config.add_type(
+                type="TestType",
+                validate=lambda x: x == "value",
+                cast=lambda x: "Test passed",
+                error="The test value was not 'value'",
+                )
+
+    def test_records(self):
+        assert isinstance(self.config.get_options()["test"], OptionSpec)
+        assert isinstance(self.config.get_types()["TestType"], TypeSpec)
+
+    def test_dict_view(self):
+        option = self.config.get_options()["test"]
+        assert option == self.option_as_dict
+        assert dict(option) == self.option_as_dict
+        assert option["default"] == option.default == "default value"
+        assert self.config.get_types()["TestType"]["error"] == "The test value was not 'value'"
+
+    def test_read_only(self):
+        option = self.config.get_options()["test"]
+        with pytest.raises(AttributeError):
+            option.default = "other value"
+        with pytest.raises(TypeError):
+            option["default"] = "other value"
+
+    def test_no_dict(self):
+        assert not hasattr(self.config.get_options()["test"], "__dict__")
+
+    def test_replace(self):
+        option = self.config.get_options()["test"]
+        assert option.replace(default="other value")["default"] == "other value"
+        assert option.default == "default value"
+
+    def test_pickle(self):
+        option = self.config.get_options()["test"]
+        assert pickle.loads(pickle.dumps(option)) == option
+
+    def test_heal_keeps_defaults(self):
+        assert self.config.heal_config("test = a value") == "test = a value\n# A {test} option"
+        assert self.config.get_options()["test"].default == "default value"
+        assert self.config.create_config() == "test = default value\n# A {test} option"
@@ -0,0 +1,53 @@
+import io
+
+from type_config import TypeConfig
+
+
+class TestStreamingParse:
+    config = TypeConfig()
+
+    file_content = (
+        "# A comment\n"
+        "\n"
+        "[TestType] test = value # inline comment\n"
+        "test2 = \n"
+        "test | broken\n"
+        "   # Another comment\n"
+    )
+
+    result = ({"test": "value", "test2": ""}, {"test | broken": "A broken line has been found."})
+
+    def test_string(self):
+        assert self.config.parse_config(self.file_content) == self.result
+
+    def test_bytes(self):
+        assert self.config.parse_config(self.file_content.encode()) == self.result
+
+    def test_text_file(self):
+        assert self.config.parse_config(io.StringIO(self.file_content)) == self.result
+
+    def test_binary_file(self):
+        assert self.config.parse_config(io.BytesIO(self.file_content.encode())) == self.result
+
+    def test_line_iterator(self):
+        lines = iter(self.file_content.splitlines())
+        assert self.config.parse_config(lines) == self.result
+
+    def test_windows_line_endings(self):
+        file_content = self.file_content.replace("\n", "\r\n").encode()
+        assert self.config.parse_config(io.BytesIO(file_content)) == self.result
+
+    def test_events(self):
+        assert list(self.config.parse_config_iter(self.file_content)) == [
+            ("option", "test", "value"),
+            ("option", "test2", ""),
+            ("error", "test | broken", "A broken line has been found."),
+        ]
+
+    def test_events_are_lazy(self):
+        def lines():
+            yield "test = value"
+            raise AssertionError("The whole source was read")
+
+        events = self.config.parse_config_iter(lines())
+        assert next(events) == ("option", "test", "value")
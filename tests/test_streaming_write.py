@@ -0,0 +1,62 @@
+import io
+
+from type_config import TypeConfig
+
+
+class TestStreamingWrite:
+    config = TypeConfig()
+
+    broken_config = """
+    test2 = something
+    test = a = b
+    """
+
+    def setup_class(self):
+        self.config.add_option(
+                option="test",
+                type="TestType",
+                help="A test option\nOn two lines",
+                default="value",
+                important_help="The test must pass"
+                )
+        self.config.add_option(
+                option="test2",
+                type="TestType",
+                help="A test option",
+                )
+        self.config.add_option(
+                option="test3",
+                type="TestType",
+                help="",
+                )
+
+    def test_chunks(self):
+        chunks = list(self.config.iter_config_chunks({"test2": "injected"}))
+        assert len(chunks) == 3
+        assert "".join(chunks) == self.config.create_config({"test2": "injected"})
+
+    def test_write_text(self):
+        file = io.StringIO()
+        self.config.write_config(file, {"test2": "injected"})
+        assert file.getvalue() == self.config.create_config({"test2": "injected"})
+
+    def test_write_binary(self):
+        file = io.BytesIO()
+        self.config.write_config(file)
+        assert file.getvalue() == self.config.create_config().encode("utf-8")
+
+    def test_write_with_types(self):
+        self.config.type_hint = True
+        file = io.StringIO()
+        self.config.write_config(file)
+        assert file.getvalue() == self.config.create_config()
+        self.config.type_hint = False
+
+    def test_heal_to(self):
+        file = io.StringIO()
+        self.config.heal_config_to(file, self.broken_config)
+        assert file.getvalue() == self.config.heal_config(self.broken_config)
+        assert "".join(self.config.iter_healed_chunks(self.broken_config)) == file.getvalue()
+
+    def test_empty_help(self):
+        assert self.config.create_config().endswith("\n\ntest3 = \n")
@@ -0,0 +1,168 @@
+import asyncio
+import datetime
+import enum
+import pickle
+
+import pytest
+
+import type_config.errors as er
+from type_config import TypeConfig, types
+
+
+class Color(enum.Enum):
+    RED = 1
+    BLUE = 2
+
+
+def parse_even(value):
+    number = int(value)
+    if number % 2:
+        raise ValueError("odd number")
+    return number
+
+
+class TestBuiltinTypes:
+    config = TypeConfig()
+
+    option_types = {
+            "port": types.integer(minimum=1, maximum=65535),
+            "ratio": types.floating(minimum=0, maximum=1),
+            "flag": types.boolean(),
+            "mode": types.choice(["fast", "slow"]),
+            "color": types.choice(Color, case_sensitive=False),
+            "numbers": types.list_of(types.integer(), min_length=2, max_length=3),
+            "timeout": types.duration(),
+            "limit": types.size(),
+            "folder": types.path(kind="directory"),
+            "even": {"parse": parse_even, "error": ""},
+            }
+
+    def setup_class(self):
+        for option, arguments in self.option_types.items():
+            self.config.add_option(
+                    option=option,
+                    type=option.capitalize(),
+                    help="A test option",
+                    )
+            self.config.add_type(type=option.capitalize(), **arguments)
+
+    def test_valid(self, tmp_path):
+        validated, errors = self.config.validate_config({
+            "port": "8080",
+            "ratio": "0.5",
+            "flag": "Yes",
+            "mode": "slow",
+            "color": "blue",
+            "numbers": "1, 2, 3",
+            "timeout": "1h 30m",
+            "limit": "1.5 KiB",
+            "folder": str(tmp_path),
+            "even": "4",
+            })
+        assert errors == {}
+        assert validated == {
+            "port": 8080,
+            "ratio": 0.5,
+            "flag": True,
+            "mode": "slow",
+            "color": Color.BLUE,
+            "numbers": [1, 2, 3],
+            "timeout": datetime.timedelta(hours=1, minutes=30),
+            "limit": 1536,
+            "folder": tmp_path,
+            "even": 4,
+            }
+
+    @pytest.mark.parametrize("option, value", [
+        ("port", "0"),
+        ("port", "80.5"),
+        ("ratio", "nan"),
+        ("flag", "maybe"),
+        ("mode", "Slow"),
+        ("color", "green"),
+        ("numbers", "1"),
+        ("numbers", "1, 2, 3, 4"),
+        ("numbers", "1, two"),
+        ("timeout", "5 minutes"),
+        ("timeout", "1000000000d"),
+        ("timeout", "9" * 400 + "s"),
+        ("timeout", "9" * 400),
+        ("limit", "10 XB"),
+        ("limit", "9" * 400),
+        ("limit", "9" * 400 + "KB"),
+        ("folder", "/not/a/folder"),
+        ])
+    def test_invalid(self, option, value):
+        validated, errors = self.config.validate_config({option: value})
+        assert validated == {}
+        assert errors == {option: f"[{option}]: {self.option_types[option]['error']} (value: {value})"}
+
+    def test_parse_error_message(self):
+        # Without an error, the exception's message is used
+        _, errors = self.config.validate_config({"even": "3"})
+        assert errors == {"even": "[even]: odd number (value: 3)"}
+
+    @pytest.mark.parametrize("value, expected", [
+        ("90", datetime.timedelta(seconds=90)),
+        ("500ms", datetime.timedelta(milliseconds=500)),
+        ("2d 1s", datetime.timedelta(days=2, seconds=1)),
+        ("1W", datetime.timedelta(weeks=1)),
+        ])
+    def test_duration(self, value, expected):
+        assert types.parse_duration(value) == expected
+
+    @pytest.mark.parametrize("value, expected", [
+        ("512", 512),
+        ("10KB", 10_000),
+        ("2 mib", 2 * 1024**2),
+        ("1G", 1000**3),
+        ])
+    def test_size(self, value, expected):
+        assert types.parse_size(value) == expected
+
+    def test_empty(self):
+        config = TypeConfig()
+        config.add_option(option="test", type="Integer", help="A test option", can_be_empty=True)
+        config.add_option(option="test2", type="Integer", help="A test option", default="3")
+        config.add_option(option="test3", type="Integer", help="A test option")
+        config.add_type(type="Integer", **types.integer())
+        assert config.validate_config({"test": "", "test2": "", "test3": ""}) == (
+            {"test": None, "test2": 3},
+            {"test3": "[test3]: can't be left empty."},
+            )
+
+    def test_same_results_everywhere(self):
+        values = {"port": "80", "numbers": "1, x", "flag": "no", "ayyy": "1"}
+        expected = self.config.validate_config(values)
+        assert self.config.validate_many([values]) == [expected]
+        assert asyncio.run(self.config.avalidate_config(values)) == expected
+        assert self.config.validate_config_parallel(values) == expected
+        assert self.config._validate_option("port", "80") == 80
+        with pytest.raises(er.ValidationError):
+            self.config._validate_option("port", "x")
+
+    def test_picklable(self):
+        config = pickle.loads(pickle.dumps(self.config))
+        values = {"port": "80", "color": "RED", "limit": "1k"}
+        assert config.validate_config(values) == self.config.validate_config(values)
+
+    def test_asynchronous_parse(self):
+        async def parse(value):
+            return int(value)
+
+        config = TypeConfig()
+        config.add_option(option="test", type="AsyncInteger", help="A test option")
+        config.add_type(type="AsyncInteger", parse=parse, error="Not an integer")
+        assert asyncio.run(config.avalidate_config({"test": "1"})) == ({"test": 1}, {})
+        assert asyncio.run(config.avalidate_config({"test": "x"})) == (
+            {}, {"test": "[test]: Not an integer (value: x)"}
+            )
+
+    def test_wrong_arguments(self):
+        config = TypeConfig()
+        with pytest.raises(ValueError):
+            config.add_type(type="Test", validate=bool, error="")
+        with pytest.raises(ValueError):
+            config.add_type(type="Test", parse=int, validate=bool, cast=int)
+        with pytest.raises(ValueError):
+            types.path(kind="socket")
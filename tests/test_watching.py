@@ -0,0 +1,151 @@
+import asyncio
+import os
+import sys
+import time
+
+import pytest
+
+from type_config import TypeConfig
+
+
+def wait_for(condition, timeout=5.0):
+    end = time.monotonic() + timeout
+    while not condition():
+        if time.monotonic() > end:
+            return False
+        time.sleep(0.01)
+    return True
+
+
+def replace_file(path, content):
+    # Like most editors: write another file and rename it
+    temporary = f"{path}.tmp"
+    with open(temporary, "w") as file:
+        file.write(content)
+    os.replace(temporary, path)
+
+
+class TestWatcher:
+    config = TypeConfig()
+    parsed = []
+
+    def setup_class(self):
+        self.config.add_option(
+                option="test",
+                type="Integer",
+                help="A test option",
+                )
+        self.config.add_option(
+                option="test2",
+                type="Integer",
+                help="A test option",
+                )
+        self.config.add_type(
+                type="Integer",
+                parse=lambda value: self.parsed.append(value) or int(value),
+                )
+
+    def setup_method(self):
+        self.parsed.clear()
+        self.events = []
+
+    def make_watcher(self, tmp_path, content="test = 1\ntest2 = 2\n", **options):
+        path = tmp_path / "config.txt"
+        path.write_text(content)
+        watcher = self.config.watch(path, **options)
+        watcher.subscribe(lambda *event: self.events.append(event))
+        return path, watcher
+
+    def test_initial_load(self, tmp_path):
+        _, watcher = self.make_watcher(tmp_path)
+        assert watcher.snapshot == ({"test": 1, "test2": 2}, {})
+        assert watcher.values == {"test": 1, "test2": 2}
+        assert watcher.errors == {}
+        with pytest.raises(FileNotFoundError):
+            self.config.watch(tmp_path / "missing.txt")
+
+    def test_unchanged(self, tmp_path):
+        path, watcher = self.make_watcher(tmp_path)
+        self.parsed.clear()
+        assert not watcher.check()
+        # Written again with the same content
+        replace_file(path, "test = 1\ntest2 = 2\n")
+        assert not watcher.check()
+        assert self.parsed == []
+        assert self.events == []
+
+    def test_only_changed_options(self, tmp_path):
+        path, watcher = self.make_watcher(tmp_path)
+        self.parsed.clear()
+        replace_file(path, "test = 1\ntest2 = 3\n")
+        assert watcher.check()
+        assert self.parsed == ["3"]
+        assert self.events == [({"test2"}, {"test": 1, "test2": 3}, {})]
+
+    def test_errors(self, tmp_path):
+        path, watcher = self.make_watcher(tmp_path)
+        replace_file(path, "test = one\nbroken line\n")
+        assert watcher.check()
+        values, errors = watcher.snapshot
+        assert values == {}
+        assert set(errors) == {"test", "broken line"}
+        assert self.events == [({"test", "test2"}, values, errors)]
+
+    def test_snapshot_replaced(self, tmp_path):
+        path, watcher = self.make_watcher(tmp_path)
+        previous = watcher.snapshot
+        replace_file(path, "test = 5\n")
+        watcher.check()
+        assert previous == ({"test": 1, "test2": 2}, {})
+        with pytest.raises(TypeError):
+            watcher.values["test"] = 6
+
+    @pytest.mark.parametrize("use_inotify", [
+        False,
+        pytest.param(True, marks=pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify")),
+        ])
+    def test_background(self, tmp_path, use_inotify):
+        path, watcher = self.make_watcher(tmp_path, interval=0.05, debounce=0.05, use_inotify=use_inotify)
+        with watcher:
+            replace_file(path, "test = 1\ntest2 = 4\n")
+            assert wait_for(lambda: watcher.values.get("test2") == 4)
+        assert self.events == [({"test2"}, {"test": 1, "test2": 4}, {})]
+
+    def test_debounce(self, tmp_path):
+        path, watcher = self.make_watcher(tmp_path, interval=0.02, debounce=0.3)
+        with watcher:
+            for value in range(5, 10):
+                with open(path, "w") as file:
+                    file.write(f"test = {value}\n")
+                time.sleep(0.03)
+            assert wait_for(lambda: watcher.values.get("test") == 9)
+        assert len(self.events) == 1
+
+    def test_exception_in_background(self, tmp_path):
+        config = TypeConfig()
+        config.add_option(option="test", type="Fragile", help="A test option")
+        config.add_type(type="Fragile", parse=lambda value: 1 / int(value))
+        path = tmp_path / "config.txt"
+        path.write_text("test = 1")
+        with config.watch(path, interval=0.02, debounce=0.02, use_inotify=False) as watcher:
+            replace_file(path, "test = 0")
+            assert wait_for(lambda: watcher.last_exception is not None)
+            replace_file(path, "test = 2")
+            assert wait_for(lambda: watcher.values == {"test": 0.5})
+
+    def test_asyncio(self, tmp_path):
+        path, watcher = self.make_watcher(tmp_path, interval=0.02, debounce=0.02)
+
+        async def main():
+            task = asyncio.create_task(watcher.watch_async())
+            await asyncio.sleep(0.05)
+            replace_file(path, "test = 7\ntest2 = 2\n")
+            for _ in range(200):
+                if watcher.values.get("test") == 7:
+                    break
+                await asyncio.sleep(0.01)
+            watcher.stop()
+            await asyncio.wait_for(task, 1)
+
+        asyncio.run(main())
+        assert self.events == [({"test"}, {"test": 7, "test2": 2}, {})]